@@ -1,12 +1,21 @@
-"""API 라우트 — /run/preview, /run/submit."""
+"""API 라우트 — /run/preview, /run/submit, /run/submit/stream, /run/jobs."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
+from app.core.cancellation import RequestCancelled, run_cancellable
+from app.core.config import SUBMIT_DISCONNECT_POLL_SEC
+from app.core.errors import ClientClosedRequestError, JobNotFoundError
+from app.pipeline import admission
+from app.pipeline.jobs import cancel_job, enqueue_submit, get_job
 from app.pipeline.preview import run_preview
+from app.pipeline.stream import MEDIA_TYPES, StreamFormat, stream_submit
 from app.pipeline.submit import run_submit
 from app.schemas.run import (
+    JobResponse,
     PreviewRequest,
     PreviewResponse,
     SubmitRequest,
@@ -18,11 +27,68 @@ router = APIRouter(prefix="/run", tags=["run"])
 
 @router.post("/preview", response_model=PreviewResponse)
 async def preview(req: PreviewRequest) -> PreviewResponse:
-    """파일이 업로드될 때마다 슬롯 추정 + 필수 항목 현황판 반환."""
-    return await run_preview(req)
+    """파일이 업로드될 때마다 슬롯 추정 + 필수 항목 현황판 반환. 포화 시 429 (submit보다 우선)."""
+    async with admission.admit("preview", req.added_files):
+        return await run_preview(req)
 
 
 @router.post("/submit", response_model=SubmitResponse)
-async def submit(req: SubmitRequest) -> SubmitResponse:
-    """전체 파일 검증 — 다운로드 → 추출 → 룰 검증 → 최종 판정."""
-    return await run_submit(req)
+async def submit(
+    req: SubmitRequest,
+    request: Request,
+    force: bool = Query(False, description="저장된 같은 요청의 결과를 무시하고 다시 계산"),
+) -> SubmitResponse:
+    """전체 파일 검증 — 다운로드 → 추출 → 룰 검증 → 최종 판정. 같은 요청의 저장된 결과가 있으면 바로 반환.
+    클라이언트 연결이 끊기면 진행 중인 다운로드/OCR/LLM을 취소한다. 포화 시 429 + Retry-After."""
+    async with admission.admit("submit", req.files):
+        try:
+            return await run_cancellable(
+                run_submit(req, force=force), request.is_disconnected,
+                reason="disconnect", poll_sec=SUBMIT_DISCONNECT_POLL_SEC,
+            )
+        except RequestCancelled:
+            raise ClientClosedRequestError()
+
+
+@router.post("/submit/stream")
+async def submit_stream(
+    req: SubmitRequest,
+    format: StreamFormat = Query("sse", description="sse | ndjson"),
+    force: bool = Query(False, description="저장된 같은 요청의 결과를 무시하고 다시 계산"),
+) -> StreamingResponse:
+    """submit 진행 상황 스트림 — 단계/파일/슬롯 완료 시점마다 이벤트, 마지막에 final(SubmitResponse)."""
+    # 입장은 스트림 시작 전에 결정 (포화 시 429). 스트림이 끝나거나 끊기면 반납
+    ticket = await admission.acquire("submit", req.files)
+    return StreamingResponse(
+        stream_submit(req, format, on_close=ticket.release, force=force),
+        media_type=MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(ticket.release),
+    )
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(req: SubmitRequest) -> JobResponse:
+    """비동기 submit — job_id 즉시 반환. 같은 package_id + 파일셋이면 기존 job 반환."""
+    return await enqueue_submit(req)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def job_status(
+    job_id: str,
+    wait: float = Query(0.0, ge=0, description="완료까지 최대 대기 초 (long-poll)"),
+) -> JobResponse:
+    """job 상태/결과 조회. wait>0이면 DONE/FAILED까지 long-poll."""
+    job = await get_job(job_id, wait=wait)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return job
+
+
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+async def job_cancel(job_id: str) -> JobResponse:
+    """job 취소 — QUEUED/RUNNING이면 CANCELLED로 바꾸고 실행 중인 작업을 중단. 끝난 job은 그대로 반환."""
+    job = await cancel_job(job_id)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return job
@@ -0,0 +1,164 @@
+"""요청 취소 — 클라이언트 연결 종료 / job 취소 시 진행 중인 작업을 모두 멈춘다.
+
+- run_cancellable(): 작업 코루틴을 CancelScope 안의 태스크로 실행하고, watch()가 True를 반환하면
+  (클라이언트 disconnect, job CANCELLED) 태스크를 취소한다. asyncio 취소는 다운로드/OCR/LLM 등
+  await 중인 하위 태스크로 그대로 전파된다.
+- 스레드(asyncio.to_thread) 작업은 취소되지 않으므로 긴 루프에서 check()로 중단 지점을 둔다.
+  to_thread는 contextvar를 복사하므로 스레드에서도 같은 scope를 본다.
+- temp_file(): scope에 등록되는 임시 파일. 정상 종료 시 바로 지우고, 취소로 남은 파일은 scope 종료 시 정리.
+- 취소된 요청/작업 수는 메트릭으로 남긴다 (ai_run_cancelled_requests_total, ai_run_cancelled_work_total).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Coroutine, Iterator, TypeVar
+
+from app.core import metrics
+
+T = TypeVar("T")
+
+_CANCELLED_REQUESTS = metrics.counter(
+    "ai_run_cancelled_requests_total", "Requests cancelled before completion by reason"
+)
+_CANCELLED_WORK = metrics.counter(
+    "ai_run_cancelled_work_total", "In-flight work items stopped by request cancellation (kind=download|analyzer|llm|executor)"
+)
+
+
+class RequestCancelled(Exception):
+    """요청이 취소됨 — check() 중단 지점, run_cancellable()의 watch 감지."""
+
+
+class CancelScope:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason: str | None = None
+        self._temp_paths: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str, *, count: bool = True) -> None:
+        """count=False: 요청이 아닌 내부 작업 scope (core/singleflight.py) — 요청 취소 메트릭에서 제외."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+            if count:
+                _CANCELLED_REQUESTS.inc(reason=reason)
+
+    def track(self, path: str) -> None:
+        with self._lock:
+            self._temp_paths.add(path)
+
+    def release(self, path: str) -> None:
+        with self._lock:
+            self._temp_paths.discard(path)
+        _unlink(path)
+
+    def cleanup(self) -> None:
+        with self._lock:
+            paths, self._temp_paths = self._temp_paths, set()
+        for p in paths:
+            _unlink(p)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+_current: ContextVar[CancelScope | None] = ContextVar("cancel_scope", default=None)
+
+
+def current() -> CancelScope | None:
+    return _current.get()
+
+
+def cancelled() -> bool:
+    scope = _current.get()
+    return scope is not None and scope.cancelled
+
+
+def check(name: str = "") -> None:
+    """스레드 작업의 중단 지점. 요청이 취소됐으면 RequestCancelled."""
+    scope = _current.get()
+    if scope is not None and scope.cancelled:
+        _CANCELLED_WORK.inc(kind="executor", name=name)
+        raise RequestCancelled(scope.reason or "cancelled")
+
+
+def record_cancelled(kind: str, name: str = "") -> None:
+    """asyncio 취소(CancelledError)를 받은 작업 기록 — 요청 취소 때문일 때만 센다
+    (헤징 패자, 데드라인 타임아웃 등 내부 취소는 제외)."""
+    if cancelled():
+        _CANCELLED_WORK.inc(kind=kind, name=name)
+
+
+@contextmanager
+def temp_file(suffix: str = "") -> Iterator[str]:
+    """scope에 등록되는 임시 파일 경로. 블록을 벗어나면 삭제."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    scope = _current.get()
+    if scope is not None:
+        scope.track(path)
+    try:
+        yield path
+    finally:
+        if scope is not None:
+            scope.release(path)
+        else:
+            _unlink(path)
+
+
+async def scoped(scope: CancelScope, coro: Awaitable[T]) -> T:
+    """coro를 scope 안에서 실행 (태스크로 감싸 쓴다)."""
+    token = _current.set(scope)
+    try:
+        return await coro
+    finally:
+        _current.reset(token)
+
+
+async def run_cancellable(
+    coro: Coroutine[object, object, T],
+    watch: Callable[[], Awaitable[bool]] | None = None,
+    *,
+    reason: str,
+    poll_sec: float = 0.5,
+) -> T:
+    """coro를 CancelScope 안에서 실행. poll_sec마다 watch()를 확인해 True면 취소하고 RequestCancelled.
+    바깥에서 취소돼도(스트림 종료, 서버 종료) 같은 reason으로 scope를 취소한다. 남은 임시 파일은 정리."""
+    scope = CancelScope()
+    # scope가 설정된 태스크 — 하위 태스크/스레드에 전파
+    task = asyncio.create_task(scoped(scope, coro))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_sec if watch is not None else None)
+            if done:
+                return task.result()
+            try:
+                gone = await watch()
+            except Exception:
+                gone = False
+            if gone:
+                scope.cancel(reason)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise RequestCancelled(reason)
+    finally:
+        if not task.done():
+            scope.cancel(reason)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        scope.cleanup()
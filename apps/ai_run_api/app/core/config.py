@@ -10,6 +10,146 @@ CLOVA_OCR_SECRET: str = os.getenv("CLOVA_OCR_SECRET", "")
 OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL_LIGHT: str = os.getenv("OPENAI_MODEL_LIGHT", "gpt-4o-mini")
 OPENAI_MODEL_HEAVY: str = os.getenv("OPENAI_MODEL_HEAVY", "gpt-5.1")
+# heavy 모델 대체 경로 (llm/routing.py) — 비워 두면 대체 없음. base URL을 주면 다른 엔드포인트로 보낸다
+OPENAI_MODEL_HEAVY_FALLBACK: str = os.getenv("OPENAI_MODEL_HEAVY_FALLBACK", "")
+OPENAI_FALLBACK_BASE_URL: str = os.getenv("OPENAI_FALLBACK_BASE_URL", "")
+OPENAI_FALLBACK_API_KEY: str = os.getenv("OPENAI_FALLBACK_API_KEY", OPENAI_API_KEY)
 
 FILE_FETCH_TIMEOUT: int = 30
 MAX_PARALLEL_WORKERS: int = 10
+
+# ZIP 패키지 (storage/zip_ingest.py) — 중앙 디렉터리만 읽고, 항목은 필요할 때만 압축 해제
+ZIP_MAX_ENTRIES: int = int(os.getenv("ZIP_MAX_ENTRIES", "1000"))
+ZIP_MAX_ENTRY_BYTES: int = int(os.getenv("ZIP_MAX_ENTRY_BYTES", str(100 * 1024 * 1024)))
+ZIP_MAX_TOTAL_BYTES: int = int(os.getenv("ZIP_MAX_TOTAL_BYTES", str(1024 * 1024 * 1024)))
+# 항목별 압축 해제 크기 / 압축 크기 상한 (zip bomb)
+ZIP_MAX_RATIO: float = float(os.getenv("ZIP_MAX_RATIO", "100"))
+# Range 요청을 지원하지 않는 저장소에서 아카이브 전체를 받을 때의 상한
+ZIP_MAX_ARCHIVE_BYTES: int = int(os.getenv("ZIP_MAX_ARCHIVE_BYTES", str(512 * 1024 * 1024)))
+ZIP_RANGE_BLOCK_BYTES: int = 256 * 1024   # Range 요청 단위 (작은 읽기를 묶는다)
+ZIP_OPEN_ARCHIVES: int = 8                # 열어 둔 아카이브 수 (중앙 디렉터리 재사용)
+
+# 내용 판별 (pipeline/sniff.py) — 앞/끝 몇 KB만 읽어 실제 형식·손상 여부를 다운로드 전에 확인
+SNIFF_ENABLED: bool = os.getenv("SNIFF_ENABLED", "true").lower() in ("1", "true", "yes")
+SNIFF_HEAD_BYTES: int = int(os.getenv("SNIFF_HEAD_BYTES", str(16 * 1024)))
+SNIFF_TIMEOUT_SEC: float = 5.0            # 파일 1개 판별 최대 시간 (넘으면 확장자 기준)
+
+# preview 내용 기반 슬롯 추정 (engines/content_matcher.py) — 파일명 매칭 실패 시 LLM 전에 시도
+CONTENT_MATCH_ENABLED: bool = os.getenv("CONTENT_MATCH_ENABLED", "true").lower() in ("1", "true", "yes")
+CONTENT_MATCH_MIN_SCORE: float = float(os.getenv("CONTENT_MATCH_MIN_SCORE", "0.3"))
+CONTENT_MATCH_MAX_BYTES: int = 20 * 1024 * 1024   # 이보다 큰 PDF/XLSX는 내용 서명을 읽지 않는다
+CONTENT_MATCH_TIMEOUT_SEC: float = 10.0
+
+# 파일 단위 분석기별 타임아웃(초) — pipeline/analyzers.py
+ANALYZER_TIMEOUTS: dict[str, float] = {
+    "pdf_layer": 30.0,
+    "pdf_ocr": 30.0,
+    "pdf_llm": 60.0,
+    "image_ocr": 30.0,
+    "image_vision": 90.0,
+    "image_yolo": 30.0,
+    "xlsx_table": 30.0,
+    "xlsx_llm": 60.0,
+}
+
+# 문서/표 LLM 입력 토큰 예산 — 관련도 순으로 선별해 담는다 (llm/context_packer.py)
+LLM_INPUT_TOKEN_BUDGET: dict[str, int] = {
+    "pdf_llm": int(os.getenv("LLM_PDF_INPUT_TOKENS", "2000")),
+    "xlsx_llm": int(os.getenv("LLM_XLSX_INPUT_TOKENS", "1500")),
+}
+
+# 작은 문서 light LLM 보강 일괄 요청 (llm/batcher.py)
+LLM_BATCH_ENABLED: bool = os.getenv("LLM_BATCH_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_BATCH_MAX_DOCS: int = int(os.getenv("LLM_BATCH_MAX_DOCS", "6"))
+LLM_BATCH_MAX_INPUT_TOKENS: int = int(os.getenv("LLM_BATCH_MAX_INPUT_TOKENS", "6000"))
+LLM_BATCH_DOC_MAX_TOKENS: int = 800      # 이보다 큰 문서는 개별 호출
+LLM_BATCH_LINGER_SEC: float = 0.3        # 첫 문서 이후 다른 문서를 기다리는 시간
+# 같은 슬롯 사진 Vision 일괄 요청 (1이면 사진마다 개별 호출)
+VISION_BATCH_MAX_IMAGES: int = int(os.getenv("VISION_BATCH_MAX_IMAGES", "4"))
+VISION_BATCH_MAX_SIDE_PX: int = int(os.getenv("VISION_BATCH_MAX_SIDE_PX", "1024"))  # 일괄 요청 시 긴 변 축소
+
+# LLM JSON 응답 형식 (llm/schemas.py): strict = json_schema structured output, json = JSON 모드, off = 프롬프트 지시만
+LLM_STRUCTURED_OUTPUT: str = os.getenv("LLM_STRUCTURED_OUTPUT", "strict").lower()
+
+# heavy 모델 지연 꼬리 대응 (llm/routing.py) — 모델별 최근 지연 분포로 임계값을 정한다
+LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))  # 이 지연을 넘으면 중복 요청
+LLM_HEDGE_MIN_DELAY_SEC: float = 1.0
+LLM_HEDGE_DEFAULT_DELAY_SEC: float = 20.0  # 표본이 모이기 전 기본 지연
+LLM_LATENCY_WINDOW: int = 200              # 모델별로 기억하는 최근 호출 수
+LLM_LATENCY_MIN_SAMPLES: int = 20
+# 최근 오류율 / p95 지연이 이 값을 넘으면 대체 모델로 보낸다
+LLM_FALLBACK_ERROR_RATE: float = float(os.getenv("LLM_FALLBACK_ERROR_RATE", "0.3"))
+LLM_FALLBACK_LATENCY_SEC: float = float(os.getenv("LLM_FALLBACK_LATENCY_SEC", "60"))
+LLM_FALLBACK_COOLDOWN_SEC: float = 60.0  # 대체 모델 우선 유지 시간
+
+# 룰 결과로 결론이 정해진 경우 LLM 호출 생략 (pipeline/llm_policy.py)
+LLM_SKIP_POLICY_ENABLED: bool = os.getenv("LLM_SKIP_POLICY_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 로컬 SQLite 저장소 (비동기 job 큐 등) — 여러 uvicorn 워커가 같은 파일을 공유
+AI_RUN_DB_PATH: str = os.getenv(
+    "AI_RUN_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "db", "ai_run.sqlite3"),
+)
+
+# preview 패키지 상태 저장소 (storage/package_store.py)
+# memory: 프로세스 내 LRU+TTL (워커 1개), sqlite: AI_RUN_DB_PATH를 여러 워커가 공유
+PACKAGE_STORE_BACKEND: str = os.getenv("PACKAGE_STORE_BACKEND", "memory")
+PACKAGE_STORE_TTL_SEC: float = float(os.getenv("PACKAGE_STORE_TTL_SEC", "86400"))
+PACKAGE_STORE_MAX_PACKAGES: int = int(os.getenv("PACKAGE_STORE_MAX_PACKAGES", "10000"))
+
+# 비동기 submit job 워커 — pipeline/jobs.py
+JOB_WORKER_COUNT: int = int(os.getenv("JOB_WORKER_COUNT", "2"))
+JOB_DEADLINE_SEC: float = float(os.getenv("JOB_DEADLINE_SEC", "600"))
+# 같은 요청으로 다시 적재할 때 완료(DONE) job을 그대로 돌려주는 기간
+JOB_REUSE_TTL_SEC: float = float(os.getenv("JOB_REUSE_TTL_SEC", "3600"))
+JOB_POLL_INTERVAL_SEC: float = 1.0
+JOB_LONG_POLL_MAX_SEC: float = 30.0
+
+# 입장 제어 (pipeline/admission.py) — 프로세스당 동시 처리량을 작업 단위(파일 수 × 타입 가중치)로 제한
+ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "true").lower() in ("1", "true", "yes")
+ADMISSION_CAPACITY_UNITS: float = float(os.getenv("ADMISSION_CAPACITY_UNITS", "60"))
+ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "32"))
+ADMISSION_QUEUE_TIMEOUT_SEC: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SEC", "5"))
+# submit 파일 1개당 작업 단위 (이미지: OCR + Vision + YOLO)
+ADMISSION_FILE_WEIGHTS: dict[str, float] = {"pdf": 3.0, "xlsx": 2.0, "image": 4.0}
+ADMISSION_PREVIEW_FILE_WEIGHT: float = 0.2   # preview는 파일명 매칭 위주
+
+# /run/submit 클라이언트 연결 종료 확인 주기 — 끊기면 진행 중인 작업 취소 (core/cancellation.py)
+SUBMIT_DISCONNECT_POLL_SEC: float = 0.5
+
+# 증분 재제출 — 같은 package_id의 이전 추출/판정 결과 재사용 (pipeline/incremental.py)
+INCREMENTAL_SUBMIT_ENABLED: bool = os.getenv("INCREMENTAL_SUBMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 중복/유사 파일 (pipeline/duplicates.py) — 같은 submit 안은 분석 공유, 다른 패키지와는 재사용 표시
+DUPLICATE_DETECTION_ENABLED: bool = os.getenv("DUPLICATE_DETECTION_ENABLED", "true").lower() in ("1", "true", "yes")
+PHASH_MAX_DISTANCE: int = int(os.getenv("PHASH_MAX_DISTANCE", "6"))            # 64bit 중 다른 비트 수
+TEXT_DUP_MIN_JACCARD: float = float(os.getenv("TEXT_DUP_MIN_JACCARD", "0.8"))  # 문서 5글자 shingle 유사도
+DUPLICATE_INDEX_RETENTION_DAYS: float = float(os.getenv("DUPLICATE_INDEX_RETENTION_DAYS", "180"))
+
+# 도메인 검증 (pipeline/validation.py) — 작업 스레드에서 실행, 이 시간 이상 걸린 검증은 로그
+VALIDATOR_SLOW_LOG_SEC: float = float(os.getenv("VALIDATOR_SLOW_LOG_SEC", "1.0"))
+
+# 같은 submit 요청의 결과 재사용 (pipeline/result_cache.py) — 룰/프롬프트 코드가 바뀌면 자동 무효
+RESULT_STORE_ENABLED: bool = os.getenv("RESULT_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESULT_STORE_TTL_SEC: float = float(os.getenv("RESULT_STORE_TTL_SEC", "3600"))
+# 사용 전 파일을 다시 내려받아 저장 당시 sha256과 비교 (같은 경로에 파일을 덮어쓰는 저장소용)
+RESULT_STORE_VERIFY_CONTENT: bool = os.getenv("RESULT_STORE_VERIFY_CONTENT", "false").lower() in ("1", "true", "yes")
+
+# Submit 요청 단위 데드라인(초) — 도메인별 (pipeline/deadline.py)
+# 환경변수 SUBMIT_DEADLINE_SEC_SAFETY / _COMPLIANCE / _ESG 로 변경
+SUBMIT_DEADLINE_SEC: dict[str, float] = {
+    domain: float(os.getenv(f"SUBMIT_DEADLINE_SEC_{domain.upper()}", default))
+    for domain, default in (("safety", "120"), ("compliance", "120"), ("esg", "180"))
+}
+# 단계별 예산 — 데드라인 대비 누적 비율 (이 시점까지 끝나야 함)
+#   enrich  : 선택 보강(Vision / light LLM). 초과 시 생략하고 DEGRADED 표시
+#   extract : 다운로드/파싱/OCR. 초과 시 해당 파일 PARSE_FAILED/OCR_FAILED
+#   clarify : 보완요청 문장 LLM 다듬기. 초과 시 기본 템플릿
+#   judge   : 최종 why 생성(heavy LLM). 초과 시 기본 문장
+SUBMIT_STAGE_BUDGETS: dict[str, float] = {
+    "enrich": 0.6,
+    "extract": 0.75,
+    "clarify": 0.85,
+    "judge": 0.95,
+}
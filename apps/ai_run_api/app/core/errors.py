@@ -11,6 +11,16 @@ class FileFetchError(HTTPException):
         )
 
 
+class ArchiveRejectedError(HTTPException):
+    """ZIP 패키지가 손상됐거나 크기/개수/압축률 한도를 넘음 (storage/zip_ingest.py)."""
+
+    def __init__(self, uri: str, reason: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Archive rejected ({reason}): {uri.split('?', 1)[0]}",
+        )
+
+
 class UnsupportedDomainError(HTTPException):
     def __init__(self, domain: str):
         super().__init__(
@@ -25,3 +35,26 @@ class UnsupportedFileTypeError(HTTPException):
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Unsupported file type: {ext}",
         )
+
+
+class ClientClosedRequestError(HTTPException):
+    # nginx 관례의 499 — 응답을 받을 클라이언트가 없어 처리를 중단함
+    def __init__(self):
+        super().__init__(status_code=499, detail="Client closed request")
+
+
+class OverloadedError(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Server is busy, retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class JobNotFoundError(HTTPException):
+    def __init__(self, job_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}",
+        )
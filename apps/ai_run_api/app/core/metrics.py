@@ -0,0 +1,144 @@
+"""프로세스 내 메트릭 — 카운터/게이지/히스토그램, GET /metrics 에서 Prometheus 텍스트 포맷으로 노출.
+
+외부 의존성 없이 최소 기능만 제공한다. 분석기 스레드(asyncio.to_thread)에서도 호출되므로 lock으로 보호.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+
+_lock = threading.Lock()
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _key(labels: dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _fmt_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    items = key + extra
+    if not items:
+        return ""
+    body = ",".join(f'{k}="{v}"' for k, v in items)
+    return "{" + body + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = _key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        return [f"{self.name}{_fmt_labels(k)} {v:g}" for k, v in sorted(self._values.items())]
+
+    def snapshot(self) -> dict[str, float]:
+        return {_fmt_labels(k) or "": v for k, v in sorted(self._values.items())}
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        key = _key(labels)
+        with _lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        # label → (bucket별 개수, 합계, 개수)
+        self._values: dict[LabelKey, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = _key(labels)
+        with _lock:
+            counts, total, n = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            i = bisect_left(self.buckets, value)
+            if i < len(counts):
+                counts[i] += 1
+            self._values[key] = (counts, total + value, n + 1)
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        for key, (counts, total, n) in sorted(self._values.items()):
+            cum = 0
+            for b, c in zip(self.buckets, counts):
+                cum += c
+                lines.append(f"{self.name}_bucket{_fmt_labels(key, (('le', f'{b:g}'),))} {cum}")
+            lines.append(f"{self.name}_bucket{_fmt_labels(key, (('le', '+Inf'),))} {n}")
+            lines.append(f"{self.name}_sum{_fmt_labels(key)} {total:g}")
+            lines.append(f"{self.name}_count{_fmt_labels(key)} {n}")
+        return lines
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {
+            _fmt_labels(k) or "": {"count": n, "sum": total}
+            for k, (_, total, n) in sorted(self._values.items())
+        }
+
+
+_REGISTRY: dict[str, Counter | Gauge | Histogram] = {}
+
+
+def counter(name: str, help: str) -> Counter:
+    with _lock:
+        m = _REGISTRY.get(name)
+        if m is None:
+            m = _REGISTRY[name] = Counter(name, help)
+    assert type(m) is Counter
+    return m
+
+
+def gauge(name: str, help: str) -> Gauge:
+    with _lock:
+        m = _REGISTRY.get(name)
+        if m is None:
+            m = _REGISTRY[name] = Gauge(name, help)
+    assert isinstance(m, Gauge)
+    return m
+
+
+def histogram(name: str, help: str, buckets: tuple[float, ...]) -> Histogram:
+    with _lock:
+        m = _REGISTRY.get(name)
+        if m is None:
+            m = _REGISTRY[name] = Histogram(name, help, buckets)
+    assert isinstance(m, Histogram)
+    return m
+
+
+def render() -> str:
+    """Prometheus text exposition format."""
+    lines: list[str] = []
+    with _lock:
+        for name, m in sorted(_REGISTRY.items()):
+            lines.append(f"# HELP {name} {m.help}")
+            lines.append(f"# TYPE {name} {m.kind}")
+            lines.extend(m.render())
+    return "\n".join(lines) + "\n"
+
+
+def snapshot() -> dict[str, dict]:
+    with _lock:
+        return {name: m.snapshot() for name, m in sorted(_REGISTRY.items())}
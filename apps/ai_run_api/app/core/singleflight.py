@@ -0,0 +1,79 @@
+"""single-flight — 같은 키의 작업이 진행 중이면 새로 시작하지 않고 그 결과를 함께 기다린다.
+
+- 백엔드가 같은 패키지로 /run/submit을 재시도하거나, 같은 저장 경로가 여러 슬롯에 들어오는 경우
+  다운로드/분석을 한 번만 실행한다. 완료된 결과는 보관하지 않는다 (진행 중인 작업만 합친다).
+- 작업은 호출 측과 분리된 태스크로 실행한다. 기다리는 쪽이 취소/타임아웃되면 그쪽만 빠지고,
+  기다리는 쪽이 하나도 남지 않으면 작업을 취소한다.
+- 작업은 처음 시작한 요청의 contextvar를 물려받되, 취소 scope는 작업 전용이다
+  — 한 요청의 disconnect가 스레드 중단 지점(cancellation.check)을 통해 다른 요청의 작업을 멈추지 않도록.
+  요청 단위 상태(데드라인/LLM 배처/생략 리포트 등)에 기록하는 작업은 fn 안에서 작업 전용으로 바꿔 넣는다
+  (pipeline/submit._analyse_shared).
+- 시작한 요청이 끝나면서 작업이 취소되면 남아 있던 요청이 다시 시작한다.
+- 메트릭: ai_run_singleflight_calls_total{kind, role=leader|coalesced}, ai_run_singleflight_in_flight{kind}.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app.core import cancellation, metrics
+
+T = TypeVar("T")
+
+_CALLS = metrics.counter(
+    "ai_run_singleflight_calls_total", "Single-flight calls by kind and role (leader|coalesced)"
+)
+_IN_FLIGHT = metrics.gauge("ai_run_singleflight_in_flight", "Distinct in-flight single-flight keys by kind")
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task, scope: cancellation.CancelScope):
+        self.task = task
+        self.scope = scope
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def _start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> _Flight:
+        scope = cancellation.CancelScope()
+        task = asyncio.create_task(cancellation.scoped(scope, fn()))
+        flight = self._flights[key] = _Flight(task, scope)
+        _IN_FLIGHT.set(len(self._flights), kind=self.kind)
+
+        def _done(_: asyncio.Task) -> None:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+                _IN_FLIGHT.set(len(self._flights), kind=self.kind)
+            scope.cleanup()
+
+        task.add_done_callback(_done)
+        return flight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """key의 작업이 진행 중이면 그 결과를, 아니면 fn()을 실행해 결과를 돌려준다."""
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._start(key, fn)
+                _CALLS.inc(kind=self.kind, role="leader")
+            else:
+                _CALLS.inc(kind=self.kind, role="coalesced")
+            flight.waiters += 1
+            try:
+                return await asyncio.shield(flight.task)
+            except asyncio.CancelledError:
+                me = asyncio.current_task()
+                if flight.task.cancelled() and me is not None and not me.cancelling():
+                    # 나는 계속 기다리는데 작업이 취소됨 (시작한 요청 종료) → 다시 시작
+                    continue
+                raise
+            finally:
+                flight.waiters -= 1
+                if flight.waiters == 0 and not flight.task.done():
+                    flight.scope.cancel("abandoned", count=False)
+                    flight.task.cancel()
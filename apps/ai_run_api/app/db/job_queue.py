@@ -0,0 +1,190 @@
+"""비동기 submit job 큐 — SQLite 기반 (재시작 후에도 유지).
+
+상태: QUEUED → RUNNING → DONE | FAILED,  QUEUED/RUNNING → CANCELLED (cancel)
+- claim(): QUEUED 이거나 lease가 만료된 RUNNING job을 원자적으로 가져온다
+  (프로세스가 죽어서 RUNNING으로 남은 job은 lease 만료 후 다른 워커가 재실행).
+  claim마다 새 claim_token을 발급한다. 실행 중인 워커는 renew()로 lease를 연장하고,
+  완료/실패 기록(complete/fail)은 token이 맞는 RUNNING job에만 반영된다 — lease를 잃은 워커가
+  다시 가져간 워커의 결과를 덮어쓰지 않는다.
+- CANCELLED는 다시 claim되지 않고, 실행 중이던 워커의 완료/실패 기록으로 덮어쓰지 않는다.
+- 동기 함수만 제공한다. async 코드에서는 asyncio.to_thread로 호출.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+from app.db.sqlite import connect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submit_jobs (
+    job_id       TEXT PRIMARY KEY,
+    idem_key     TEXT NOT NULL,
+    package_id   TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    request_json TEXT NOT NULL,
+    result_json  TEXT,
+    error        TEXT,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    lease_until  REAL,
+    claim_token  TEXT,
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_submit_jobs_idem ON submit_jobs(idem_key, created_at);
+CREATE INDEX IF NOT EXISTS ix_submit_jobs_status ON submit_jobs(status, created_at);
+"""
+
+_initialized = False
+
+
+def _conn():
+    global _initialized
+    conn = connect()
+    if not _initialized:
+        conn.executescript(_SCHEMA)
+        # claim_token 이전에 만든 DB
+        cols = {r["name"] for r in conn.execute("PRAGMA table_info(submit_jobs)")}
+        if "claim_token" not in cols:
+            conn.execute("ALTER TABLE submit_jobs ADD COLUMN claim_token TEXT")
+        _initialized = True
+    return conn
+
+
+def enqueue(idem_key: str, package_id: str, request_json: str, done_ttl_sec: float) -> tuple[dict, bool]:
+    """같은 idem_key의 대기/실행 중 job이나 done_ttl_sec 안에 완료된 job이 있으면 그것을, 없으면 새 job을 반환.
+
+    Returns (job_row, created)
+    """
+    conn = _conn()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        now = time.time()
+        row = conn.execute(
+            "SELECT * FROM submit_jobs WHERE idem_key = ? "
+            "AND (status IN ('QUEUED', 'RUNNING') OR (status = 'DONE' AND updated_at >= ?)) "
+            "ORDER BY created_at DESC LIMIT 1",
+            (idem_key, now - done_ttl_sec),
+        ).fetchone()
+        if row is not None:
+            conn.execute("COMMIT")
+            return dict(row), False
+
+        job_id = f"JOB_{uuid.uuid4().hex[:16].upper()}"
+        conn.execute(
+            "INSERT INTO submit_jobs (job_id, idem_key, package_id, status, request_json, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'QUEUED', ?, ?, ?)",
+            (job_id, idem_key, package_id, request_json, now, now),
+        )
+        row = conn.execute("SELECT * FROM submit_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        conn.execute("COMMIT")
+        return dict(row), True
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def claim(lease_sec: float) -> dict | None:
+    """실행할 job 1건을 RUNNING으로 바꾸고 반환 (row["claim_token"] = 이번 claim의 token). 없으면 None."""
+    conn = _conn()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        now = time.time()
+        row = conn.execute(
+            "SELECT * FROM submit_jobs "
+            "WHERE status = 'QUEUED' OR (status = 'RUNNING' AND lease_until < ?) "
+            "ORDER BY created_at LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        token = uuid.uuid4().hex
+        conn.execute(
+            "UPDATE submit_jobs SET status = 'RUNNING', attempts = attempts + 1, "
+            "lease_until = ?, claim_token = ?, updated_at = ? WHERE job_id = ?",
+            (now + lease_sec, token, now, row["job_id"]),
+        )
+        conn.execute("COMMIT")
+        job = dict(row)
+        job["status"] = "RUNNING"
+        job["attempts"] += 1
+        job["claim_token"] = token
+        return job
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def renew(job_id: str, token: str, lease_sec: float) -> bool:
+    """lease 연장. 이 token의 RUNNING job이 아니면(취소/다른 워커가 재claim) False."""
+    conn = _conn()
+    try:
+        now = time.time()
+        cur = conn.execute(
+            "UPDATE submit_jobs SET lease_until = ?, updated_at = ? "
+            "WHERE job_id = ? AND status = 'RUNNING' AND claim_token = ?",
+            (now + lease_sec, now, job_id, token),
+        )
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def owns(job_id: str, token: str) -> bool:
+    """이 token의 claim이 아직 유효한 RUNNING job인지."""
+    row = get(job_id)
+    return row is not None and row["status"] == "RUNNING" and row["claim_token"] == token
+
+
+def complete(job_id: str, token: str, result_json: str) -> bool:
+    return _finish(job_id, token, "DONE", result_json=result_json)
+
+
+def fail(job_id: str, token: str, error: str) -> bool:
+    return _finish(job_id, token, "FAILED", error=error)
+
+
+def cancel(job_id: str) -> dict | None:
+    """QUEUED/RUNNING job을 CANCELLED로. 이미 끝난 job은 그대로. 없으면 None."""
+    conn = _conn()
+    try:
+        conn.execute(
+            "UPDATE submit_jobs SET status = 'CANCELLED', error = 'CANCELLED', lease_until = NULL, "
+            "updated_at = ? WHERE job_id = ? AND status IN ('QUEUED', 'RUNNING')",
+            (time.time(), job_id),
+        )
+        row = conn.execute("SELECT * FROM submit_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+    finally:
+        conn.close()
+
+
+def _finish(
+    job_id: str, token: str, status: str, *, result_json: str | None = None, error: str | None = None
+) -> bool:
+    """token이 맞는 RUNNING job만 기록. 반영됐으면 True."""
+    conn = _conn()
+    try:
+        cur = conn.execute(
+            "UPDATE submit_jobs SET status = ?, result_json = ?, error = ?, lease_until = NULL, "
+            "updated_at = ? WHERE job_id = ? AND status = 'RUNNING' AND claim_token = ?",
+            (status, result_json, error, time.time(), job_id, token),
+        )
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def get(job_id: str) -> dict | None:
+    conn = _conn()
+    try:
+        row = conn.execute("SELECT * FROM submit_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+    finally:
+        conn.close()
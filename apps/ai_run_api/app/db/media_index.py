@@ -0,0 +1,98 @@
+"""파일 지문 색인 — 패키지를 넘나드는 중복/유사 파일 찾기용 (SQLite).
+
+(package_id, file_id) 당 1행: sha256 + 이미지 pHash(16진 64bit) 또는 문서 MinHash(uint32 배열 bytes).
+조회 구조(다중 색인 해싱 / LSH)는 pipeline/duplicates.py가 메모리에 만들고, since_rowid로 다른 워커가
+추가한 행만 이어서 읽는다. 보존 기간이 지난 행은 put()이 프로세스당 _PRUNE_INTERVAL_SEC마다 한 번 정리한다.
+동기 함수만 제공 (async 코드에서는 asyncio.to_thread).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from app.db.sqlite import connect
+
+_PRUNE_INTERVAL_SEC = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_fingerprint (
+    package_id TEXT NOT NULL,
+    file_id    TEXT NOT NULL,
+    sha256     TEXT NOT NULL,
+    phash      TEXT,
+    minhash    BLOB,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (package_id, file_id)
+);
+CREATE INDEX IF NOT EXISTS idx_media_fingerprint_sha ON media_fingerprint (sha256);
+CREATE INDEX IF NOT EXISTS idx_media_fingerprint_created ON media_fingerprint (created_at);
+"""
+
+_initialized = False
+_last_prune = 0.0
+_prune_lock = threading.Lock()
+
+
+def _conn():
+    global _initialized
+    conn = connect()
+    if not _initialized:
+        conn.executescript(_SCHEMA)
+        _initialized = True
+    return conn
+
+
+def load_since(since_rowid: int, retention_sec: float) -> list[dict]:
+    """since_rowid 이후 추가/갱신된 행 (보존 기간 안). rowid 오름차순."""
+    conn = _conn()
+    try:
+        rows = conn.execute(
+            "SELECT rowid, package_id, file_id, sha256, phash, minhash, created_at FROM media_fingerprint "
+            "WHERE rowid > ? AND created_at >= ? ORDER BY rowid",
+            (since_rowid, time.time() - retention_sec),
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def put(
+    package_id: str,
+    file_id: str,
+    sha256: str,
+    phash: str | None,
+    minhash: bytes | None,
+    retention_sec: float,
+) -> None:
+    """저장. 같은 파일 재제출은 새 rowid로 다시 쓴다. 보존 기간 정리는 주기마다 한 번."""
+    now = time.time()
+    conn = _conn()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO media_fingerprint "
+            "(package_id, file_id, sha256, phash, minhash, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (package_id, file_id, sha256, phash, minhash, now),
+        )
+    finally:
+        conn.close()
+    _maybe_prune(now, retention_sec)
+
+
+def _maybe_prune(now: float, retention_sec: float) -> None:
+    global _last_prune
+    with _prune_lock:
+        if now - _last_prune < _PRUNE_INTERVAL_SEC:
+            return
+        _last_prune = now
+    prune(retention_sec)
+
+
+def prune(retention_sec: float) -> int:
+    """보존 기간이 지난 행 삭제 (created_at 색인 범위 삭제). 삭제한 행 수."""
+    conn = _conn()
+    try:
+        cur = conn.execute("DELETE FROM media_fingerprint WHERE created_at < ?", (time.time() - retention_sec,))
+        return cur.rowcount
+    finally:
+        conn.close()
@@ -0,0 +1,150 @@
+"""preview 패키지 누적 상태 저장소 — SQLite 백엔드 (storage/package_store.py).
+
+패키지 1행 + 힌트는 (package_id, file_id) 1행. 같은 file_id의 힌트는 UPSERT로 덮어쓰며
+rowid가 유지되므로 처음 추가된 순서를 그대로 지킨다.
+updated_at이 TTL을 넘은 패키지는 조회되지 않고, 새 패키지를 만들 때 정리된다.
+동기 함수만 제공 (async 코드에서는 asyncio.to_thread).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from app.db.sqlite import connect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS preview_package (
+    package_id    TEXT PRIMARY KEY,
+    domain        TEXT NOT NULL,
+    statuses_json TEXT NOT NULL DEFAULT '[]',
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_preview_package_updated ON preview_package (updated_at);
+CREATE TABLE IF NOT EXISTS preview_hint (
+    package_id TEXT NOT NULL,
+    file_id    TEXT NOT NULL,
+    hint_json  TEXT NOT NULL,
+    PRIMARY KEY (package_id, file_id)
+);
+"""
+
+_initialized = False
+
+
+def _conn():
+    global _initialized
+    conn = connect()
+    if not _initialized:
+        conn.executescript(_SCHEMA)
+        _initialized = True
+    return conn
+
+
+def load(package_id: str, ttl_sec: float) -> dict | None:
+    """{package_id, domain, statuses, hints: [hint dict ...]} 또는 None (없음/만료)."""
+    conn = _conn()
+    try:
+        row = conn.execute(
+            "SELECT * FROM preview_package WHERE package_id = ? AND updated_at >= ?",
+            (package_id, time.time() - ttl_sec),
+        ).fetchone()
+        if row is None:
+            return None
+        hints = conn.execute(
+            "SELECT hint_json FROM preview_hint WHERE package_id = ? ORDER BY rowid", (package_id,)
+        ).fetchall()
+        return {
+            "package_id": row["package_id"],
+            "domain": row["domain"],
+            "statuses": json.loads(row["statuses_json"]),
+            "hints": [json.loads(h["hint_json"]) for h in hints],
+        }
+    finally:
+        conn.close()
+
+
+def create(package_id: str, domain: str, ttl_sec: float) -> int:
+    """패키지 행 생성 (만료된 같은 id는 초기화). 만료 패키지를 정리하고 정리된 개수를 반환."""
+    now = time.time()
+    conn = _conn()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        expired = [
+            r["package_id"]
+            for r in conn.execute(
+                "SELECT package_id FROM preview_package WHERE updated_at < ?", (now - ttl_sec,)
+            ).fetchall()
+        ]
+        if expired:
+            marks = ",".join("?" * len(expired))
+            conn.execute(f"DELETE FROM preview_hint WHERE package_id IN ({marks})", expired)
+            conn.execute(f"DELETE FROM preview_package WHERE package_id IN ({marks})", expired)
+        conn.execute(
+            "INSERT INTO preview_package (package_id, domain, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(package_id) DO UPDATE SET updated_at = excluded.updated_at",
+            (package_id, domain, now),
+        )
+        conn.execute("COMMIT")
+        return len(expired)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def upsert_hints(package_id: str, hints: list[tuple[str, str]]) -> None:
+    """hints: [(file_id, hint_json)]."""
+    conn = _conn()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT INTO preview_hint (package_id, file_id, hint_json) VALUES (?, ?, ?) "
+            "ON CONFLICT(package_id, file_id) DO UPDATE SET hint_json = excluded.hint_json",
+            [(package_id, fid, js) for fid, js in hints],
+        )
+        conn.execute("UPDATE preview_package SET updated_at = ? WHERE package_id = ?", (time.time(), package_id))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def delete_hints(package_id: str, file_ids: list[str]) -> None:
+    conn = _conn()
+    try:
+        conn.executemany(
+            "DELETE FROM preview_hint WHERE package_id = ? AND file_id = ?",
+            [(package_id, fid) for fid in file_ids],
+        )
+    finally:
+        conn.close()
+
+
+def save_statuses(package_id: str, statuses_json: str) -> None:
+    conn = _conn()
+    try:
+        conn.execute(
+            "UPDATE preview_package SET statuses_json = ?, updated_at = ? WHERE package_id = ?",
+            (statuses_json, time.time(), package_id),
+        )
+    finally:
+        conn.close()
+
+
+def stats() -> dict[str, int]:
+    """저장된 패키지 수 + 상태 JSON 크기(bytes) 합."""
+    conn = _conn()
+    try:
+        packages, status_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(statuses_json)), 0) FROM preview_package"
+        ).fetchone()
+        hint_bytes = conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(hint_json)), 0) FROM preview_hint"
+        ).fetchone()[0]
+        return {"packages": packages, "bytes": status_bytes + hint_bytes}
+    finally:
+        conn.close()
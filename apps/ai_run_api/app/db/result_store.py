@@ -0,0 +1,82 @@
+"""submit 결과 저장소 — 같은 요청(정규화 fingerprint)의 SubmitResponse 재사용 (SQLite).
+
+fingerprint 당 1행. version은 룰/프롬프트 버전(pipeline/result_cache.py)으로, 조회 측에서 비교한다.
+file_hashes_json에는 결과를 만들 때의 file_id → sha256이 들어 있다.
+동기 함수만 제공 (async 코드에서는 asyncio.to_thread).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from app.db.sqlite import connect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submit_result_store (
+    fingerprint      TEXT PRIMARY KEY,
+    package_id       TEXT NOT NULL,
+    version          TEXT NOT NULL,
+    response_json    TEXT NOT NULL,
+    file_hashes_json TEXT NOT NULL,
+    created_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_submit_result_package ON submit_result_store (package_id);
+CREATE INDEX IF NOT EXISTS idx_submit_result_created ON submit_result_store (created_at);
+"""
+
+_initialized = False
+
+
+def _conn():
+    global _initialized
+    conn = connect()
+    if not _initialized:
+        conn.executescript(_SCHEMA)
+        _initialized = True
+    return conn
+
+
+def get(fingerprint: str) -> dict | None:
+    conn = _conn()
+    try:
+        row = conn.execute(
+            "SELECT * FROM submit_result_store WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return dict(row) if row is not None else None
+    finally:
+        conn.close()
+
+
+def put(
+    fingerprint: str,
+    package_id: str,
+    version: str,
+    response_json: str,
+    file_hashes: dict[str, str],
+    ttl_sec: float,
+) -> None:
+    """저장하면서 TTL이 지난 행을 정리한다."""
+    now = time.time()
+    conn = _conn()
+    try:
+        conn.execute(
+            "INSERT INTO submit_result_store "
+            "(fingerprint, package_id, version, response_json, file_hashes_json, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(fingerprint) DO UPDATE SET package_id = excluded.package_id, "
+            "version = excluded.version, response_json = excluded.response_json, "
+            "file_hashes_json = excluded.file_hashes_json, created_at = excluded.created_at",
+            (fingerprint, package_id, version, response_json, json.dumps(file_hashes), now),
+        )
+        conn.execute("DELETE FROM submit_result_store WHERE created_at < ?", (now - ttl_sec,))
+    finally:
+        conn.close()
+
+
+def delete(fingerprint: str) -> None:
+    conn = _conn()
+    try:
+        conn.execute("DELETE FROM submit_result_store WHERE fingerprint = ?", (fingerprint,))
+    finally:
+        conn.close()
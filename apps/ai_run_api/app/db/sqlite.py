@@ -0,0 +1,20 @@
+"""로컬 SQLite 연결 헬퍼 — WAL 모드로 여러 워커 프로세스가 같은 파일을 공유한다."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+
+from app.core.config import AI_RUN_DB_PATH
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    """호출마다 새 연결을 연다 (스레드 간 공유 금지). autocommit 모드."""
+    db_path = path or AI_RUN_DB_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
@@ -0,0 +1,60 @@
+"""패키지별 마지막 submit 상태 저장소 — 증분 재제출용 (SQLite).
+
+package_id 당 1행. state_json에는 파일별 추출 레코드(+sha256), 슬롯/교차검증 결과,
+보완요청 문장이 들어 있다. 동기 함수만 제공 (async 코드에서는 asyncio.to_thread).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from app.db.sqlite import connect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS package_submit_state (
+    package_id TEXT PRIMARY KEY,
+    domain     TEXT NOT NULL,
+    period     TEXT NOT NULL,
+    state_json TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+_initialized = False
+
+
+def _conn():
+    global _initialized
+    conn = connect()
+    if not _initialized:
+        conn.executescript(_SCHEMA)
+        _initialized = True
+    return conn
+
+
+def load(package_id: str, domain: str, period: str) -> dict | None:
+    """같은 도메인/기간으로 저장된 상태만 반환 (기간이 바뀌면 DATE 판정이 달라지므로 재사용 불가)."""
+    conn = _conn()
+    try:
+        row = conn.execute(
+            "SELECT state_json FROM package_submit_state WHERE package_id = ? AND domain = ? AND period = ?",
+            (package_id, domain, period),
+        ).fetchone()
+        return json.loads(row["state_json"]) if row is not None else None
+    finally:
+        conn.close()
+
+
+def save(package_id: str, domain: str, period: str, state: dict) -> None:
+    conn = _conn()
+    try:
+        conn.execute(
+            "INSERT INTO package_submit_state (package_id, domain, period, state_json, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(package_id) DO UPDATE SET domain = excluded.domain, period = excluded.period, "
+            "state_json = excluded.state_json, updated_at = excluded.updated_at",
+            (package_id, domain, period, json.dumps(state, ensure_ascii=False, default=str), time.time()),
+        )
+    finally:
+        conn.close()
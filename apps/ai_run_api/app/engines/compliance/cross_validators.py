@@ -3,7 +3,8 @@
 """
 Compliance 교차 검증 — 1:1 슬롯 매칭.
 
-cross_validate_slot(extractions_by_slot)
+CROSS_CHECKS: 페어마다 CrossCheck 1개 (engines/registry.py) — submit이 검증별로 실행
+cross_validate_slot(extractions_by_slot): 전체 페어를 순서대로 실행
   - 교육 출석부(PDF 스캔) vs 교육일 사진(이미지)
   - 출석부에서 서명 인원수, 사진에서 감지된 인원수를 비교
 """
@@ -11,8 +12,11 @@ cross_validate_slot(extractions_by_slot)
 from __future__ import annotations
 
 import re
+from functools import partial
 from typing import Any
 
+from app.engines.registry import CrossCheck
+
 
 # ── 교차 검증 페어 정의 ──────────────────────────────────
 CROSS_PAIRS: list[tuple[str, str]] = [
@@ -62,61 +66,69 @@ def _count_photo_people(extracted: dict) -> int | None:
     return None
 
 
+def _check_pair(
+    slot_a: str, slot_b: str, extractions_by_slot: dict[str, list[dict]]
+) -> list[dict[str, Any]]:
+    exs_a = extractions_by_slot.get(slot_a) or []
+    exs_b = extractions_by_slot.get(slot_b) or []
+
+    if not exs_a or not exs_b:
+        return []
+
+    ext_a = exs_a[0]
+    ext_b = exs_b[0]
+
+    attendance_count = _count_attendance_names(ext_a)
+    photo_count = _count_photo_people(ext_b)
+
+    reasons: list[str] = []
+    extras: dict[str, Any] = {}
+
+    if attendance_count is None:
+        reasons.append("CROSS_ATTENDANCE_PARSE_FAILED")
+        extras["detail"] = "출석부에서 인원수를 추출하지 못했습니다."
+    elif photo_count is None:
+        reasons.append("CROSS_PHOTO_COUNT_FAILED")
+        extras["detail"] = "교육사진에서 인원수를 감지하지 못했습니다."
+    else:
+        extras["attendance_count"] = attendance_count
+        extras["photo_count"] = photo_count
+        diff = abs(attendance_count - photo_count)
+        if attendance_count <= 10:
+            tolerance = 2
+        else:
+            tolerance = max(2, int(attendance_count * 0.2))
+
+        if diff > tolerance:
+            reasons.append("CROSS_HEADCOUNT_MISMATCH")
+            extras["diff"] = diff
+            extras["tolerance"] = tolerance
+            extras["detail"] = (
+                f"출석부 {attendance_count}명 vs 사진 {photo_count}명 "
+                f"(차이 {diff}명, 허용 {tolerance}명)"
+            )
+
+    verdict = "NEED_FIX" if reasons else "PASS"
+    return [{
+        "slot_name": f"{slot_a}__x__{slot_b}",
+        "reasons": reasons,
+        "verdict": verdict,
+        "extras": extras,
+    }]
+
+
+# 검증별 입력 슬롯 선언 (engines/registry.py) — 증분 재제출 시 입력이 바뀐 검증만 재실행
+CROSS_CHECKS: list[CrossCheck] = [
+    CrossCheck(name=f"{slot_a}__x__{slot_b}", inputs=(slot_a, slot_b), run=partial(_check_pair, slot_a, slot_b))
+    for slot_a, slot_b in CROSS_PAIRS
+]
+
+
 def cross_validate_slot(
     extractions_by_slot: dict[str, list[dict]],
 ) -> list[dict[str, Any]]:
     """
-    submit.py 4.5단계에서 호출.
+    전체 교차검증을 순서대로 실행 (submit.py 4.5단계는 CROSS_CHECKS를 검증별로 실행한다).
     반환: 추가 슬롯결과 리스트 [{slot_name, reasons, verdict, extras}]
     """
-    out: list[dict[str, Any]] = []
-
-    for slot_a, slot_b in CROSS_PAIRS:
-        exs_a = extractions_by_slot.get(slot_a) or []
-        exs_b = extractions_by_slot.get(slot_b) or []
-
-        if not exs_a or not exs_b:
-            continue
-
-        ext_a = exs_a[0]
-        ext_b = exs_b[0]
-
-        attendance_count = _count_attendance_names(ext_a)
-        photo_count = _count_photo_people(ext_b)
-
-        reasons: list[str] = []
-        extras: dict[str, Any] = {}
-
-        if attendance_count is None:
-            reasons.append("CROSS_ATTENDANCE_PARSE_FAILED")
-            extras["detail"] = "출석부에서 인원수를 추출하지 못했습니다."
-        elif photo_count is None:
-            reasons.append("CROSS_PHOTO_COUNT_FAILED")
-            extras["detail"] = "교육사진에서 인원수를 감지하지 못했습니다."
-        else:
-            extras["attendance_count"] = attendance_count
-            extras["photo_count"] = photo_count
-            diff = abs(attendance_count - photo_count)
-            if attendance_count <= 10:
-                tolerance = 2
-            else:
-                tolerance = max(2, int(attendance_count * 0.2))
-
-            if diff > tolerance:
-                reasons.append("CROSS_HEADCOUNT_MISMATCH")
-                extras["diff"] = diff
-                extras["tolerance"] = tolerance
-                extras["detail"] = (
-                    f"출석부 {attendance_count}명 vs 사진 {photo_count}명 "
-                    f"(차이 {diff}명, 허용 {tolerance}명)"
-                )
-
-        verdict = "NEED_FIX" if reasons else "PASS"
-        out.append({
-            "slot_name": f"{slot_a}__x__{slot_b}",
-            "reasons": reasons,
-            "verdict": verdict,
-            "extras": extras,
-        })
-
-    return out
\ No newline at end of file
+    return [r for check in CROSS_CHECKS for r in check.run(extractions_by_slot)]
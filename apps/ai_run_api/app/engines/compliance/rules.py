@@ -2,6 +2,7 @@
 
 - EXPECTED_HEADERS: 엑셀 슬롯의 필수 헤더
 - REASON_CODES: 파이프라인에서 실제 생성되는 사유 코드 + 메시지
+- SLOT_KEYWORDS: 슬롯별 본문 핵심 키워드 (LLM 입력 선별 시 페이지/문단 점수)
 """
 
 from __future__ import annotations
@@ -23,6 +24,7 @@ REASON_CODES: dict[str, str] = {
     "MISSING_SLOT":   "필수 슬롯 누락",
     "HEADER_MISMATCH": "필수 헤더(컬럼) 누락",
     "EMPTY_TABLE":    "표/데이터 행이 비어있음",
+    "PARSE_FAILED":   "파일 파싱 실패(손상/형식 오류)",
     "OCR_FAILED":     "OCR 판독 불가/텍스트 추출 실패",
     "WRONG_YEAR":     "문서 대상 연도 불일치 (2025년 아님)",
 
@@ -48,4 +50,16 @@ REASON_CODES: dict[str, str] = {
     "CROSS_HEADCOUNT_MISMATCH":       "출석부 인원수와 교육사진 인원수 불일치",
     "CROSS_ATTENDANCE_PARSE_FAILED":  "출석부에서 인원수 추출 실패",
     "CROSS_PHOTO_COUNT_FAILED":       "교육사진에서 인원수 감지 실패",
-}
\ No newline at end of file
+}
+
+# =========================================================
+# 3) 슬롯별 본문 핵심 키워드 — LLM 입력 선별용 (llm/context_packer.py)
+# =========================================================
+SLOT_KEYWORDS: dict[str, list[str]] = {
+    "compliance.contract.sample": ["선급금", "지연이자", "목적물", "기성금", "계약기간", "하도급대금"],
+    "compliance.education.privacy": ["개인정보", "이수", "미이수", "과정명"],
+    "compliance.fair.trade": ["공정거래", "위험요소", "조치", "점검자"],
+    "compliance.ethics.report": ["윤리", "제보", "신고", "조사", "조치결과"],
+    "compliance.education.plan": ["개인정보", "성희롱", "장애인", "산업안전", "교육계획", "법정의무"],
+    "compliance.education.attendance": ["출석", "참석자", "성명", "서명", "교육일시"],
+}
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import os
 import re
-from typing import NamedTuple
+from typing import NamedTuple, Sequence
 
 
 # 1) 허용 확장자 그룹 정의
@@ -126,6 +126,11 @@ def match_filename_to_slot(filename: str) -> tuple[str, float] | None:
     return None
 
 
+def match_filenames(filenames: Sequence[str]) -> list[tuple[str, float] | None]:
+    """여러 파일명을 한 번에 분류 (ZIP 묶음/일괄 업로드)."""
+    return [match_filename_to_slot(f) for f in filenames]
+
+
 def get_required_slot_names() -> list[str]:
     return [s.name for s in SLOTS if s.required]
 
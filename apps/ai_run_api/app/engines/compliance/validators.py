@@ -10,6 +10,8 @@ import io
 
 import pandas as pd
 
+from app.engines.text_index import TextIndex, index_of
+
 # ---------------------------------------------------------
 # 내부 상수 정의 (검증 기준값)
 # ---------------------------------------------------------
@@ -22,17 +24,20 @@ _EDU_FAIL_LIMIT = 20.0  # 미이수 허용치(%)
 # 내부 검증 함수 (Private Functions)
 # ---------------------------------------------------------
 
-def _validate_contract_text(text: str) -> list[str]:
+def _validate_contract_text(index: TextIndex, extracted: dict) -> list[str]:
     """표준 근로/하도급 계약서 텍스트 검증"""
     reasons = []
     
-    # (1) 필수 조항 키워드 체크
-    missing = [kw for kw in _MANDATORY_CLAUSES if kw not in text]
+    # (1) 필수 조항 키워드 체크 (찾은 조항은 페이지와 함께 extras에 근거로 남김)
+    missing = index.missing(_MANDATORY_CLAUSES)
     if missing:
         reasons.append("KEYWORD_MISSING")
+    cited = index.cite(_MANDATORY_CLAUSES)
+    if cited:
+        extracted.setdefault("extras", {})["clause_pages"] = cited
 
     # (2) 연도 체크
-    if "2025" not in text:
+    if not index.contains("2025"):
         reasons.append("WRONG_YEAR")
         
     return reasons
@@ -110,14 +115,10 @@ def _validate_fair_trade_checklist(extracted: dict) -> list[str]:
     return reasons
 
 
-def _validate_education_plan_text(text: str) -> list[str]:
+def _validate_education_plan_text(index: TextIndex) -> list[str]:
     """교육 계획서 텍스트 검증"""
     reasons = []
-    missing_cnt = 0
-    
-    for course in _REQUIRED_COURSES:
-        if course not in text:
-            missing_cnt += 1
+    missing_cnt = len(index.missing(_REQUIRED_COURSES))
             
     if missing_cnt >= 2:
         reasons.append("MISSING_MANDATORY_TRAINING")
@@ -140,14 +141,9 @@ def validate_slot(
     """
     extra_reasons: list[str] = []
 
-    # 텍스트 전처리 (리스트 -> 문자열)
-    text = extracted.get("text", "")
-    if isinstance(text, list): 
-        text = "\n".join(text)
-
     # ── 1. 표준 근로/하도급 계약서 ──
     if slot_name == "compliance.contract.sample":
-        extra_reasons = _validate_contract_text(text)
+        extra_reasons = _validate_contract_text(index_of(extracted), extracted)
 
     # ── 2. 개인정보 교육 이수 현황 ──
     elif slot_name == "compliance.education.privacy":
@@ -159,11 +155,11 @@ def validate_slot(
 
     # ── 4. 법정의무 교육 계획서 ──
     elif slot_name == "compliance.education.plan":
-        extra_reasons = _validate_education_plan_text(text)
+        extra_reasons = _validate_education_plan_text(index_of(extracted))
 
     # ── 5. 윤리경영 보고서 ──
     elif slot_name == "compliance.ethics.report":
-        if "2025" not in text:
+        if not index_of(extracted).contains("2025"):
             extra_reasons.append("WRONG_YEAR")
 
     return list(dict.fromkeys(extra_reasons))
\ No newline at end of file
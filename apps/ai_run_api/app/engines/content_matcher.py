@@ -0,0 +1,145 @@
+# app/engines/content_matcher.py
+
+"""
+내용 기반 슬롯 추정 — 파일명 매칭이 실패한 파일을 LLM에 보내기 전 로컬에서 한 번 더 분류한다.
+
+- 슬롯 프로파일: 도메인 rules의 EXPECTED_HEADERS(가중치 2) / SLOT_KEYWORDS(1.5)와
+  slots 모듈의 파일명 키워드·정규식 리터럴 조각·표시 이름(1)을 용어 가중치로 모은다.
+- IDF: 여러 슬롯에 공통인 용어(사용량, 목록 등)는 낮게, 한 슬롯에만 있는 용어는 높게.
+- 점수: 내용 서명(PDF 첫 페이지 텍스트 / 표 머리 행 / 이미지 메타데이터)에 등장한 용어(Aho–Corasick 한 번)와
+  슬롯 프로파일의 TF-IDF 코사인 유사도.
+- 최고 점수가 CONTENT_MATCH_MIN_SCORE 이상이고 2위와 _MIN_MARGIN 이상 차이 날 때만 확정, 아니면 None (→ LLM).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import defaultdict
+
+from app.core.config import CONTENT_MATCH_MIN_SCORE
+from app.engines.filename_matcher import AhoCorasick
+from app.engines.registry import get_rules_module, get_slots_module
+
+_MIN_MARGIN = 0.08
+_MIN_TERM_LEN = 2
+
+# 출처별 용어 가중치
+_W_HEADER = 2.0
+_W_SLOT_KEYWORD = 1.5
+_W_FILENAME = 1.0
+
+_TOKEN_SPLIT = re.compile(r"[^0-9a-z가-힣㎥]+")
+
+
+def _terms(text: str) -> list[str]:
+    """용어 원문 + 괄호/구분자로 나눈 조각 ("작업명(Activity)" → 작업명(activity), 작업명, activity)."""
+    low = text.strip().lower()
+    parts = [t for t in _TOKEN_SPLIT.split(low) if t]
+    return [t for t in dict.fromkeys([low, *parts]) if len(t) >= _MIN_TERM_LEN]
+
+
+def _regex_literals(pat: re.Pattern[str]) -> list[str]:
+    src = re.sub(r"^\(\?[aiLmsux]+\)", "", pat.pattern).lower()
+    return [t for t in _TOKEN_SPLIT.split(src) if len(t) >= _MIN_TERM_LEN]
+
+
+def _slot_sources(slot, rules_mod) -> list[tuple[str, float]]:
+    out: list[tuple[str, float]] = []
+    for h in rules_mod.EXPECTED_HEADERS.get(slot.name, []):
+        out += [(t, _W_HEADER) for t in _terms(h)]
+    for k in getattr(rules_mod, "SLOT_KEYWORDS", {}).get(slot.name, []):
+        out += [(t, _W_SLOT_KEYWORD) for t in _terms(k)]
+    # 파일명 키워드 (esg: 점수 그룹, safety/compliance: 정규식)
+    for attr in ("must_any_1", "must_any_2", "boost"):
+        for k in getattr(slot, attr, ()):
+            out += [(t, _W_FILENAME) for t in _terms(k)]
+    pats = list(getattr(slot, "patterns", []) or [])
+    if getattr(slot, "regex", None) is not None:
+        pats.append(slot.regex)
+    for p in pats:
+        out += [(t, _W_FILENAME) for t in _regex_literals(p)]
+    out += [(t, _W_FILENAME) for t in _terms(slot.display_name)[1:]]
+    return out
+
+
+class _Profiles:
+    def __init__(self, domain: str):
+        slots_mod = get_slots_module(domain)
+        rules_mod = get_rules_module(domain)
+        self.slots = list(slots_mod.SLOTS)
+        self.key = tuple(s.name for s in self.slots)
+
+        weights: list[dict[str, float]] = []
+        for s in self.slots:
+            w: dict[str, float] = {}
+            for term, weight in _slot_sources(s, rules_mod):
+                w[term] = max(w.get(term, 0.0), weight)
+            weights.append(w)
+
+        df: dict[str, int] = defaultdict(int)
+        for w in weights:
+            for term in w:
+                df[term] += 1
+        n = len(self.slots)
+        self._ac = AhoCorasick(df)
+        self._idf = [math.log(1.0 + n / df[t]) for t in self._ac.keywords]
+        index = {t: i for i, t in enumerate(self._ac.keywords)}
+        # 용어 → [(슬롯, 가중치 × idf)]
+        self._postings: list[list[tuple[int, float]]] = [[] for _ in self._ac.keywords]
+        self._norms = [0.0] * n
+        for si, w in enumerate(weights):
+            for term, weight in w.items():
+                ti = index[term]
+                v = weight * self._idf[ti]
+                self._postings[ti].append((si, v))
+                self._norms[si] += v * v
+        self._norms = [math.sqrt(x) for x in self._norms]
+
+    def scores(self, text: str) -> list[float]:
+        found = self._ac.find(text.lower())
+        if not found:
+            return [0.0] * len(self.slots)
+        doc_norm = math.sqrt(sum(self._idf[t] ** 2 for t in found))
+        dots = [0.0] * len(self.slots)
+        for t in found:
+            for si, v in self._postings[t]:
+                dots[si] += v * self._idf[t]
+        return [
+            d / (self._norms[si] * doc_norm) if self._norms[si] else 0.0 for si, d in enumerate(dots)
+        ]
+
+
+_PROFILES: dict[str, _Profiles] = {}
+
+
+def _profiles(domain: str) -> _Profiles:
+    # esg는 SLOTS가 갱신될 수 있다 — 슬롯 구성이 바뀌면 다시 만든다
+    p = _PROFILES.get(domain)
+    if p is None or p.key != tuple(s.name for s in get_slots_module(domain).SLOTS):
+        p = _PROFILES[domain] = _Profiles(domain)
+    return p
+
+
+def match_content_to_slot(
+    text: str, domain: str, candidates: set[str] | None = None
+) -> tuple[str, float] | None:
+    """내용 서명 → (슬롯, 점수). candidates가 있으면 그 슬롯 중에서만. 확신이 없으면 None."""
+    if not text.strip():
+        return None
+    p = _profiles(domain)
+    ranked = sorted(
+        (
+            (score, s.name)
+            for s, score in zip(p.slots, p.scores(text))
+            if candidates is None or s.name in candidates
+        ),
+        reverse=True,
+    )
+    if not ranked:
+        return None
+    best, slot = ranked[0]
+    second = ranked[1][0] if len(ranked) > 1 else 0.0
+    if best < CONTENT_MATCH_MIN_SCORE or best - second < _MIN_MARGIN:
+        return None
+    return slot, round(best, 3)
@@ -95,6 +95,21 @@ REASON_CODES: dict[str, str] = {
 }
 
 
+# -------------------------------------------------------
+# 슬롯별 본문 핵심 키워드 — LLM 입력 선별용 (llm/context_packer.py)
+# -------------------------------------------------------
+SLOT_KEYWORDS: dict[str, list[str]] = {
+    "esg.energy.electricity.bill": ["사용량", "kwh", "청구금액", "사용기간", "검침"],
+    "esg.energy.gas.bill": ["사용량", "m3", "㎥", "청구금액", "사용기간", "검침"],
+    "esg.energy.water.bill": ["사용량", "m3", "㎥", "청구금액", "사용기간", "검침"],
+    "esg.energy.ghg.evidence": ["배출계수", "scope", "산정", "tco2", "배출량"],
+    "esg.hazmat.msds": ["물질명", "cas", "유해성", "위험성", "취급", "저장"],
+    "esg.hazmat.disposal.evidence": ["폐기물", "인계", "처리", "위탁", "올바로", "수량"],
+    "esg.ethics.code": ["윤리", "행동강령", "개정", "시행", "부패", "신고"],
+    "esg.ethics.pledge": ["서약", "서명", "준수", "윤리"],
+}
+
+
 # -------------------------------------------------------
 # (옵션) 데모용 정책값(나중에 validators에서 사용)
 # -------------------------------------------------------
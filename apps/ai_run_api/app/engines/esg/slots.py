@@ -11,8 +11,11 @@ ESG 도메인 — 슬롯 정의 + 파일명 기반 슬롯 추정기 (Soft Gate 
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Sequence
+
+from app.engines.filename_matcher import AhoCorasick, RegexSet
 
 # 20260129 이종헌 추가: mac 파일 글자 깨짐 방지
 from urllib.parse import unquote
@@ -25,12 +28,16 @@ _SLOTS_ALL: list["SlotDef"] | None = None  # 원본 백업
 
 
 def _refresh_slots() -> None:
-    global SLOTS, _SLOTS_ALL
+    global SLOTS, _SLOTS_ALL, _MATCHER
     if _SLOTS_ALL is None:
         _SLOTS_ALL = list(SLOTS)  # 최초 1회 백업
 
-    SLOTS = list(_SLOTS_ALL) if ENABLE_OPTIONAL_DEMO_SLOTS else [s for s in _SLOTS_ALL if s.required]
-        
+    slots = list(_SLOTS_ALL) if ENABLE_OPTIONAL_DEMO_SLOTS else [s for s in _SLOTS_ALL if s.required]
+    # 슬롯 구성이 바뀔 때만 다시 컴파일
+    if _MATCHER is None or [x.name for x in slots] != [x.name for x in SLOTS]:
+        SLOTS = slots
+        _MATCHER = _CompiledMatcher(SLOTS)
+
         
 # -----------------------------
 # 유틸: 파일명 정규화
@@ -85,14 +92,6 @@ def _norm(s: str) -> str:
     return s.lower()
 
 
-def _has_any(text: str, keywords: Iterable[str]) -> bool:
-    return any(k in text for k in keywords)
-
-
-def _count_any(text: str, keywords: Iterable[str]) -> int:
-    return sum(1 for k in keywords if k in text)
-
-
 @dataclass(frozen=True)
 class SlotDef:
     name: str
@@ -280,62 +279,115 @@ _MIN_SCORE = 4
 # 20260129 이종헌 수정: 둘 다(도메인+목적) 맞으면 확실히 올려주는 보너스
 _PAIR_BONUS = 3
 
+# 슬롯별 감점 신호 — 키워드가 하나라도 있으면 감점
+_PENALTIES: dict[str, tuple[tuple[str, ...], int]] = {
+    "esg.ethics.code": (K_LOG + K_PLEDGE + K_POSTER, 4),  # log/pledge/poster 신호가 있으면 code 감점
+}
 
-def match_filename_to_slot(filename: str) -> tuple[str, float] | None:
-    _refresh_slots()
-    """
-    파일명만 보고 슬롯 추정(점수 기반, Soft Gate).
-    """
-    f = _norm(filename)
-    if not f:
-        return None
-
-    best_slot: str | None = None
-    best_score: int = 0
+# 키워드 그룹 (_CompiledMatcher 점수 벡터의 열)
+_G1, _G2, _BOOST, _PENALTY = range(4)
 
-    for s in SLOTS:
-        has1 = _has_any(f, s.must_any_1)
-        has2 = _has_any(f, s.must_any_2)
-        has_regex = bool(s.regex and s.regex.search(f))
 
-        if not (has1 or has2 or has_regex):
-            continue
+class _CompiledMatcher:
+    """SLOTS의 모든 키워드를 하나의 Aho–Corasick 오토마톤으로 묶은 점수기.
 
-        score = 0
-
-        if has1:
-            score += 2
-            score += _count_any(f, s.must_any_1)
-
-        if has2:
-            score += 2
-            score += _count_any(f, s.must_any_2)
-
-        if has1 and has2:
-            score += _PAIR_BONUS
+    파일명을 한 번 훑어 등장한 키워드를 구하고, 키워드별 (슬롯, 그룹, 가중치) 목록으로
+    슬롯별 점수 벡터를 채운다. 점수 규칙(Soft Gate)은 아래 _score와 같다.
+    """
 
-        score += _count_any(f, s.boost)
+    def __init__(self, slots: Sequence[SlotDef]):
+        self.slots = list(slots)
+        groups = [
+            (s.must_any_1, s.must_any_2, s.boost, _PENALTIES.get(s.name, ((), 0))[0]) for s in self.slots
+        ]
+        self._ac = AhoCorasick(kw for g in groups for kws in g for kw in kws)
+        index = {kw: i for i, kw in enumerate(self._ac.keywords)}
+        # 키워드 → [(슬롯, 그룹, 가중치)] — 같은 튜플에 중복된 키워드는 그만큼 센다
+        self._postings: list[list[tuple[int, int, int]]] = [[] for _ in self._ac.keywords]
+        for si, g in enumerate(groups):
+            for gi, kws in enumerate(g):
+                for kw, n in Counter(kws).items():
+                    self._postings[index[kw]].append((si, gi, n))
+        self._penalty = [_PENALTIES.get(s.name, ((), 0))[1] for s in self.slots]
+        self._regexes = RegexSet([[s.regex] if s.regex is not None else [] for s in self.slots])
+
+    def best(self, f: str) -> tuple[str, int] | None:
+        """정규화된 파일명 → (최고 점수 슬롯, 점수). 동점이면 SLOTS 순서가 앞선 슬롯."""
+        counts = [[0, 0, 0, 0] for _ in self.slots]
+        for kw in self._ac.find(f):
+            for si, gi, n in self._postings[kw]:
+                counts[si][gi] += n
+        regex_hits = set(self._regexes.matches(f))
+
+        best_slot: str | None = None
+        best_score = 0
+        for si, s in enumerate(self.slots):
+            c = counts[si]
+            has_regex = si in regex_hits
+            if not (c[_G1] or c[_G2] or has_regex):
+                continue
+            score = _score(c, has_regex, self._penalty[si])
+            if score > best_score:
+                best_score = score
+                best_slot = s.name
+        return (best_slot, best_score) if best_slot else None
+
+
+def _score(c: list[int], has_regex: bool, penalty: int) -> int:
+    score = 0
+    if c[_G1]:
+        score += 2 + c[_G1]
+    if c[_G2]:
+        score += 2 + c[_G2]
+    if c[_G1] and c[_G2]:
+        score += _PAIR_BONUS
+    score += c[_BOOST]
+    if has_regex:
+        score += 2
+    if c[_PENALTY]:
+        score -= penalty
+    return score
+
+
+def _confidence(score: int) -> float:
+    if score <= 6:
+        return 0.78
+    if score <= 10:
+        return 0.85
+    return 0.92
+
+
+_MATCHER: _CompiledMatcher | None = None
+
+
+def _classify(f: str) -> tuple[str, float] | None:
+    if not f:
+        return None
+    hit = _MATCHER.best(f)
+    if hit is None or hit[1] < _MIN_SCORE:
+        return None
+    return hit[0], _confidence(hit[1])
 
-        if has_regex:
-            score += 2
 
-        if s.name == "esg.ethics.code":
-            if _has_any(f, K_LOG) or _has_any(f, K_PLEDGE) or _has_any(f, K_POSTER):
-                score -= 4  # log/pledge/poster 신호가 있으면 code 감점
+def match_filename_to_slot(filename: str) -> tuple[str, float] | None:
+    """
+    파일명만 보고 슬롯 추정(점수 기반, Soft Gate).
+    """
+    _refresh_slots()
+    return _classify(_norm(filename))
 
-        if score > best_score:
-            best_score = score
-            best_slot = s.name
-            
 
-    if not best_slot or best_score < _MIN_SCORE:
-        return None
+def match_filenames(filenames: Sequence[str]) -> list[tuple[str, float] | None]:
+    """여러 파일명을 한 번에 분류 (ZIP 묶음/일괄 업로드). 같은 정규화 결과는 한 번만 계산."""
+    _refresh_slots()
+    memo: dict[str, tuple[str, float] | None] = {}
+    out: list[tuple[str, float] | None] = []
+    for name in filenames:
+        f = _norm(name)
+        if f not in memo:
+            memo[f] = _classify(f)
+        out.append(memo[f])
+    return out
 
-    if best_score <= 6:
-        conf = 0.78
-    elif best_score <= 10:
-        conf = 0.85
-    else:
-        conf = 0.92
 
-    return best_slot, conf
\ No newline at end of file
+_refresh_slots()
\ No newline at end of file
@@ -0,0 +1,134 @@
+# app/engines/esg/substance_matcher.py
+
+"""
+물질명 다중 패턴 매처 — 유해물질 목록(MSDS 커버리지)과 폐기 목록(폐기 증빙) 교차검증용.
+
+- 목록의 모든 물질명을 표기 변형과 CAS 번호까지 하나의 Aho–Corasick 오토마톤으로 묶고,
+  문서마다 텍스트를 한 번만 훑어 등장한 물질을 구한다 (물질 수와 무관하게 문서 길이에 비례).
+- 표기 변형: 소문자 + 공백 제거(engines/text_index.normalize와 같은 정규화), 괄호 밖 이름과
+  "/ , ;"로 나열된 별칭(숫자 사이 쉼표는 이름의 일부 — "2,4-D"), 하이픈·가운뎃점 제거형("n-헥산" → n헥산),
+  농도 표기 제거("황산 98%" → 황산). 괄호 안은 라틴 문자 이름/화학식만 별칭으로 쓴다
+  ("황산 (Sulfuric acid)" → sulfuricacid, "수산화나트륨 (NaOH, 고체)" → naoh) — "액체", "고체" 같은 상태/농도
+  설명이 별칭이 되면 그 단어가 있는 아무 문서나 해당 물질을 덮은 것으로 잡힌다.
+  이름 전체와 맨 앞 별칭이 아닌 별칭은 _MIN_ALIAS_LEN 글자 이상만 쓴다.
+- CAS 번호(예: 7664-93-9)는 물질명 안에 있거나 목록의 CAS 열에 있으면 함께 찾는다. 검증 숫자가 맞는 것만
+  쓰고, 앞뒤가 숫자로 이어지는 등장(다른 번호의 일부)은 제외한다.
+- coverage(): 물질별 등장 문서 / 문서별 등장 물질.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Sequence
+
+from app.engines.filename_matcher import AhoCorasick
+from app.engines.text_index import normalize
+
+_MIN_TERM_LEN = 2
+_MIN_ALIAS_LEN = 3
+
+_PAREN = re.compile(r"[(\[（]([^)\]）]*)[)\]）]")
+_ALIAS_SEP = re.compile(r"[/;]|(?<!\d),|,(?!\d)")
+# 괄호 안 별칭으로 쓰는 것 — 라틴 문자로 시작하는 이름/화학식 (상태·농도 설명 제외)
+_LATIN_NAME = re.compile(r"[a-z][a-z0-9\-\s]*")
+_QUALIFIERS = frozenset({
+    "liquid", "solid", "gas", "powder", "solution", "aqueous", "aq", "anhydrous", "conc", "dilute", "pure",
+    "cas", "cas no",
+})
+_CONCENTRATION = re.compile(r"\d+(?:\.\d+)?\s*%")
+_PUNCT = re.compile(r"[-‐–·ㆍ.'’]")
+_CAS = re.compile(r"(?<!\d)(\d{2,7})-(\d{2})-(\d)(?!\d)")
+
+
+def _cas_valid(m: re.Match[str]) -> bool:
+    digits = (m.group(1) + m.group(2))[::-1]
+    return sum((i + 1) * int(d) for i, d in enumerate(digits)) % 10 == int(m.group(3))
+
+
+def cas_numbers(text: str) -> list[str]:
+    """텍스트 안의 (검증 숫자가 맞는) CAS 번호."""
+    return [m.group(0) for m in _CAS.finditer(text or "") if _cas_valid(m)]
+
+
+def _inner_aliases(inner: str) -> list[str]:
+    out = []
+    for a in _ALIAS_SEP.split(inner):
+        a = a.strip()
+        if _LATIN_NAME.fullmatch(a) and a not in _QUALIFIERS:
+            out.append(a)
+    return out
+
+
+def name_variants(name: str) -> list[str]:
+    """물질명 → 정규화된 표기 변형 (CAS 번호는 제외)."""
+    base = _CONCENTRATION.sub(" ", _CAS.sub(" ", name.lower()))
+    outer = _PAREN.sub(" ", base)
+    # (표기, 최소 길이) — 이름 전체는 짧아도 쓴다 ("황산")
+    parts = [(outer, _MIN_TERM_LEN)]
+    aliases = _ALIAS_SEP.split(outer)
+    if len(aliases) > 1:
+        # 맨 앞은 대표 이름 ("황산/H2SO4" → 황산)
+        parts += [(a, _MIN_TERM_LEN if i == 0 else _MIN_ALIAS_LEN) for i, a in enumerate(aliases)]
+    parts += [(a, _MIN_ALIAS_LEN) for inner in _PAREN.findall(base) for a in _inner_aliases(inner)]
+    out: dict[str, None] = {}
+    for p, min_len in parts:
+        n = normalize(p).strip("-_:")
+        for v in (n, _PUNCT.sub("", n)):
+            if len(v) >= min_len and not v.isdigit() and not _ALIAS_SEP.search(v):
+                out[v] = None
+    return list(out)
+
+
+@dataclass
+class Coverage:
+    names: list[str]
+    # 문서 i에 등장한 물질 인덱스
+    docs: list[set[int]]
+
+    def documents_of(self, name_idx: int) -> list[int]:
+        return [d for d, found in enumerate(self.docs) if name_idx in found]
+
+    def covered(self) -> set[int]:
+        return set().union(*self.docs) if self.docs else set()
+
+    def missing(self) -> list[str]:
+        hit = self.covered()
+        return [n for i, n in enumerate(self.names) if i not in hit]
+
+
+class SubstanceMatcher:
+    """물질 목록 → 한 번 컴파일. names[i]의 CAS 번호는 cas[i] (없으면 None)."""
+
+    def __init__(self, names: Sequence[str], cas: Sequence[str | None] | None = None):
+        self.names = list(names)
+        owners: dict[str, set[int]] = {}
+        for i, nm in enumerate(self.names):
+            terms = name_variants(nm) + cas_numbers(nm)
+            if cas is not None and cas[i]:
+                terms += cas_numbers(cas[i])
+            for t in terms:
+                owners.setdefault(t, set()).add(i)
+        self._ac = AhoCorasick(owners)
+        self._owners = [owners[k] for k in self._ac.keywords]
+        # CAS 번호 용어 → 경계 확인용 정규식
+        self._cas_check = {
+            ti: re.compile(rf"(?<!\d){re.escape(k)}(?!\d)")
+            for ti, k in enumerate(self._ac.keywords)
+            if _CAS.fullmatch(k)
+        }
+
+    def scan(self, text: str) -> set[int]:
+        """텍스트에 등장하는 물질 인덱스."""
+        text = text or ""
+        found: set[int] = set()
+        for ti in self._ac.find(normalize(text)):
+            # CAS 경계는 원문에서 확인 (공백을 지운 텍스트에서는 뒤의 숫자와 붙는다)
+            check = self._cas_check.get(ti)
+            if check is not None and not check.search(text):
+                continue
+            found |= self._owners[ti]
+        return found
+
+    def coverage(self, texts: Sequence[str]) -> Coverage:
+        return Coverage(self.names, [self.scan(t) for t in texts])
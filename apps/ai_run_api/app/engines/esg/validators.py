@@ -11,6 +11,9 @@ from __future__ import annotations
 from typing import Any
 import pandas as pd
 
+from app.engines.frame_memo import column, read_frame
+from app.engines.text_index import index_of
+
 # 20260130 이종헌 추가: df.columns 중 aliases에 해당하는 첫 컬럼명을 반환(대소문자/공백 무시).
 def _pick_col(df: pd.DataFrame, aliases: tuple[str, ...]) -> str | None:
     if df.empty:
@@ -42,13 +45,8 @@ def _spike_threshold(ratio: float) -> str | None:
 # ════════════════════════════════════════════════════════════
 
 def _esg_read_df(df_preview: str) -> pd.DataFrame:
-    import io
-    if not df_preview:
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(io.StringIO(df_preview))
-    except Exception:
-        return pd.DataFrame()
+    # submit 안에서는 같은 표를 validators / cross_validators가 한 번만 파싱한다 (engines/frame_memo.py)
+    return read_frame(df_preview)
 
 
 def _esg_validate_usage_basic(df: pd.DataFrame, value_col: str) -> list[str]:
@@ -61,7 +59,7 @@ def _esg_validate_usage_basic(df: pd.DataFrame, value_col: str) -> list[str]:
 
     # 음수/0 체크
     try:
-        s = pd.to_numeric(df[value_col], errors="coerce").dropna()
+        s = column(df, value_col, "numeric").dropna()
         if (s <= 0).any():
             reasons.append("E1_NEGATIVE_OR_ZERO")
     except Exception:
@@ -80,14 +78,14 @@ def _esg_validate_spike_daily(df: pd.DataFrame, time_col: str, value_col: str) -
 
     reasons: list[str] = []
     try:
-        ts = pd.to_datetime(df[time_col], errors="coerce")
-        v = pd.to_numeric(df[value_col], errors="coerce")
-        tmp = pd.DataFrame({"ts": ts, "v": v}).dropna()
-        if tmp.empty:
+        ts = column(df, time_col, "datetime")
+        v = column(df, value_col, "numeric")
+        ok = ts.notna() & v.notna()
+        if not ok.any():
             return []
 
-        tmp["d"] = tmp["ts"].dt.date
-        daily = tmp.groupby("d")["v"].sum().sort_index()
+        # 일 단위 합산 (dt.date의 파이썬 객체 대신 자정으로 내린 시각으로 묶는다)
+        daily = v[ok].groupby(ts[ok].dt.normalize()).sum().sort_index()
 
         # 최소 10건이 있어야 비교 가능
         if len(daily) < 10:
@@ -109,15 +107,19 @@ def _esg_validate_spike_daily(df: pd.DataFrame, time_col: str, value_col: str) -
     return reasons
 
 
-def _esg_validate_ethics_sections(pdf_text: str) -> list[str]:
-    """E8: 필수 섹션 키워드 존재 여부(비교적 단순)"""
-    if not pdf_text:
+def _esg_validate_ethics_sections(extracted: dict) -> list[str]:
+    """E8: 필수 섹션 키워드 존재 여부(비교적 단순). 찾은 키워드는 페이지와 함께 extras에."""
+    if not extracted.get("text"):
         return ["PARSE_FAILED"]
 
     must_keywords = [
         "부패", "금품", "이해충돌", "공정", "인권", "괴롭힘", "개인정보", "정보보호", "사고", "보호", "징계"
     ]
-    hit = sum(1 for k in must_keywords if k in pdf_text)
+    index = index_of(extracted)
+    hit = index.count(must_keywords)
+    cited = index.cite(must_keywords)
+    if cited:
+        extracted.setdefault("extras", {})["section_pages"] = cited
     if hit < 5:  # 데모용: 너무 엄격하지 않게
         return ["E8_SECTION_MISSING"]
     return []
@@ -222,7 +224,7 @@ def validate_slot(slot_name: str, file_type: str, extracted: dict) -> list[str]:
 
     # ── 윤리강령 텍스트 품질/섹션 ──────────────────────────
     elif (slot_name.startswith("esg.governance.ethics") or slot_name == "esg.ethics.code") and file_type == "pdf":
-        reasons += _esg_validate_ethics_sections(extracted.get("text", ""))
+        reasons += _esg_validate_ethics_sections(extracted)
 
     # ── 윤리 포스터 이미지/스캔본: OCR 실패 + blur ───────────
     elif (slot_name == "esg.governance.poster_image" or slot_name == "esg.ethics.poster.image") and file_type in ("image", "pdf"):
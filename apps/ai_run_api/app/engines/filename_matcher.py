@@ -0,0 +1,103 @@
+# app/engines/filename_matcher.py
+
+"""
+파일명 → 슬롯 매칭용 컴파일 도구 — 도메인 slots 모듈이 import 시 한 번 만든다.
+
+- AhoCorasick: 모든 슬롯의 키워드를 하나의 오토마톤으로 묶어, 파일명을 한 번 훑어
+  등장한 키워드(부분 문자열) 집합을 구한다. `k in text`를 키워드마다 반복하는 것과 결과가 같다.
+- RegexSet: 모든 슬롯의 정규식을 하나의 alternation으로 합쳐 먼저 한 번 검사한다.
+  대부분의 파일명(어느 슬롯에도 안 맞음)은 이 한 번으로 끝나고, 맞는 경우에만 슬롯 순서대로
+  어느 슬롯인지 가린다 (alternation은 가장 왼쪽 위치의 매칭을 돌려주므로 슬롯 우선순위를 직접 알 수 없다).
+  esg 점수 계산(슬롯별 정규식 보너스)에서 쓴다. 정규식만으로 슬롯을 정하는 safety/compliance는 슬롯 순서대로
+  search하는 기존 방식이 측정상 더 빠르거나 같아 그대로 둔다 (benchmarks/filename_matcher.py).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Iterable, Sequence
+
+
+class AhoCorasick:
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: list[str] = list(dict.fromkeys(keywords))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for i, kw in enumerate(self.keywords):
+            self._insert(kw, i)
+        self._link()
+
+    def _insert(self, kw: str, idx: int) -> None:
+        state = 0
+        for ch in kw:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (idx,)
+
+    def _link(self) -> None:
+        # BFS로 실패 링크 계산 — 실패 상태의 출력을 합쳐 두어 탐색 중 링크를 따라갈 필요가 없게 한다
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0) if self._goto[f].get(ch, 0) != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[int]:
+        """text에 부분 문자열로 등장하는 키워드 인덱스 집합."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+def _scoped(pat: re.Pattern[str]) -> str:
+    """패턴 앞의 전역 인라인 플래그를 범위 플래그 그룹으로 바꾼다 ((?i)abc → (?i:abc))."""
+    src = pat.pattern
+    m = re.match(r"^\(\?([aiLmsux]+)\)", src)
+    if m:
+        return f"(?{m.group(1)}:{src[m.end():]})"
+    flags = "i" if pat.flags & re.IGNORECASE else ""
+    return f"(?{flags}:{src})" if flags else f"(?:{src})"
+
+
+class RegexSet:
+    def __init__(self, patterns: Sequence[Sequence[re.Pattern[str]]]):
+        """patterns[i]: 슬롯 i의 정규식 목록 (하나라도 맞으면 슬롯 i 매칭)."""
+        alts = [_scoped(p) for pats in patterns for p in pats]
+        self._any = re.compile("|".join(alts)).search if alts else None
+        # (슬롯, 정규식 search) — 슬롯 순서대로 평탄화
+        self._searches = [(i, p.search) for i, pats in enumerate(patterns) for p in pats]
+
+    def matches(self, text: str) -> list[int]:
+        """패턴이 맞는 슬롯 인덱스 (오름차순)."""
+        if self._any is None or self._any(text) is None:
+            return []
+        return sorted({i for i, search in self._searches if search(text)})
+
+    def first(self, text: str) -> int | None:
+        """패턴이 맞는 첫 슬롯 (슬롯 순서 우선)."""
+        if self._any is None or self._any(text) is None:
+            return None
+        for i, search in self._searches:
+            if search(text):
+                return i
+        return None
@@ -0,0 +1,92 @@
+# app/engines/frame_memo.py
+
+"""
+표 파싱 메모 — 같은 submit 안에서 validators / cross_validators가 같은 표(df_preview)를 여러 번
+파싱하고 같은 열을 여러 번 변환하지 않도록 한다.
+
+- use_frame_memo(): submit 단위 메모 (contextvar). 메모가 없으면 매번 파싱한다 (결과는 같다).
+- read_frame(df_preview): CSV 문자열 → DataFrame. 파싱 실패/빈 입력은 빈 DataFrame.
+  메모된 DataFrame과 열은 여러 검증이 함께 쓰므로 읽기 전용으로 다룬다 (변경이 필요하면 복사).
+  검증은 작업 스레드에서 동시에 돌 수 있다 — 같은 표를 두 스레드가 함께 파싱해도 먼저 넣은 쪽을 쓴다.
+- column(df, col, kind): 변환된 열
+    "datetime"  pd.to_datetime(errors="coerce")
+    "numeric"   pd.to_numeric(errors="coerce")
+    "text"      문자열 + 앞뒤 공백 제거, 빈 셀(NaN/None)은 ""
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Literal
+
+import pandas as pd
+
+ColumnKind = Literal["datetime", "numeric", "text"]
+
+
+class _FrameMemo:
+    def __init__(self) -> None:
+        self.frames: dict[str, pd.DataFrame] = {}
+        self.frame_ids: set[int] = set()
+        # (id(df), 열, 변환) → 열. frames가 DataFrame을 잡고 있어 id가 재사용되지 않는다
+        self.columns: dict[tuple[int, str, str], pd.Series] = {}
+        self.lock = threading.Lock()
+
+
+_memo: ContextVar[_FrameMemo | None] = ContextVar("frame_memo", default=None)
+
+
+@contextmanager
+def use_frame_memo() -> Iterator[None]:
+    token = _memo.set(_FrameMemo())
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def _parse(df_preview: str) -> pd.DataFrame:
+    if not df_preview:
+        return pd.DataFrame()
+    try:
+        return pd.read_csv(io.StringIO(df_preview))
+    except Exception:
+        return pd.DataFrame()
+
+
+def read_frame(df_preview: str) -> pd.DataFrame:
+    memo = _memo.get()
+    if memo is None:
+        return _parse(df_preview)
+    df = memo.frames.get(df_preview)
+    if df is None:
+        parsed = _parse(df_preview)
+        with memo.lock:
+            df = memo.frames.setdefault(df_preview, parsed)
+            memo.frame_ids.add(id(df))
+    return df
+
+
+def _convert(s: pd.Series, kind: ColumnKind) -> pd.Series:
+    if kind == "datetime":
+        return pd.to_datetime(s, errors="coerce")
+    if kind == "numeric":
+        return pd.to_numeric(s, errors="coerce")
+    return s.astype(str).str.strip().where(s.notna(), "")
+
+
+def column(df: pd.DataFrame, col: str, kind: ColumnKind) -> pd.Series:
+    memo = _memo.get()
+    key = (id(df), col, kind)
+    # 메모에 있는 DataFrame의 열만 메모한다 (임시 DataFrame의 id는 재사용될 수 있다)
+    if memo is None or id(df) not in memo.frame_ids:
+        return _convert(df[col], kind)
+    s = memo.columns.get(key)
+    if s is None:
+        converted = _convert(df[col], kind)
+        with memo.lock:
+            s = memo.columns.setdefault(key, converted)
+    return s
@@ -2,11 +2,17 @@
 
 """
 도메인별 엔진 디스패치 — slots/rules를 domain 문자열로 가져온다.
+
+교차검증 레지스트리: 도메인 cross_validators 모듈은 CROSS_CHECKS(CrossCheck 목록)로 검증마다
+입력 슬롯을 선언한다. 입력이 겹치지 않는 검증은 서로 독립이므로 submit에서 동시에 실행하고,
+증분 재제출 때는 입력 슬롯이 바뀐 검증만 다시 실행한다.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
 
 from app.engines.safety import slots as safety_slots, rules as safety_rules
 from app.engines.compliance import slots as comp_slots, rules as comp_rules
@@ -34,3 +40,27 @@ def get_slots_module(domain: str):
 
 def get_rules_module(domain: str):
     return _RULE_MODULES[domain]
+
+
+@dataclass(frozen=True)
+class CrossCheck:
+    """교차검증 1개. name = 결과 slot_name (한 검증이 같은 slot_name 결과를 여러 개 낼 수 있다)."""
+
+    name: str
+    # 읽는 슬롯 — 슬롯 이름 후보(별칭) 포함
+    inputs: tuple[str, ...]
+    # extractions_by_slot → [{slot_name, reasons, verdict, extras}]
+    run: Callable[[dict[str, list[dict]]], list[dict[str, Any]]]
+
+
+def get_cross_checks(domain: str) -> list[CrossCheck]:
+    """도메인 cross_validators 모듈의 CROSS_CHECKS (모듈이 없으면 [])."""
+    name = f"app.engines.{domain}.cross_validators"
+    try:
+        mod = importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        # 모듈 안의 import 실패(의존성 누락)는 숨기지 않는다
+        if e.name != name:
+            raise
+        return []
+    return list(getattr(mod, "CROSS_CHECKS", []))
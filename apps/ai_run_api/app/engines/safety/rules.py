@@ -2,6 +2,7 @@
 
 - EXPECTED_HEADERS: 엑셀 슬롯의 필수 헤더
 - REASON_CODES: 파이프라인에서 실제 생성되는 사유 코드 + 메시지
+- SLOT_KEYWORDS: 슬롯별 본문 핵심 키워드 (LLM 입력 선별 시 페이지/문단 점수)
 """
 
 from __future__ import annotations
@@ -33,6 +34,7 @@ REASON_CODES: dict[str, str] = {
     # ── 공통 (extractors/pipeline) ──
     "MISSING_SLOT":       "필수 슬롯 누락",
     "HEADER_MISMATCH":    "필수 헤더 누락",
+    "PARSE_FAILED":       "파일 파싱 실패(손상/형식 오류)",
     "EMPTY_TABLE":        "표/데이터 행이 비어있음",
     "DATE_MISMATCH":      "점검/교육/작성일이 제출 기간 밖",
     "SIGNATURE_MISSING":  "확인 서명란 미기재",
@@ -68,3 +70,16 @@ REASON_CODES: dict[str, str] = {
     "CROSS_ATTENDANCE_PARSE_FAILED":  "출석부에서 인원수 추출 실패",
     "CROSS_PHOTO_COUNT_FAILED":       "교육사진에서 인원수 감지 실패",
 }
+
+
+# =========================
+# 3) 슬롯별 본문 핵심 키워드 — LLM 입력 선별용 (llm/context_packer.py)
+# =========================
+SLOT_KEYWORDS: dict[str, list[str]] = {
+    "safety.education.status": ["이수율", "이수인원", "대상인원", "미이수", "교육"],
+    "safety.fire.inspection": ["소화기", "소화전", "감지기", "점검결과", "불량", "조치", "총평"],
+    "safety.risk.assessment": ["유해위험요인", "위험성", "감소대책", "개선", "담당자", "점검일"],
+    "safety.management.system": ["조직", "책임", "권한", "위험성평가", "비상", "사고", "교육", "개선", "조치"],
+    "safety.education.attendance": ["출석", "참석자", "성명", "서명", "교육일시", "교육명"],
+    "safety.tbm": ["작업내용", "참석자", "위험요인", "TBM"],
+}
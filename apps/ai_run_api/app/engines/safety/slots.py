@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 import re
-from typing import NamedTuple
+from typing import NamedTuple, Sequence
 
 
 class SlotDef(NamedTuple):
@@ -121,3 +121,8 @@ def match_filename_to_slot(filename: str) -> tuple[str, float] | None:
                 base = 0.88 if slot.required else 0.85
                 return slot.name, base
     return None
+
+
+def match_filenames(filenames: Sequence[str]) -> list[tuple[str, float] | None]:
+    """여러 파일명을 한 번에 분류 (ZIP 묶음/일괄 업로드)."""
+    return [match_filename_to_slot(f) for f in filenames]
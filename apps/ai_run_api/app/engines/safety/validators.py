@@ -11,6 +11,8 @@ from datetime import date
 
 import pandas as pd
 
+from app.engines.text_index import index_of
+
 
 # ── 교육 이수현황 (safety.education.status) ──────────────
 _EDU_RATE_THRESHOLD = 80.0  # 이수율 기준(%)
@@ -147,13 +149,16 @@ _REQUIRED_SECTIONS = {
 }
 
 
-def _validate_management_system_pdf(text: str) -> list[str]:
-    """안전보건관리체계 PDF — 필수 섹션 존재 여부 검사."""
+def _validate_management_system_pdf(extracted: dict) -> list[str]:
+    """안전보건관리체계 PDF — 필수 섹션 존재 여부 검사. 찾은 섹션 키워드는 페이지와 함께 extras에."""
     reasons: list[str] = []
-    text_lower = text.lower()
+    index = index_of(extracted)
     for reason_code, keywords in _REQUIRED_SECTIONS.items():
-        if not any(kw in text_lower for kw in keywords):
+        if not index.any_of(keywords):
             reasons.append(reason_code)
+    cited = index.cite(kw for keywords in _REQUIRED_SECTIONS.values() for kw in keywords)
+    if cited:
+        extracted.setdefault("extras", {})["section_pages"] = cited
     return reasons
 
 
@@ -215,7 +220,7 @@ def validate_slot(
         extra_reasons = _validate_risk_assessment(extracted, extracted.get("df_preview", ""))
 
     elif slot_name == "safety.management.system" and file_type == "pdf":
-        extra_reasons = _validate_management_system_pdf(extracted.get("text", ""))
+        extra_reasons = _validate_management_system_pdf(extracted)
         # 관리체계 매뉴얼은 서명란 검사 불필요 → extractor가 붙인 SIGNATURE_MISSING 제거
         if "reasons" in extracted:
             extracted["reasons"] = [r for r in extracted["reasons"] if r != "SIGNATURE_MISSING"]
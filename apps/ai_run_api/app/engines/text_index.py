@@ -0,0 +1,123 @@
+# app/engines/text_index.py
+
+"""
+문서 키워드 색인 — 도메인 validators / cross_validators가 같은 문서를 키워드마다 다시 훑지 않도록
+문서 1개당 한 번 만든 색인을 함께 쓴다.
+
+- 정규화: 소문자 + 공백/줄바꿈 제거 ("위험성 평가", 줄바꿈으로 끊긴 "지연\n이자"도 같은 키워드로 본다)
+- 색인: 정규화 텍스트(문서당 한 번)와 키워드별 조회 결과(등장 페이지). 조회는 정규화 텍스트에 str.find
+  (C 구현)로 하고, 결과가 남아 다른 validator의 같은 키워드 조회는 사전 조회 한 번.
+  글자 n-gram 위치 색인은 만들지 않는다 — 파이썬 dict 색인은 만드는 시간/메모리가 validator들의 조회 합계보다
+  크다 (benchmarks/text_index.py).
+- 페이지: PDF 추출 결과의 page_starts(페이지별 시작 위치)가 있으면 등장 페이지(1부터)를 돌려준다 —
+  근거 표시(cite)용. 없으면(이미지 OCR, OCR로 대체된 PDF 등) 모두 1페이지.
+- 색인은 텍스트 객체 기준 LRU로 보관한다 (추출 레코드는 JSON으로 저장되므로 레코드에 넣지 않는다).
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+_WS = re.compile(r"\s+")
+_CACHE_SIZE = 64
+
+
+def normalize(text: str) -> str:
+    return _WS.sub("", text.lower())
+
+
+class TextIndex:
+    def __init__(self, text: str, page_starts: list[int] | None = None):
+        # 원문 위치 → 정규화 위치로 페이지 경계를 옮긴다
+        starts = sorted(page_starts or [0])
+        self._page_starts: list[int] = []
+        norm: list[str] = []
+        n = 0
+        prev = 0
+        for start in [*starts[1:], len(text)]:
+            self._page_starts.append(n)
+            piece = normalize(text[prev:start])
+            norm.append(piece)
+            n += len(piece)
+            prev = start
+        self.text = "".join(norm)
+        self._hits: dict[str, list[int]] = {}
+
+    def _pages_of(self, kw: str) -> list[int]:
+        t, starts = self.text, self._page_starts
+        pages: list[int] = []
+        i = t.find(kw)
+        while i >= 0:
+            page = bisect.bisect_right(starts, i)
+            pages.append(page)
+            if page >= len(starts):
+                break
+            # 같은 페이지의 나머지 등장은 건너뛴다
+            i = t.find(kw, max(i + 1, starts[page]))
+        return pages
+
+    def pages(self, keyword: str) -> list[int]:
+        """키워드가 등장하는 페이지(1부터, 오름차순). 없으면 []."""
+        kw = normalize(keyword)
+        if not kw:
+            return []
+        hit = self._hits.get(kw)
+        if hit is None:
+            hit = self._hits[kw] = self._pages_of(kw)
+        return hit
+
+    def contains(self, keyword: str) -> bool:
+        return bool(self.pages(keyword))
+
+    def any_of(self, keywords: Iterable[str]) -> bool:
+        return any(self.pages(k) for k in keywords)
+
+    def count(self, keywords: Iterable[str]) -> int:
+        """등장하는 키워드 수."""
+        return sum(1 for k in keywords if self.pages(k))
+
+    def missing(self, keywords: Iterable[str]) -> list[str]:
+        return [k for k in keywords if not self.pages(k)]
+
+    def cite(self, keywords: Iterable[str]) -> str:
+        """등장한 키워드와 페이지 — "선급금 p.2, 지연이자 p.3,5" (없으면 "")."""
+        parts = []
+        seen: set[str] = set()
+        for k in keywords:
+            pages = self.pages(k)
+            if pages and normalize(k) not in seen:
+                seen.add(normalize(k))
+                parts.append(f"{k} p.{','.join(map(str, pages))}")
+        return ", ".join(parts)
+
+
+_CACHE: OrderedDict[tuple[str, tuple[int, ...]], TextIndex] = OrderedDict()
+_lock = threading.Lock()
+
+
+def index_text(text: str, page_starts: list[int] | None = None) -> TextIndex:
+    """텍스트 → 색인 (같은 텍스트는 LRU에서 재사용)."""
+    key = (text, tuple(page_starts or ()))
+    with _lock:
+        idx = _CACHE.get(key)
+        if idx is not None:
+            _CACHE.move_to_end(key)
+            return idx
+    idx = TextIndex(text, page_starts)
+    with _lock:
+        _CACHE[key] = idx
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return idx
+
+
+def index_of(extracted: dict) -> TextIndex:
+    """추출 레코드(text + page_starts) → 색인."""
+    text = extracted.get("text", "") or ""
+    if isinstance(text, list):
+        text = "\n".join(text)
+    return index_text(text, extracted.get("page_starts"))
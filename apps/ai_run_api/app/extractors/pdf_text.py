@@ -10,6 +10,7 @@ from datetime import date
 
 import fitz  # PyMuPDF
 
+from app.core import cancellation
 from app.extractors.ocr.clova_client import run_ocr
 
 DATE_RE = re.compile(r"(\d{4})[.\-/년](\d{1,2})[.\-/월](\d{1,2})")
@@ -40,38 +41,57 @@ def _has_signature_image(page: fitz.Page) -> bool:
     return False
 
 
-async def extract_pdf(
-    data: bytes,
-    period_start: date,
-    period_end: date,
-) -> dict:
-    """PDF에서 텍스트/날짜/서명 추출. 필요 시 OCR 수행.
+def read_text_layer(data: bytes) -> dict:
+    """PDF 텍스트 레이어만 읽는다 (동기, OCR 없음).
 
-    Returns dict with keys:
-        text, dates, date_in_range, signature_detected, ocr_applied, reasons
+    Returns dict with keys: page_texts, signature_detected, needs_ocr
     """
     doc = fitz.open(stream=data, filetype="pdf")
 
     page_texts: list[str] = []
     sig_detected = False
     for page in doc:
+        # 스레드에서 실행 — 요청이 취소되면 남은 페이지는 읽지 않는다
+        cancellation.check("pdf_layer")
         page_texts.append(page.get_text())
         if not sig_detected and _has_signature_image(page):
             sig_detected = True
     doc.close()
 
-    full_text = "\n".join(page_texts)
+    return {
+        "page_texts": page_texts,
+        "signature_detected": sig_detected,
+        "needs_ocr": _needs_ocr(page_texts),
+    }
+
+
+def build_pdf_result(
+    layer: dict,
+    ocr_text: str | None,
+    ocr_failed: bool,
+    period_start: date,
+    period_end: date,
+) -> dict:
+    """텍스트 레이어 + (선택) OCR 결과를 합쳐 extract_pdf와 동일한 dict를 만든다."""
+    full_text = "\n".join(layer["page_texts"])
+    # 페이지별 시작 위치 — 키워드 근거 페이지 표시용 (engines/text_index.py)
+    page_starts: list[int] = []
+    pos = 0
+    for t in layer["page_texts"]:
+        page_starts.append(pos)
+        pos += len(t) + 1
+    sig_detected = layer["signature_detected"]
     reasons: list[str] = []
     ocr_applied = False
 
-    # 조건부 OCR
-    if _needs_ocr(page_texts):
-        try:
-            ocr_text = await run_ocr(data, "pdf")
-            full_text = ocr_text if len(ocr_text) > len(full_text) else full_text
-            ocr_applied = True
-        except Exception:
-            reasons.append("OCR_FAILED")
+    if ocr_failed:
+        reasons.append("OCR_FAILED")
+    elif ocr_text is not None:
+        if len(ocr_text) > len(full_text):
+            # OCR 텍스트는 페이지 구분이 없다
+            full_text = ocr_text
+            page_starts = []
+        ocr_applied = True
 
     dates = _extract_dates(full_text)
 
@@ -99,4 +119,29 @@ async def extract_pdf(
         "signature_detected": sig_detected,
         "ocr_applied": ocr_applied,
         "reasons": reasons,
+        "page_starts": page_starts,
     }
+
+
+async def extract_pdf(
+    data: bytes,
+    period_start: date,
+    period_end: date,
+) -> dict:
+    """PDF에서 텍스트/날짜/서명 추출. 필요 시 OCR 수행.
+
+    Returns dict with keys:
+        text, dates, date_in_range, signature_detected, ocr_applied, reasons, page_starts
+    """
+    layer = read_text_layer(data)
+
+    ocr_text: str | None = None
+    ocr_failed = False
+    # 조건부 OCR
+    if layer["needs_ocr"]:
+        try:
+            ocr_text = await run_ocr(data, "pdf")
+        except Exception:
+            ocr_failed = True
+
+    return build_pdf_result(layer, ocr_text, ocr_failed, period_start, period_end)
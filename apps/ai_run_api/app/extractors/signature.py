@@ -0,0 +1,123 @@
+"""내용 서명 — preview 슬롯 추정용으로 파일의 앞부분만 싸게 읽는다 (OCR/LLM 없음).
+
+- PDF: 첫 페이지 텍스트 레이어
+- XLSX/XLS: 첫 시트 앞 _TABLE_ROWS행 (머리 행이 첫 줄이 아닐 수 있다)
+- CSV: 앞부분 몇 KB의 앞 _TABLE_ROWS줄
+- 이미지: 메타데이터 텍스트 (JPEG EXIF 설명/제목/키워드·COM, PNG tEXt/iTXt)
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+
+import fitz  # PyMuPDF
+import pandas as pd
+
+_TABLE_ROWS = 5
+_TEXT_MAX_CHARS = 4000
+
+# EXIF IFD0 텍스트 태그: ImageDescription, XPTitle, XPComment, XPKeywords, XPSubject
+_EXIF_ASCII_TAGS = {0x010E}
+_EXIF_UTF16_TAGS = {0x9C9B, 0x9C9C, 0x9C9E, 0x9C9F}
+
+
+def pdf_first_page(data: bytes) -> str:
+    doc = fitz.open(stream=data, filetype="pdf")
+    try:
+        return doc[0].get_text()[:_TEXT_MAX_CHARS] if doc.page_count else ""
+    finally:
+        doc.close()
+
+
+def table_head(data: bytes, ext: str) -> str:
+    if ext in (".xls", ".xlsx"):
+        df = pd.read_excel(io.BytesIO(data), header=None, nrows=_TABLE_ROWS)
+        return "\n".join(" ".join(str(v) for v in row if pd.notna(v)) for row in df.itertuples(index=False))
+    for enc in ("utf-8-sig", "cp949"):
+        try:
+            text = data.decode(enc)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = data.decode("utf-8", errors="ignore")
+    return "\n".join(text.splitlines()[:_TABLE_ROWS])
+
+
+def _exif_text(tiff: bytes) -> list[str]:
+    if len(tiff) < 8 or tiff[:2] not in (b"II", b"MM"):
+        return []
+    end = "<" if tiff[:2] == b"II" else ">"
+    (ifd,) = struct.unpack_from(end + "I", tiff, 4)
+    if ifd + 2 > len(tiff):
+        return []
+    (count,) = struct.unpack_from(end + "H", tiff, ifd)
+    out: list[str] = []
+    for k in range(count):
+        off = ifd + 2 + 12 * k
+        if off + 12 > len(tiff):
+            break
+        tag, _typ, n = struct.unpack_from(end + "HHI", tiff, off)
+        if tag not in _EXIF_ASCII_TAGS and tag not in _EXIF_UTF16_TAGS:
+            continue
+        if n <= 4:
+            raw = tiff[off + 8:off + 8 + n]
+        else:
+            (ptr,) = struct.unpack_from(end + "I", tiff, off + 8)
+            raw = tiff[ptr:ptr + n]
+        if tag in _EXIF_UTF16_TAGS:
+            out.append(raw.decode("utf-16-le", errors="ignore").strip("\x00 "))
+        else:
+            out.append(raw.decode("utf-8", errors="ignore").strip("\x00 "))
+    return [t for t in out if t]
+
+
+def _jpeg_text(head: bytes) -> list[str]:
+    out: list[str] = []
+    i = 2
+    while i + 4 <= len(head) and head[i] == 0xFF:
+        marker = head[i + 1]
+        if marker == 0xDA:          # 스캔 시작 — 메타데이터 끝
+            break
+        (seg,) = struct.unpack_from(">H", head, i + 2)
+        body = head[i + 4:i + 2 + seg]
+        if marker == 0xE1 and body.startswith(b"Exif\x00\x00"):
+            out += _exif_text(body[6:])
+        elif marker == 0xFE:        # COM
+            out.append(body.decode("utf-8", errors="ignore"))
+        i += 2 + seg
+    return out
+
+
+def _png_text(head: bytes) -> list[str]:
+    out: list[str] = []
+    i = 8
+    while i + 8 <= len(head):
+        length, kind = struct.unpack_from(">I4s", head, i)
+        body = head[i + 8:i + 8 + length]
+        if kind == b"tEXt":
+            out.append(body.split(b"\x00", 1)[-1].decode("latin-1", errors="ignore"))
+        elif kind == b"iTXt":
+            # keyword\0 flag method lang\0 translated\0 text
+            parts = body.split(b"\x00", 1)[-1][2:].split(b"\x00", 2)
+            if len(parts) == 3:
+                out.append(parts[2].decode("utf-8", errors="ignore"))
+        elif kind in (b"IDAT", b"IEND"):
+            break
+        i += 12 + length
+    return out
+
+
+def image_metadata(head: bytes) -> str:
+    """이미지 앞부분 → 메타데이터 텍스트 (없으면 "")."""
+    try:
+        if head.startswith(b"\xff\xd8\xff"):
+            parts = _jpeg_text(head)
+        elif head.startswith(b"\x89PNG\r\n\x1a\n"):
+            parts = _png_text(head)
+        else:
+            parts = []
+    except struct.error:
+        parts = []
+    return "\n".join(parts)[:_TEXT_MAX_CHARS]
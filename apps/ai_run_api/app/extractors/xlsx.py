@@ -11,7 +11,7 @@ import pandas as pd
 DATE_RE = re.compile(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
 
 
-def _read_df(data: bytes, ext: str) -> pd.DataFrame:
+def read_table(data: bytes, ext: str) -> pd.DataFrame:
     buf = io.BytesIO(data)
     if ext in (".xls", ".xlsx"):
         return pd.read_excel(buf)
@@ -27,19 +27,13 @@ def _extract_dates_from_df(df: pd.DataFrame) -> list[str]:
     return dates
 
 
-async def extract_xlsx(
-    data: bytes,
-    ext: str,
+def check_table(
+    df: pd.DataFrame,
     expected_headers: list[str],
     period_start: date,
     period_end: date,
 ) -> dict:
-    """XLSX/CSV에서 헤더/날짜 검증.
-
-    Returns dict with keys:
-        df_preview, dates, date_in_range, reasons
-    """
-    df = _read_df(data, ext)
+    """읽어 둔 DataFrame의 헤더/날짜 검증 (동기). extract_xlsx와 동일한 dict."""
     reasons: list[str] = []
 
     # 헤더 검증
@@ -71,3 +65,18 @@ async def extract_xlsx(
         "date_in_range": date_in_range,
         "reasons": reasons,
     }
+
+
+async def extract_xlsx(
+    data: bytes,
+    ext: str,
+    expected_headers: list[str],
+    period_start: date,
+    period_end: date,
+) -> dict:
+    """XLSX/CSV에서 헤더/날짜 검증.
+
+    Returns dict with keys:
+        df_preview, dates, date_in_range, reasons
+    """
+    return check_table(read_table(data, ext), expected_headers, period_start, period_end)
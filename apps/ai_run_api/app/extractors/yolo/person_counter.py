@@ -1,18 +1,29 @@
-"""YOLO 기반 인원수 감지 — yolo26n_crowdhuman_fewshot.pt."""
+"""YOLO 기반 인원수 감지 — yolo26n_crowdhuman_fewshot.pt.
+
+모델은 프로세스에 1개이고 생성/추론 모두 스레드 안전하지 않으므로 전용 스레드 1개에서만 실행한다
+(count_persons_async). 기본 executor 스레드가 앞선 추론을 기다리며 묶이지 않고,
+분석기 쪽은 차례를 기다린 뒤 추론 시간만 타임아웃으로 잰다 (pipeline/analyzers.py serial).
+"""
 
 from __future__ import annotations
 
-import os
-import tempfile
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ultralytics import YOLO
 
+from app.core import cancellation
+
 _MODEL_PATH = Path(__file__).parent / "yolo26n_crowdhuman_fewshot.pt"
 _model: YOLO | None = None
+# 모델 생성 + 추론 전용 스레드 — 이 스레드에서만 _model에 접근한다
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo")
 
 
 def _get_model() -> YOLO:
+    """_executor 스레드에서만 호출."""
     global _model
     if _model is None:
         _model = YOLO(str(_MODEL_PATH))
@@ -20,14 +31,17 @@ def _get_model() -> YOLO:
 
 
 def count_persons(image_data: bytes) -> int:
-    """이미지 바이트 → person class 감지 수 반환."""
-    tmp = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-    try:
-        tmp.write(image_data)
-        tmp.close()
-        model = _get_model()
-        results = model(tmp.name, verbose=False)
-        count = sum(1 for box in results[0].boxes if int(box.cls) == 0)
-        return count
-    finally:
-        os.unlink(tmp.name)
+    """이미지 바이트 → person class 감지 수 반환. _executor 스레드에서 실행된다."""
+    cancellation.check("image_yolo")
+    # 요청 취소로 스레드가 버려져도 임시 파일은 요청 종료 시 정리된다
+    with cancellation.temp_file(suffix=".jpg") as path:
+        Path(path).write_bytes(image_data)
+        results = _get_model()(path, verbose=False)
+        return sum(1 for box in results[0].boxes if int(box.cls) == 0)
+
+
+async def count_persons_async(image_data: bytes) -> int:
+    """count_persons를 전용 스레드에서 실행 (요청 contextvar 복사 — 취소 scope/임시 파일)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_executor, ctx.run, count_persons, image_data)
@@ -0,0 +1,278 @@
+"""LLM 일괄 요청 — 같은 프롬프트의 작은 문서/사진 여러 개를 한 요청으로 묶는다 (submit 요청 단위).
+
+- 문서 보강(pdf_llm / xlsx_llm)은 enrich_text()로 요청한다. 입력이 작으면(LLM_BATCH_DOC_MAX_TOKENS 이하)
+  같은 (call, system prompt) 그룹에 모아 두었다가
+  * 문서 수가 LLM_BATCH_MAX_DOCS에 닿거나
+  * 입력 토큰 합이 LLM_BATCH_MAX_INPUT_TOKENS를 넘기게 되거나
+  * 첫 문서가 들어온 뒤 LLM_BATCH_LINGER_SEC가 지나면
+  한 번에 보낸다. 응답은 {"results": {"<doc id>": {...}}} — 문서별 JSON.
+- 응답은 call별 모델(llm/schemas.RESPONSE_MODELS)로 형식을 강제·검증해 모델 객체로 돌려준다.
+- 사진 Vision(image_vision)은 enrich_image()로 요청한다. 같은 슬롯 사진을 최대 VISION_BATCH_MAX_IMAGES장씩
+  한 요청으로 보내고, 묶어 보낼 때는 긴 변 VISION_BATCH_MAX_SIDE_PX로 축소한다.
+- 일괄 응답 파싱 실패/누락 항목은 개별 호출(사진은 원본)로 폴백한다. 요청 자체의 실패(타임아웃, 429/5xx 등
+  — 재시도는 OpenAI SDK가 이미 한다)는 묶인 모든 항목에 그대로 전달한다 — 과부하 중에 항목 수만큼 다시 보내지 않도록.
+- submit 밖(배처 미설정)이나 큰 문서는 바로 개별 호출.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterator
+
+from pydantic import BaseModel
+
+from app.core import metrics
+from app.core.config import (
+    LLM_BATCH_DOC_MAX_TOKENS,
+    LLM_BATCH_ENABLED,
+    LLM_BATCH_LINGER_SEC,
+    LLM_BATCH_MAX_DOCS,
+    LLM_BATCH_MAX_INPUT_TOKENS,
+    VISION_BATCH_MAX_IMAGES,
+    VISION_BATCH_MAX_SIDE_PX,
+)
+from app.llm.client import (
+    ask_llm,
+    ask_llm_vision,
+    ask_llm_vision_multi,
+    load_json,
+    parse_structured,
+    validate_structured,
+)
+from app.llm.images import downscale
+from app.llm.prompts import BATCH_IMAGE_SUFFIX, BATCH_TEXT_SUFFIX
+from app.llm.schemas import RESPONSE_MODELS, batch_response_format, response_format
+from app.llm.tokens import count_tokens
+
+_BATCHES = metrics.counter("ai_run_llm_batches_total", "Batched LLM requests by call site")
+_BATCHED_DOCS = metrics.counter(
+    "ai_run_llm_batched_docs_total", "Documents/images sent in batched LLM requests"
+)
+_BATCH_FALLBACKS = metrics.counter(
+    "ai_run_llm_batch_fallbacks_total", "Documents/images re-sent individually after a batch parse failure"
+)
+_BATCH_ERRORS = metrics.counter(
+    "ai_run_llm_batch_errors_total", "Batched LLM requests that failed (error passed to every item) by call and type"
+)
+
+
+@dataclass
+class _Item:
+    # 텍스트: user 메시지 / 사진: (bytes, format)
+    user: str = ""
+    tokens: int = 0
+    image: tuple[bytes, str] | None = None
+    # 일괄 요청 대기 중인 항목만 — 결과를 받을 future
+    future: asyncio.Future | None = None
+
+
+@dataclass
+class _Group:
+    call: str
+    system: str
+    # 사진 그룹: 모든 사진에 공통인 user 프롬프트
+    user_text: str = ""
+    is_image: bool = False
+    items: list[_Item] = field(default_factory=list)
+    tokens: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+    @property
+    def max_items(self) -> int:
+        return VISION_BATCH_MAX_IMAGES if self.is_image else LLM_BATCH_MAX_DOCS
+
+    @property
+    def model(self) -> type[BaseModel]:
+        return RESPONSE_MODELS[self.call]
+
+
+async def _single(group: _Group, item: _Item) -> BaseModel:
+    fmt = response_format(group.model)
+    if item.image is not None:
+        data, image_format = item.image
+        raw = await ask_llm_vision(
+            group.system, group.user_text, data, image_format, call=group.call, response_format=fmt
+        )
+    else:
+        raw = await ask_llm(group.system, item.user, heavy=False, call=group.call, response_format=fmt)
+    return parse_structured(raw, group.model, call=group.call)
+
+
+class EnrichmentBatcher:
+    def __init__(self) -> None:
+        self._groups: dict[tuple, _Group] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def enrich_text(self, call: str, system: str, user: str) -> BaseModel:
+        tokens = count_tokens(user)
+        if tokens > LLM_BATCH_DOC_MAX_TOKENS:
+            return await _single(_Group(call, system), _Item(user=user))
+
+        key = ("text", call, system)
+        group = self._groups.get(key)
+        if group is not None and group.tokens + tokens > LLM_BATCH_MAX_INPUT_TOKENS:
+            self._flush(key)
+        group = self._open(key, _Group(call, system))
+        return await self._add(key, group, user=user, tokens=tokens)
+
+    async def enrich_image(
+        self, call: str, system: str, user_text: str, data: bytes, image_format: str, slot_name: str
+    ) -> BaseModel:
+        key = ("image", call, system, user_text, slot_name)
+        group = self._open(key, _Group(call, system, user_text=user_text, is_image=True))
+        return await self._add(key, group, image=(data, image_format))
+
+    def _open(self, key: tuple, new: _Group) -> _Group:
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = new
+            group.timer = asyncio.get_running_loop().call_later(LLM_BATCH_LINGER_SEC, self._flush, key)
+        return group
+
+    async def _add(self, key: tuple, group: _Group, **item_fields) -> BaseModel:
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        item = _Item(future=fut, **item_fields)
+        group.items.append(item)
+        group.tokens += item.tokens
+        if len(group.items) >= group.max_items:
+            self._flush(key)
+        return await fut
+
+    def _flush(self, key: tuple) -> None:
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        if group.timer is not None:
+            group.timer.cancel()
+        task = asyncio.create_task(self._dispatch(group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, group: _Group) -> None:
+        # 호출 측이 타임아웃 등으로 이미 포기한 항목은 보내지 않는다
+        items = [it for it in group.items if not it.future.done()]
+        if not items:
+            return
+        if len(items) == 1:
+            await self._resolve_single(group, items[0])
+            return
+
+        fmt = batch_response_format(group.model, len(items))
+        _BATCHES.inc(call=group.call)
+        _BATCHED_DOCS.inc(len(items), call=group.call)
+        try:
+            if group.is_image:
+                images = await asyncio.gather(*(
+                    asyncio.to_thread(downscale, it.image[0], it.image[1], VISION_BATCH_MAX_SIDE_PX)
+                    for it in items
+                ))
+                raw = await ask_llm_vision_multi(
+                    group.system + BATCH_IMAGE_SUFFIX, group.user_text, list(images),
+                    call=group.call, response_format=fmt,
+                )
+            else:
+                docs = "\n".join(f'<doc id="{i}">\n{it.user}\n</doc>' for i, it in enumerate(items))
+                raw = await ask_llm(
+                    group.system + BATCH_TEXT_SUFFIX, docs, heavy=False, call=group.call, response_format=fmt
+                )
+        except Exception as exc:
+            _BATCH_ERRORS.inc(call=group.call, error=type(exc).__name__)
+            for it in items:
+                if not it.future.done():
+                    it.future.set_exception(exc)
+            return
+        try:
+            results = load_json(raw, call=group.call).get("results", {})
+        except ValueError:
+            results = {}
+        if not isinstance(results, dict):
+            results = {}
+
+        missing: list[_Item] = []
+        for i, it in enumerate(items):
+            res = results.get(str(i))
+            try:
+                parsed = validate_structured(res, group.model, call=group.call)
+            except ValueError:
+                missing.append(it)
+                continue
+            if not it.future.done():
+                it.future.set_result(parsed)
+        if missing:
+            _BATCH_FALLBACKS.inc(len(missing), call=group.call)
+            await asyncio.gather(*(self._resolve_single(group, it) for it in missing))
+
+    async def _resolve_single(self, group: _Group, item: _Item) -> None:
+        try:
+            res = await _single(group, item)
+        except Exception as exc:
+            if not item.future.done():
+                item.future.set_exception(exc)
+            return
+        if not item.future.done():
+            item.future.set_result(res)
+
+    async def close(self) -> None:
+        """submit 종료 — 기다리는 호출 측이 없으므로 모은 그룹은 보내지 않고, 진행 중인 일괄 요청은 취소."""
+        for group in self._groups.values():
+            if group.timer is not None:
+                group.timer.cancel()
+            for it in group.items:
+                if it.future is not None and not it.future.done():
+                    it.future.cancel()
+        self._groups.clear()
+        for t in list(self._tasks):
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_current: ContextVar[EnrichmentBatcher | None] = ContextVar("llm_batcher", default=None)
+
+
+def new_batcher() -> EnrichmentBatcher | None:
+    return EnrichmentBatcher() if LLM_BATCH_ENABLED else None
+
+
+@contextmanager
+def attach_batcher(batcher: EnrichmentBatcher | None) -> Iterator[None]:
+    """이미 만든 배처를 현재 context에 설정만 한다 (닫지 않는다 — 만든 쪽이 close)."""
+    token = _current.set(batcher)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@asynccontextmanager
+async def use_batcher() -> AsyncIterator[EnrichmentBatcher | None]:
+    batcher = new_batcher()
+    if batcher is None:
+        yield None
+        return
+    try:
+        with attach_batcher(batcher):
+            yield batcher
+    finally:
+        await batcher.close()
+
+
+async def enrich_text(call: str, system: str, user: str) -> BaseModel:
+    """문서 1개 light LLM 보강 → 응답 모델. submit 중이면 일괄 요청에 합류."""
+    batcher = _current.get()
+    if batcher is None:
+        return await _single(_Group(call, system), _Item(user=user))
+    return await batcher.enrich_text(call, system, user)
+
+
+async def enrich_image(
+    call: str, system: str, user_text: str, data: bytes, image_format: str, slot_name: str
+) -> BaseModel:
+    """사진 1장 Vision 분석 → 응답 모델. submit 중이면 같은 슬롯 사진과 한 요청으로 묶일 수 있다."""
+    batcher = _current.get()
+    if batcher is None or VISION_BATCH_MAX_IMAGES <= 1:
+        group = _Group(call, system, user_text=user_text, is_image=True)
+        return await _single(group, _Item(image=(data, image_format)))
+    return await batcher.enrich_image(call, system, user_text, data, image_format, slot_name)
@@ -1,14 +1,56 @@
-"""OpenAI chat completions — text + vision 지원."""
+"""OpenAI chat completions — text + vision 지원.
+
+호출마다 토큰 사용량(응답 usage, 없으면 tiktoken 추정)을 call/model 라벨로 메트릭에 기록한다.
+heavy 모델 호출은 llm/routing.py를 거쳐 지연 꼬리에 헤징/대체 모델을 적용한다.
+JSON 응답은 response_format(llm/schemas.py)으로 형식을 강제하고, parse_structured()로
+로컬 보정 → Pydantic 모델 검증한다. 보정/실패 횟수는 메트릭으로 남는다.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import json
+import re
+from typing import TypeVar
 
 from openai import AsyncOpenAI
+from pydantic import BaseModel, ValidationError
 
-from app.core.config import OPENAI_API_KEY, OPENAI_MODEL_LIGHT, OPENAI_MODEL_HEAVY
+from app.core import cancellation, metrics
+from app.core.config import (
+    OPENAI_API_KEY,
+    OPENAI_FALLBACK_API_KEY,
+    OPENAI_FALLBACK_BASE_URL,
+    OPENAI_MODEL_HEAVY,
+    OPENAI_MODEL_HEAVY_FALLBACK,
+    OPENAI_MODEL_LIGHT,
+)
+from app.llm import routing
+from app.llm.tokens import count_tokens
 
 _client: AsyncOpenAI | None = None
+_fallback_client: AsyncOpenAI | None = None
+
+_CALLS = metrics.counter("ai_run_llm_calls_total", "LLM calls by call site and model")
+_PROMPT_TOKENS = metrics.counter("ai_run_llm_prompt_tokens_total", "LLM prompt tokens by call site and model")
+_COMPLETION_TOKENS = metrics.counter(
+    "ai_run_llm_completion_tokens_total", "LLM completion tokens by call site and model"
+)
+_PROMPT_TOKENS_PER_CALL = metrics.histogram(
+    "ai_run_llm_prompt_tokens", "LLM prompt tokens per call",
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000),
+)
+_PARSE_REPAIRS = metrics.counter(
+    "ai_run_llm_parse_repairs_total", "LLM JSON responses parsed only after local repair"
+)
+_PARSE_FAILURES = metrics.counter(
+    "ai_run_llm_parse_failures_total", "LLM JSON responses that could not be used (stage=json|schema)"
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"})
 
 
 def _get_client() -> AsyncOpenAI:
@@ -18,25 +60,172 @@ def _get_client() -> AsyncOpenAI:
     return _client
 
 
+def _get_fallback_client() -> AsyncOpenAI:
+    """대체 모델용 — OPENAI_FALLBACK_BASE_URL이 없으면 기본 클라이언트를 같이 쓴다."""
+    global _fallback_client
+    if not OPENAI_FALLBACK_BASE_URL:
+        return _get_client()
+    if _fallback_client is None:
+        _fallback_client = AsyncOpenAI(api_key=OPENAI_FALLBACK_API_KEY, base_url=OPENAI_FALLBACK_BASE_URL)
+    return _fallback_client
+
+
+def safe_json(raw: str) -> dict:
+    """LLM 응답에서 JSON을 안전하게 파싱. 마크다운 코드블록 제거."""
+    text = raw.strip()
+    # ```json ... ``` 또는 ``` ... ``` 제거
+    m = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+    if m:
+        text = m.group(1).strip()
+    return json.loads(text)
+
+
+def repair_json(raw: str) -> str:
+    """흔한 형식 오류를 로컬에서 고친다 — 앞뒤 설명문, 스마트 따옴표, 끝 쉼표,
+    Python 리터럴(True/False/None), 출력 잘림으로 닫히지 않은 문자열/괄호."""
+    text = raw.strip()
+    m = re.search(r"```(?:json)?\s*([\s\S]*?)(?:```|$)", text)
+    if m:
+        text = m.group(1).strip()
+    start = text.find("{")
+    if start < 0:
+        return text
+    text = text[start:].translate(_SMART_QUOTES)
+
+    # 첫 JSON 객체까지만 — 뒤 설명문 제거. 끝까지 닫히지 않으면(잘린 출력) 열린 문자열/괄호를 닫는다
+    stack: list[str] = []
+    in_str = escaped = False
+    for i, ch in enumerate(text):
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+            if not stack:
+                text = text[: i + 1]
+                break
+    else:
+        if in_str:
+            text += '"'
+        text = re.sub(r"[,:]\s*$", "", text.rstrip()) + "".join(reversed(stack))
+
+    text = re.sub(r"([:\[,]\s*)True\b", r"\1true", text)
+    text = re.sub(r"([:\[,]\s*)False\b", r"\1false", text)
+    text = re.sub(r"([:\[,]\s*)None\b", r"\1null", text)
+    return re.sub(r",\s*([}\]])", r"\1", text)
+
+
+def load_json(raw: str, *, call: str = "other") -> dict:
+    """LLM 응답 → JSON 객체. 그대로 파싱이 안 되면 repair_json 후 재시도, 실패 시 ValueError."""
+    try:
+        data = safe_json(raw)
+    except ValueError:
+        try:
+            data = json.loads(repair_json(raw))
+        except ValueError:
+            _PARSE_FAILURES.inc(call=call, stage="json")
+            raise
+        _PARSE_REPAIRS.inc(call=call)
+    if not isinstance(data, dict):
+        _PARSE_FAILURES.inc(call=call, stage="json")
+        raise ValueError(f"expected JSON object, got {type(data).__name__}")
+    return data
+
+
+def validate_structured(data: object, model: type[M], *, call: str = "other") -> M:
+    """JSON 객체 → 응답 모델. 검증 실패 시 ValidationError(ValueError)."""
+    try:
+        return model.model_validate(data)
+    except ValidationError:
+        _PARSE_FAILURES.inc(call=call, stage="schema")
+        raise
+
+
+def parse_structured(raw: str, model: type[M], *, call: str = "other") -> M:
+    """LLM 응답 → 검증된 응답 모델 (llm/schemas.py)."""
+    return validate_structured(load_json(raw, call=call), model, call=call)
+
+
+def _record_usage(call: str, model: str, resp, prompt_text: str, content: str) -> None:
+    usage = getattr(resp, "usage", None)
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if prompt is None:
+        prompt = count_tokens(prompt_text, model)
+    if completion is None:
+        completion = count_tokens(content, model)
+    _CALLS.inc(call=call, model=model)
+    _PROMPT_TOKENS.inc(prompt, call=call, model=model)
+    _COMPLETION_TOKENS.inc(completion, call=call, model=model)
+    _PROMPT_TOKENS_PER_CALL.observe(prompt, call=call)
+
+
+def _image_part(data: bytes, image_format: str) -> dict:
+    b64 = base64.b64encode(data).decode()
+    media_type = "image/jpeg" if image_format in ("jpg", "jpeg") else f"image/{image_format}"
+    return {"type": "image_url", "image_url": {"url": f"data:{media_type};base64,{b64}"}}
+
+
+async def _complete(
+    messages: list[dict],
+    *,
+    heavy: bool,
+    temperature: float,
+    call: str,
+    response_format: dict | None,
+    prompt_text: str,
+) -> str:
+    """chat completion 1건. heavy 모델은 llm/routing.py 경로(헤징 + 대체 모델)를 거친다."""
+    kwargs: dict = {"temperature": temperature, "messages": messages}
+    if response_format:
+        kwargs["response_format"] = response_format
+
+    async def send(route: routing.Route) -> str:
+        client = _get_fallback_client() if route.name == "fallback" else _get_client()
+        try:
+            resp = await client.chat.completions.create(model=route.model, **kwargs)
+        except asyncio.CancelledError:
+            cancellation.record_cancelled("llm", call)
+            raise
+        content = resp.choices[0].message.content or ""
+        _record_usage(call, route.model, resp, prompt_text, content)
+        return content
+
+    if not heavy:
+        return await send(routing.Route("primary", OPENAI_MODEL_LIGHT))
+    fallback = (
+        routing.Route("fallback", OPENAI_MODEL_HEAVY_FALLBACK) if OPENAI_MODEL_HEAVY_FALLBACK else None
+    )
+    return await routing.call(routing.Route("primary", OPENAI_MODEL_HEAVY), fallback, send)
+
+
 async def ask_llm(
     system: str,
     user: str,
     *,
     heavy: bool = False,
     temperature: float = 0.0,
+    call: str = "other",
+    response_format: dict | None = None,
 ) -> str:
-    """Text-only chat completion."""
-    client = _get_client()
-    model = OPENAI_MODEL_HEAVY if heavy else OPENAI_MODEL_LIGHT
-    resp = await client.chat.completions.create(
-        model=model,
-        temperature=temperature,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
+    """Text-only chat completion. call은 메트릭 라벨 (pdf_llm, judge 등).
+    response_format은 llm/schemas.response_format() 결과 (None이면 형식 강제 없음)."""
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+    return await _complete(
+        messages, heavy=heavy, temperature=temperature, call=call,
+        response_format=response_format, prompt_text=system + user,
     )
-    return resp.choices[0].message.content or ""
 
 
 async def ask_llm_vision(
@@ -46,27 +235,45 @@ async def ask_llm_vision(
     image_format: str = "png",
     *,
     temperature: float = 0.0,
+    call: str = "vision",
+    response_format: dict | None = None,
 ) -> str:
     """Vision chat completion — GPT-4o로 이미지 직접 해석."""
-    client = _get_client()
-    b64 = base64.b64encode(image_data).decode()
-    media_type = "image/jpeg" if image_format in ("jpg", "jpeg") else f"image/{image_format}"
+    messages = [
+        {"role": "system", "content": system},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": user_text},
+                _image_part(image_data, image_format),
+            ],
+        },
+    ]
+    return await _complete(
+        messages, heavy=True, temperature=temperature, call=call,
+        response_format=response_format, prompt_text=system + user_text,
+    )
 
-    resp = await client.chat.completions.create(
-        model=OPENAI_MODEL_HEAVY,
-        temperature=temperature,
-        messages=[
-            {"role": "system", "content": system},
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": user_text},
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:{media_type};base64,{b64}"},
-                    },
-                ],
-            },
-        ],
+
+async def ask_llm_vision_multi(
+    system: str,
+    user_text: str,
+    images: list[tuple[bytes, str]],
+    *,
+    temperature: float = 0.0,
+    call: str = "vision",
+    response_format: dict | None = None,
+) -> str:
+    """여러 이미지를 한 요청으로. 각 이미지 앞에 "[image id=N]" 라벨을 붙인다 (N = images 순서)."""
+    content: list[dict] = [{"type": "text", "text": user_text}]
+    for i, (data, image_format) in enumerate(images):
+        content.append({"type": "text", "text": f"[image id={i}]"})
+        content.append(_image_part(data, image_format))
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": content},
+    ]
+    return await _complete(
+        messages, heavy=True, temperature=temperature, call=call,
+        response_format=response_format, prompt_text=system + user_text,
     )
-    return resp.choices[0].message.content or ""
@@ -0,0 +1,203 @@
+"""LLM 입력 선별 — 앞부분 자르기(text[:4000], head(20)) 대신 관련도 순으로 토큰 예산에 맞춰 담는다.
+
+- 문서: 페이지 → 문단(span) 단위로 점수를 매긴다.
+  날짜 / 서명 키워드 / 슬롯 키워드(도메인 rules.SLOT_KEYWORDS + EXPECTED_HEADERS) 적중,
+  첫 문단(문서 제목)·마지막 페이지(서명란) 가산점. 점수 순으로 예산이 찰 때까지 고른 뒤 원래 순서로 출력.
+- 표: 요약 통계(행/열 수, 결측, 숫자 열 min/max/mean) + 층화 표본 행
+  (처음/끝, 결측·이상치 행, 키워드 행, 나머지는 균등 간격).
+- 토큰은 llm/tokens.count_tokens (tiktoken) 기준.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+import pandas as pd
+
+from app.llm.tokens import count_tokens, truncate_to_tokens
+
+DATE_RE = re.compile(r"(\d{4})[.\-/년]\s*(\d{1,2})[.\-/월]\s*(\d{1,2})")
+SIGNATURE_KEYWORDS = ("서명", "날인", "(인)", "확인자", "작성자", "승인", "결재", "담당자", "signature", "signed")
+
+_MAX_SPAN_CHARS = 800
+_GAP_MARK = "…"
+
+_W_DATE = 3.0
+_W_SIGNATURE = 3.0
+_W_KEYWORD = 2.0
+_W_FIRST = 2.0
+_W_LAST_PAGE = 1.0
+_MIN_SPAN_CHARS = 15
+# 표본 우선순위 그룹(결측/이상치/키워드)별 최대 행 수 — 한 그룹이 예산을 독점하지 않도록
+_MAX_ROWS_PER_GROUP = 20
+
+
+def _split_page(text: str) -> list[str]:
+    """빈 줄 기준 문단. 너무 긴 문단은 줄 단위로 _MAX_SPAN_CHARS 이하로 나눈다."""
+    spans: list[str] = []
+    for para in re.split(r"\n\s*\n", text):
+        para = para.strip()
+        if not para:
+            continue
+        if len(para) <= _MAX_SPAN_CHARS:
+            spans.append(para)
+            continue
+        buf: list[str] = []
+        size = 0
+        for line in para.splitlines():
+            if buf and size + len(line) > _MAX_SPAN_CHARS:
+                spans.append("\n".join(buf))
+                buf, size = [], 0
+            buf.append(line)
+            size += len(line) + 1
+        if buf:
+            spans.append("\n".join(buf))
+    return spans
+
+
+def _score(span: str, keywords: Iterable[str]) -> float:
+    low = span.lower()
+    score = 0.0
+    score += _W_DATE * min(len(DATE_RE.findall(span)), 3)
+    score += _W_SIGNATURE * sum(1 for k in SIGNATURE_KEYWORDS if k in low)
+    score += _W_KEYWORD * sum(1 for k in keywords if k and k.lower() in low)
+    if len(span.strip()) < _MIN_SPAN_CHARS:
+        score *= 0.5
+    return score
+
+
+def pack_document(
+    page_texts: list[str],
+    keywords: Iterable[str],
+    budget_tokens: int,
+) -> tuple[str, int]:
+    """페이지 텍스트 → 예산 내 관련 문단. Returns (packed text, token 수)."""
+    keywords = [k for k in dict.fromkeys(keywords) if k]
+    spans: list[tuple[int, int, str, float]] = []  # (page, order, text, score)
+    last_page = len(page_texts) - 1
+    for p, page in enumerate(page_texts):
+        for text in _split_page(page):
+            score = _score(text, keywords)
+            if not spans:
+                score += _W_FIRST
+            if p == last_page and last_page > 0:
+                score += _W_LAST_PAGE
+            spans.append((p, len(spans), text, score))
+    if not spans:
+        return "", 0
+
+    full = "\n\n".join(s[2] for s in spans)
+    full_tokens = count_tokens(full)
+    if full_tokens <= budget_tokens:
+        return full, full_tokens
+
+    chosen: dict[int, str] = {}
+    seen: set[str] = set()
+    used = 0
+    # 점수 내림차순, 동점이면 앞쪽 문단 우선. 페이지마다 반복되는 머리글 등 같은 문단은 한 번만
+    for p, idx, text, _ in sorted(spans, key=lambda s: (-s[3], s[1])):
+        if text in seen:
+            continue
+        seen.add(text)
+        cost = count_tokens(text) + 4  # 페이지 표시/구분자 몫
+        if used + cost <= budget_tokens:
+            chosen[idx] = text
+            used += cost
+        elif not chosen:
+            # 최고점 문단 하나가 예산보다 크면 잘라서라도 담는다
+            chosen[idx] = truncate_to_tokens(text, budget_tokens - 4)
+            used = budget_tokens
+            break
+
+    parts: list[str] = []
+    prev_idx = -1
+    for p, idx, _, _ in spans:
+        if idx not in chosen:
+            continue
+        if prev_idx >= 0 and idx != prev_idx + 1:
+            parts.append(_GAP_MARK)
+        parts.append(f"[p.{p + 1}] {chosen[idx]}")
+        prev_idx = idx
+    packed = "\n\n".join(parts)
+    return packed, count_tokens(packed)
+
+
+# ── 표 ────────────────────────────────────────────────
+def _table_stats(df: pd.DataFrame) -> list[str]:
+    lines = [f"rows={len(df)}, columns={len(df.columns)}"]
+    nulls = df.isna().sum()
+    null_cols = [f"{c}:{int(n)}" for c, n in nulls.items() if n]
+    if null_cols:
+        lines.append("missing: " + ", ".join(null_cols))
+    num = df.select_dtypes("number")
+    for c in num.columns:
+        col = num[c].dropna()
+        if col.empty:
+            continue
+        lines.append(f"{c}: min={col.min():g}, max={col.max():g}, mean={col.mean():.4g}")
+    return lines
+
+
+def _outlier_rows(df: pd.DataFrame) -> list[int]:
+    """숫자 열 IQR 1.5배 밖의 값을 가진 행 위치."""
+    out: set[int] = set()
+    num = df.select_dtypes("number")
+    for c in num.columns:
+        col = num[c]
+        q1, q3 = col.quantile(0.25), col.quantile(0.75)
+        iqr = q3 - q1
+        if pd.isna(iqr) or iqr == 0:
+            continue
+        mask = (col < q1 - 1.5 * iqr) | (col > q3 + 1.5 * iqr)
+        out.update(int(i) for i in mask.to_numpy().nonzero()[0])
+    return sorted(out)
+
+
+def _row_order(df: pd.DataFrame, keywords: list[str]) -> list[int]:
+    """표본 우선순위 — 처음/끝 3행, 결측 행, 이상치 행, 키워드 행, 이후 균등 간격."""
+    n = len(df)
+    order: list[int] = []
+    order += list(range(min(3, n)))
+    order += list(range(max(n - 3, 0), n))
+    order += [int(i) for i in df.isna().any(axis=1).to_numpy().nonzero()[0][:_MAX_ROWS_PER_GROUP]]
+    order += _outlier_rows(df)[:_MAX_ROWS_PER_GROUP]
+    if keywords:
+        kws = [k.lower() for k in keywords]
+        hits = [
+            i for i, row in enumerate(df.itertuples(index=False))
+            if any(k in " ".join(map(str, row)).lower() for k in kws)
+        ]
+        order += hits[:_MAX_ROWS_PER_GROUP]
+    step = max(n // 50, 1)
+    order += list(range(0, n, step))
+    order += list(range(n))
+    return list(dict.fromkeys(order))
+
+
+def pack_table(
+    df: pd.DataFrame,
+    keywords: Iterable[str],
+    budget_tokens: int,
+) -> tuple[str, int]:
+    """DataFrame → 요약 통계 + 층화 표본 CSV. Returns (packed text, token 수)."""
+    keywords = [k for k in dict.fromkeys(keywords) if k]
+    stats = "\n".join(_table_stats(df))
+    header = "#," + ",".join(str(c) for c in df.columns)
+    head_text = f"[summary]\n{stats}\n[sample rows]\n{header}"
+    used = count_tokens(head_text)
+
+    picked: dict[int, str] = {}
+    for i in _row_order(df, keywords):
+        line = f"{i}," + df.iloc[[i]].to_csv(index=False, header=False).strip()
+        cost = count_tokens(line) + 1
+        if used + cost > budget_tokens:
+            break
+        picked[i] = line
+        used += cost
+
+    rows = [picked[i] for i in sorted(picked)]
+    if len(picked) < len(df):
+        rows.append(f"({len(df) - len(picked)} rows omitted)")
+    packed = head_text + "\n" + "\n".join(rows)
+    return packed, count_tokens(packed)
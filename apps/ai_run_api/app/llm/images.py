@@ -0,0 +1,28 @@
+"""Vision 입력 이미지 축소 — 여러 장을 한 요청에 담을 때 payload/이미지 토큰을 줄인다.
+
+PyMuPDF(Pixmap)만 사용한다 (PDF 추출에 이미 쓰는 의존성). 실패하면 원본을 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import fitz  # PyMuPDF
+
+_JPEG_QUALITY = 85
+
+
+def downscale(data: bytes, image_format: str, max_side: int) -> tuple[bytes, str]:
+    """긴 변이 max_side를 넘으면 비율 유지 축소 후 JPEG. Returns (bytes, format)."""
+    try:
+        pix = fitz.Pixmap(data)
+        if max(pix.width, pix.height) <= max_side:
+            return data, image_format
+        scale = max_side / max(pix.width, pix.height)
+        if pix.colorspace is not None and pix.colorspace.n not in (1, 3):
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        small = fitz.Pixmap(pix, pix.width * scale, pix.height * scale, None)
+        # 비정수 배율 축소는 가장자리 처리용 alpha 채널이 붙는다 — JPEG은 alpha 불가
+        if small.alpha:
+            small = fitz.Pixmap(small, 0)
+        return small.tobytes("jpeg", jpg_quality=_JPEG_QUALITY), "jpg"
+    except Exception:
+        return data, image_format
@@ -194,6 +194,28 @@ CLARIFICATION_TEMPLATE = (
 )
 
 
+# ═══════════════════════════════════════════════════════════
+# BATCH — 여러 문서를 한 요청으로 (llm/batcher.py, 공통)
+# ═══════════════════════════════════════════════════════════
+# PDF_ANALYSIS / DATA_ANALYSIS 시스템 프롬프트 뒤에 붙인다
+BATCH_TEXT_SUFFIX = (
+    "\n\nBATCH MODE: the user message contains several independent documents, each wrapped in "
+    '<doc id="...">...</doc>. Apply the instructions above to EACH document separately — '
+    "never mix information between documents.\n"
+    'Return JSON only: {"results": {"<doc id>": <JSON object for that document>, ...}} '
+    "with exactly one entry per doc id. No markdown."
+)
+
+# IMAGE_VISION 시스템 프롬프트 뒤에 붙인다 — 같은 슬롯 사진 여러 장
+BATCH_IMAGE_SUFFIX = (
+    "\n\nBATCH MODE: the user message contains several independent images, each preceded by "
+    'a label "[image id=N]". Apply the instructions above to EACH image separately — '
+    "count people, objects and violations per image, never across images.\n"
+    'Return JSON only: {"results": {"<image id>": <JSON object for that image>, ...}} '
+    "with exactly one entry per image id. No markdown."
+)
+
+
 # ═══════════════════════════════════════════════════════════
 # 헬퍼 — domain 키로 프롬프트 꺼내기
 # ═══════════════════════════════════════════════════════════
@@ -0,0 +1,179 @@
+"""heavy 모델 호출 경로 — 요청 헤징 + 대체 모델 라우팅.
+
+- 모델별 최근 LLM_LATENCY_WINDOW회 호출의 지연/오류를 기억한다 (메트릭 ai_run_llm_latency_seconds도 기록).
+- 헤징(LLM_HEDGE_ENABLED): 요청이 해당 모델의 최근 p(LLM_HEDGE_PERCENTILE) 지연을 넘기면
+  같은 요청을 하나 더 보내고, 먼저 성공한 결과를 쓰고 나머지는 취소한다.
+  표본이 LLM_LATENCY_MIN_SAMPLES개 모이기 전에는 LLM_HEDGE_DEFAULT_DELAY_SEC를 쓴다.
+- 대체 라우팅(OPENAI_MODEL_HEAVY_FALLBACK): 주 모델의 최근 오류율이 LLM_FALLBACK_ERROR_RATE를,
+  또는 p95 지연이 LLM_FALLBACK_LATENCY_SEC를 넘으면 LLM_FALLBACK_COOLDOWN_SEC 동안 대체 모델을 먼저 쓴다.
+  쿨다운이 지나면 주 모델로 돌아가 다시 표본을 모은다. 이번 호출이 실패해도 다른 경로로 한 번 더 보낸다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from app.core import metrics
+from app.core.config import (
+    LLM_FALLBACK_COOLDOWN_SEC,
+    LLM_FALLBACK_ERROR_RATE,
+    LLM_FALLBACK_LATENCY_SEC,
+    LLM_HEDGE_DEFAULT_DELAY_SEC,
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_MIN_DELAY_SEC,
+    LLM_HEDGE_PERCENTILE,
+    LLM_LATENCY_MIN_SAMPLES,
+    LLM_LATENCY_WINDOW,
+)
+
+T = TypeVar("T")
+
+_LATENCY = metrics.histogram(
+    "ai_run_llm_latency_seconds", "LLM call latency by model (completed calls)",
+    buckets=(0.5, 1, 2, 4, 8, 16, 32, 64, 128),
+)
+_HEDGES = metrics.counter("ai_run_llm_hedges_total", "Hedged (duplicate) LLM requests by model and winner")
+_FALLBACKS = metrics.counter("ai_run_llm_fallbacks_total", "LLM calls routed to the fallback model by reason")
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str  # "primary" / "fallback"
+    model: str
+
+
+class _ModelStats:
+    def __init__(self) -> None:
+        self.latencies: deque[float] = deque(maxlen=LLM_LATENCY_WINDOW)
+        self.errors: deque[bool] = deque(maxlen=LLM_LATENCY_WINDOW)
+        self.tripped_until = 0.0
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        self.errors.append(not ok)
+        if ok:
+            self.latencies.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        if len(self.latencies) < LLM_LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+    def error_rate(self) -> float | None:
+        if len(self.errors) < LLM_LATENCY_MIN_SAMPLES:
+            return None
+        return sum(self.errors) / len(self.errors)
+
+
+_STATS: dict[str, _ModelStats] = {}
+
+
+def _stats(model: str) -> _ModelStats:
+    s = _STATS.get(model)
+    if s is None:
+        s = _STATS[model] = _ModelStats()
+    return s
+
+
+def observe(model: str, seconds: float, ok: bool) -> None:
+    _stats(model).observe(seconds, ok)
+    if ok:
+        _LATENCY.observe(seconds, model=model)
+
+
+def hedge_delay(model: str) -> float:
+    p = _stats(model).percentile(LLM_HEDGE_PERCENTILE)
+    if p is None:
+        return LLM_HEDGE_DEFAULT_DELAY_SEC
+    return max(p, LLM_HEDGE_MIN_DELAY_SEC)
+
+
+def _over_budget(model: str) -> str | None:
+    """주 모델이 오류/지연 예산을 넘었으면 사유."""
+    s = _stats(model)
+    if time.monotonic() < s.tripped_until:
+        return "cooldown"
+    reason = None
+    rate = s.error_rate()
+    p95 = s.percentile(0.95)
+    if rate is not None and rate > LLM_FALLBACK_ERROR_RATE:
+        reason = "error_budget"
+    elif p95 is not None and p95 > LLM_FALLBACK_LATENCY_SEC:
+        reason = "latency_budget"
+    if reason:
+        # 쿨다운 뒤에는 새 표본으로 다시 판단
+        s.tripped_until = time.monotonic() + LLM_FALLBACK_COOLDOWN_SEC
+        s.latencies.clear()
+        s.errors.clear()
+    return reason
+
+
+def plan(primary: Route, fallback: Route | None) -> list[Route]:
+    """시도 순서. 대체 경로가 없으면 주 경로만."""
+    if fallback is None:
+        return [primary]
+    reason = _over_budget(primary.model)
+    if reason:
+        _FALLBACKS.inc(model=fallback.model, reason=reason)
+        return [fallback, primary]
+    return [primary, fallback]
+
+
+async def _attempt(route: Route, send: Callable[[Route], Awaitable[T]]) -> T:
+    t0 = time.monotonic()
+    try:
+        result = await send(route)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        observe(route.model, time.monotonic() - t0, ok=False)
+        raise
+    observe(route.model, time.monotonic() - t0, ok=True)
+    return result
+
+
+async def _hedged(route: Route, send: Callable[[Route], Awaitable[T]]) -> T:
+    first = asyncio.create_task(_attempt(route, send))
+    second: asyncio.Task | None = None
+    try:
+        done, _ = await asyncio.wait({first}, timeout=hedge_delay(route.model))
+        if done:
+            return first.result()
+        second = asyncio.create_task(_attempt(route, send))
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is None:
+                    _HEDGES.inc(model=route.model, winner="hedge" if t is second else "original")
+                    return t.result()
+        _HEDGES.inc(model=route.model, winner="none")
+        return first.result()
+    finally:
+        for t in (first, second):
+            if t is not None and not t.done():
+                t.cancel()
+
+
+async def call(primary: Route, fallback: Route | None, send: Callable[[Route], Awaitable[T]]) -> T:
+    """plan() 순서로 send(route)를 시도한다. 각 시도는 헤징 대상."""
+    routes = plan(primary, fallback)
+    last_exc: Exception | None = None
+    for i, route in enumerate(routes):
+        if i > 0:
+            _FALLBACKS.inc(model=route.model, reason="error")
+        try:
+            if LLM_HEDGE_ENABLED:
+                return await _hedged(route, send)
+            return await _attempt(route, send)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            last_exc = exc
+    assert last_exc is not None
+    raise last_exc
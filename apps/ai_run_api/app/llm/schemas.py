@@ -0,0 +1,204 @@
+"""LLM JSON 응답 모델 — prompts.py의 _PDF/_DATA/_IMAGE/_JUDGE_JSON_SCHEMA에 대응.
+
+- 호출 지점(call)별 응답 모델: RESPONSE_MODELS. 분석기 merge / judge는 dict 대신 이 모델을 받는다.
+- response_format(): 모델 → OpenAI structured output(json_schema, strict) 형식.
+  strict 모드는 모든 객체가 additionalProperties=false여야 하므로 자유 키 extras는
+  [{"key", "value"}] 배열로 보내고, 모델 검증 시 다시 dict로 바꾼다.
+- 검증은 관대하게: 누락 필드는 기본값, 단일 값은 리스트로, 숫자 문자열은 정수로,
+  허용되지 않은 enum 값은 None으로 맞춘다. 형식 때문에 호출 결과 전체를 버리지 않기 위함.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, get_args
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+
+from app.core.config import LLM_STRUCTURED_OUTPUT
+from app.schemas.run import RiskLevel, Verdict
+
+
+def _as_str_list(v: Any) -> list[str]:
+    if v is None or v == "":
+        return []
+    if not isinstance(v, (list, tuple)):
+        v = [v]
+    return [str(x) for x in v if x is not None and str(x).strip()]
+
+
+def _as_str_dict(v: Any) -> dict[str, str]:
+    # strict 스키마의 [{"key", "value"}] 배열, 일반 JSON 객체 모두 허용
+    if isinstance(v, list):
+        return {
+            str(e["key"]): str(e.get("value", ""))
+            for e in v
+            if isinstance(e, dict) and e.get("key") is not None
+        }
+    if isinstance(v, dict):
+        return {str(k): str(val) for k, val in v.items()}
+    return {}
+
+
+def _as_enum(v: Any, allowed: tuple[str, ...]) -> str | None:
+    if v is None:
+        return None
+    s = str(v).strip().upper()
+    return s if s in allowed else None
+
+
+class _LLMResult(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    dates: list[str] = Field(default_factory=list)
+    anomalies: list[str] = Field(default_factory=list)
+    extras: dict[str, str] = Field(default_factory=dict)
+
+    @field_validator("dates", "anomalies", mode="before")
+    @classmethod
+    def _lists(cls, v: Any) -> list[str]:
+        return _as_str_list(v)
+
+    @field_validator("extras", mode="before")
+    @classmethod
+    def _extras(cls, v: Any) -> dict[str, str]:
+        return _as_str_dict(v)
+
+
+class PdfAnalysis(_LLMResult):
+    has_signature: bool = False
+    summary: str = ""
+
+
+class DataAnalysis(_LLMResult):
+    missing_fields: list[str] = Field(default_factory=list)
+
+    @field_validator("missing_fields", mode="before")
+    @classmethod
+    def _missing(cls, v: Any) -> list[str]:
+        return _as_str_list(v)
+
+
+class ImageAnalysis(_LLMResult):
+    detected_objects: list[str] = Field(
+        default_factory=list, validation_alias=AliasChoices("detected_objects", "safety_objects")
+    )
+    violations: list[str] = Field(default_factory=list)
+    scene_description: str = ""
+    person_count: int | None = None
+
+    @field_validator("detected_objects", "violations", mode="before")
+    @classmethod
+    def _image_lists(cls, v: Any) -> list[str]:
+        return _as_str_list(v)
+
+    @field_validator("person_count", mode="before")
+    @classmethod
+    def _count(cls, v: Any) -> int | None:
+        if v is None or isinstance(v, bool):
+            return None
+        try:
+            return max(int(float(str(v).strip())), 0)
+        except ValueError:
+            return None
+
+
+class JudgeResult(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    # 최종 판정은 룰이 정한다 — LLM의 risk_level/verdict는 참고용
+    risk_level: RiskLevel | None = None
+    verdict: Verdict | None = None
+    why: str = ""
+    extras: dict[str, str] = Field(default_factory=dict)
+
+    @field_validator("risk_level", mode="before")
+    @classmethod
+    def _risk(cls, v: Any) -> str | None:
+        return _as_enum(v, get_args(RiskLevel))
+
+    @field_validator("verdict", mode="before")
+    @classmethod
+    def _verdict(cls, v: Any) -> str | None:
+        return _as_enum(v, get_args(Verdict))
+
+    @field_validator("extras", mode="before")
+    @classmethod
+    def _extras(cls, v: Any) -> dict[str, str]:
+        return _as_str_dict(v)
+
+
+# 호출 지점(call 라벨) → 응답 모델
+RESPONSE_MODELS: dict[str, type[BaseModel]] = {
+    "pdf_llm": PdfAnalysis,
+    "xlsx_llm": DataAnalysis,
+    "image_vision": ImageAnalysis,
+    "judge": JudgeResult,
+}
+
+
+# ── structured output 형식 ─────────────────────────────
+_KV_ARRAY = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"key": {"type": "string"}, "value": {"type": "string"}},
+        "required": ["key", "value"],
+        "additionalProperties": False,
+    },
+}
+
+
+def _strict(node: Any) -> Any:
+    """pydantic JSON schema → OpenAI strict 부분집합 (모든 필드 required, 자유 키 객체 → key/value 배열)."""
+    if isinstance(node, list):
+        return [_strict(n) for n in node]
+    if not isinstance(node, dict):
+        return node
+    if node.get("type") == "object" and "properties" not in node:
+        return copy.deepcopy(_KV_ARRAY)
+    out = {k: _strict(v) for k, v in node.items() if k not in ("title", "default")}
+    if out.get("type") == "object":
+        out["required"] = list(out["properties"])
+        out["additionalProperties"] = False
+    return out
+
+
+def _schema(model: type[BaseModel]) -> dict:
+    return _strict(model.model_json_schema(mode="serialization"))
+
+
+def response_format(model: type[BaseModel]) -> dict | None:
+    """단건 응답용 response_format. LLM_STRUCTURED_OUTPUT=off면 None (프롬프트 지시만 사용)."""
+    if LLM_STRUCTURED_OUTPUT == "strict":
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": model.__name__, "schema": _schema(model), "strict": True},
+        }
+    if LLM_STRUCTURED_OUTPUT == "json":
+        return {"type": "json_object"}
+    return None
+
+
+def batch_response_format(model: type[BaseModel], n: int) -> dict | None:
+    """일괄 요청(llm/batcher.py)용 — {"results": {"0": model, ..., "n-1": model}}."""
+    if LLM_STRUCTURED_OUTPUT != "strict":
+        return response_format(model)
+    item = _schema(model)
+    ids = [str(i) for i in range(n)]
+    results = {
+        "type": "object",
+        "properties": {i: item for i in ids},
+        "required": ids,
+        "additionalProperties": False,
+    }
+    schema = {
+        "type": "object",
+        "properties": {"results": results},
+        "required": ["results"],
+        "additionalProperties": False,
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": f"{model.__name__}Batch{n}", "schema": schema, "strict": True},
+    }
@@ -0,0 +1,53 @@
+"""토큰 수 계산 — tiktoken 기반, 인코딩을 불러올 수 없으면 문자 수 기반 근사치."""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+from app.core.config import OPENAI_MODEL_LIGHT
+
+# tiktoken을 쓸 수 없을 때의 근사치 (한국어 위주 텍스트 기준)
+_CHARS_PER_TOKEN = 2.5
+_FALLBACK_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """모델 인코딩. tiktoken 미설치/인코딩 파일 다운로드 불가(오프라인)면 None."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:
+        return None
+    try:
+        return tiktoken.get_encoding(_FALLBACK_ENCODING)
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = OPENAI_MODEL_LIGHT) -> int:
+    if not text:
+        return 0
+    enc = _encoding(model)
+    if enc is None:
+        return math.ceil(len(text) / _CHARS_PER_TOKEN)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, budget: int, model: str = OPENAI_MODEL_LIGHT) -> str:
+    """앞에서부터 budget 토큰까지만 남긴다."""
+    if budget <= 0:
+        return ""
+    enc = _encoding(model)
+    if enc is None:
+        return text[: int(budget * _CHARS_PER_TOKEN)]
+    ids = enc.encode(text, disallowed_special=())
+    if len(ids) <= budget:
+        return text
+    return enc.decode(ids[:budget])
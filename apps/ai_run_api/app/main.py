@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.api.run import router
+from app.core import metrics
+from app.pipeline.jobs import start_workers, stop_workers
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # 비동기 submit job 워커 풀 (SQLite 큐 소비)
+    await start_workers()
+    yield
+    await stop_workers()
+
 
 app = FastAPI(
     title="AI Run API",
     version="1.0.0",
     description="협력사 자료(PDF/XLSX/이미지)를 도메인(safety/compliance/esg)별로 자동 검증하는 공통 엔진",
+    lifespan=lifespan,
 )
 
 app.include_router(router)
@@ -18,3 +33,9 @@ app.include_router(router)
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> str:
+    """Prometheus 텍스트 포맷 메트릭 (LLM 호출/토큰 등)."""
+    return metrics.render()
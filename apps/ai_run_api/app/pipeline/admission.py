@@ -0,0 +1,204 @@
+# app/pipeline/admission.py
+
+"""
+입장 제어 — 동시 처리량을 작업 단위로 제한하고, 넘치면 짧게 대기시킨 뒤 429로 돌려보낸다.
+
+- 작업 단위: submit = 파일별 타입 가중치 합(ADMISSION_FILE_WEIGHTS), preview = 1 + 파일 수 × 0.2.
+  .zip은 항목별 파일로 펼친 뒤 센다 (중앙 디렉터리만 읽고, 목록은 submit/preview가 그대로 재사용).
+  한 요청이 용량보다 크면 용량만큼으로 본다 (혼자서는 실행될 수 있도록).
+- 용량(ADMISSION_CAPACITY_UNITS)이 차면 대기열에 넣는다. 대기열이 ADMISSION_MAX_QUEUE를 넘거나
+  ADMISSION_QUEUE_TIMEOUT_SEC 안에 자리가 나지 않으면 429 + Retry-After (최근 요청 점유 시간 기반 추정).
+- 우선순위: preview > submit > job. 같은 우선순위끼리는 도착 순서. 비동기 job 워커는 거절 없이 기다린다.
+- 프로세스(uvicorn 워커) 단위 제한이다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from app.core import metrics
+from app.core.config import (
+    ADMISSION_CAPACITY_UNITS,
+    ADMISSION_ENABLED,
+    ADMISSION_FILE_WEIGHTS,
+    ADMISSION_MAX_QUEUE,
+    ADMISSION_PREVIEW_FILE_WEIGHT,
+    ADMISSION_QUEUE_TIMEOUT_SEC,
+)
+from app.core.errors import OverloadedError
+from app.pipeline.triage import get_ext, get_file_type
+from app.schemas.run import FileRef
+from app.storage import zip_ingest
+
+# 숫자가 작을수록 먼저
+PRIORITY: dict[str, int] = {"preview": 0, "submit": 1, "job": 2}
+
+_RETRY_AFTER_MIN_SEC = 1
+_RETRY_AFTER_MAX_SEC = 60
+
+_IN_FLIGHT = metrics.gauge("ai_run_admission_in_flight_units", "Work units currently admitted")
+_QUEUE_DEPTH = metrics.gauge("ai_run_admission_queue_depth", "Requests waiting for admission by kind")
+_ADMITTED = metrics.counter("ai_run_admission_admitted_total", "Admitted requests by kind")
+_REJECTED = metrics.counter(
+    "ai_run_admission_rejected_total", "Requests rejected with 429 by kind and reason (queue_full|timeout)"
+)
+_WAIT = metrics.histogram(
+    "ai_run_admission_wait_seconds", "Time spent waiting for admission by kind",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30),
+)
+
+
+def estimate_units(kind: str, files: list[FileRef]) -> float:
+    if kind == "preview":
+        return 1.0 + ADMISSION_PREVIEW_FILE_WEIGHT * len(files)
+    units = sum(
+        ADMISSION_FILE_WEIGHTS.get(get_file_type(get_ext(f.storage_uri)) or "", 1.0) for f in files
+    )
+    return max(units, 1.0)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    kind: str = field(compare=False)
+    units: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class Ticket:
+    """입장권 — release()는 여러 번 불러도 한 번만 반영된다."""
+
+    def __init__(self, controller: "AdmissionController | None", kind: str, units: float):
+        self._controller = controller
+        self.kind = kind
+        self.units = units
+        self._granted_at = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if self._released or self._controller is None:
+            return
+        self._released = True
+        self._controller._release(self.units, time.monotonic() - self._granted_at)
+
+
+class AdmissionController:
+    def __init__(self, capacity: float, max_queue: int, queue_timeout: float):
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0.0
+        self._heap: list[_Waiter] = []
+        self._waiting: dict[str, int] = {}
+        self._seq = itertools.count()
+        # 요청 1건의 평균 점유 시간(초) — Retry-After 추정용
+        self._hold_ewma = 5.0
+
+    def _fits(self, units: float) -> bool:
+        return self.in_flight + units <= self.capacity
+
+    def _ahead(self, priority: int) -> int:
+        """같거나 높은 우선순위의 대기자 수 (새치기 방지 / 대기열 한도)."""
+        return sum(1 for w in self._heap if w.priority <= priority and not w.future.done())
+
+    def _grant(self, kind: str, units: float) -> Ticket:
+        self.in_flight += units
+        _IN_FLIGHT.set(self.in_flight)
+        _ADMITTED.inc(kind=kind)
+        return Ticket(self, kind, units)
+
+    def _set_waiting(self, kind: str, delta: int) -> None:
+        self._waiting[kind] = self._waiting.get(kind, 0) + delta
+        _QUEUE_DEPTH.set(self._waiting[kind], kind=kind)
+
+    def retry_after(self, units: float) -> int:
+        queued = sum(w.units for w in self._heap if not w.future.done())
+        est = self._hold_ewma * max(1.0, (queued + units) / self.capacity)
+        return int(min(max(math.ceil(est), _RETRY_AFTER_MIN_SEC), _RETRY_AFTER_MAX_SEC))
+
+    def _reject(self, kind: str, units: float, reason: str) -> OverloadedError:
+        _REJECTED.inc(kind=kind, reason=reason)
+        return OverloadedError(self.retry_after(units))
+
+    async def acquire(self, kind: str, units: float, *, reject: bool = True) -> Ticket:
+        """자리가 날 때까지 기다려 Ticket 반환. reject=False면 거절 없이 무기한 대기 (job 워커)."""
+        units = min(units, self.capacity)
+        priority = PRIORITY.get(kind, len(PRIORITY))
+        if not self._ahead(priority) and self._fits(units):
+            _WAIT.observe(0.0, kind=kind)
+            return self._grant(kind, units)
+        if reject and self._ahead(priority) >= self.max_queue:
+            raise self._reject(kind, units, "queue_full")
+
+        waiter = _Waiter(priority, next(self._seq), kind, units, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._heap, waiter)
+        self._set_waiting(kind, +1)
+        t0 = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout if reject else None)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 자리를 받은 직후 취소됨 — 반납
+                self._release(units, self._hold_ewma)
+            waiter.future.cancel()
+            raise
+        finally:
+            self._set_waiting(kind, -1)
+        if not waiter.future.done():
+            # 대기 시간 초과 — 대기열에서 빠진다 (heap에서는 _wake가 정리)
+            waiter.future.cancel()
+            raise self._reject(kind, units, "timeout")
+        _WAIT.observe(time.monotonic() - t0, kind=kind)
+        return Ticket(self, kind, units)
+
+    def _release(self, units: float, held_sec: float) -> None:
+        self.in_flight = max(0.0, self.in_flight - units)
+        _IN_FLIGHT.set(self.in_flight)
+        self._hold_ewma = 0.8 * self._hold_ewma + 0.2 * held_sec
+        self._wake()
+
+    def _wake(self) -> None:
+        """우선순위 순서대로, 맨 앞 대기자가 들어갈 수 있는 동안 입장시킨다."""
+        while self._heap:
+            head = self._heap[0]
+            if head.future.done():
+                heapq.heappop(self._heap)
+                continue
+            if not self._fits(head.units):
+                break
+            heapq.heappop(self._heap)
+            self.in_flight += head.units
+            _IN_FLIGHT.set(self.in_flight)
+            _ADMITTED.inc(kind=head.kind)
+            head.future.set_result(None)
+
+
+_controller = AdmissionController(ADMISSION_CAPACITY_UNITS, ADMISSION_MAX_QUEUE, ADMISSION_QUEUE_TIMEOUT_SEC)
+
+
+async def acquire(kind: str, files: list[FileRef], *, reject: bool = True) -> Ticket:
+    """입장권 발급. 포화 상태면 OverloadedError(429). ADMISSION_ENABLED=false면 제한 없음."""
+    # .zip 1개를 1단위로 보면 항목 수백 개짜리 패키지가 작은 요청처럼 들어온다
+    units = estimate_units(kind, await zip_ingest.expand_files(files))
+    if not ADMISSION_ENABLED:
+        return Ticket(None, kind, units)
+    return await _controller.acquire(kind, units, reject=reject)
+
+
+@asynccontextmanager
+async def admit(kind: str, files: list[FileRef], *, reject: bool = True) -> AsyncIterator[Ticket]:
+    ticket = await acquire(kind, files, reject=reject)
+    try:
+        yield ticket
+    finally:
+        ticket.release()
@@ -0,0 +1,445 @@
+# app/pipeline/analyzers.py
+
+"""
+파일 단위 분석기 레지스트리 — Submit (3) EXTRACT 단계의 fan-out.
+
+- 각 분석기(Analyzer)는 입력(requires)을 선언한다. 입력이 준비된 분석기끼리는 동시에 실행된다.
+  * 이미지: OCR / Vision / YOLO 모두 bytes만 필요 → 지연시간 = max(OCR, Vision, YOLO)
+  * PDF: 텍스트 레이어 → (OCR, LLM) 병렬. 텍스트 레이어가 빈약할 때만 LLM이 OCR 결과를 기다린다.
+  * XLSX: 테이블 파싱 → LLM
+- 분석기마다 개별 타임아웃을 두고, 실패/타임아웃은 해당 분석기만 비운다.
+  타임아웃은 요청 데드라인의 단계 예산(pipeline/deadline.py)을 넘지 않는다 — 선택 보강 분석기(optional)는
+  enrich 예산, 나머지는 extract 예산. 예산 초과로 생략된 보강은 record["degraded"]에 남는다.
+- 한 번에 하나만 실행할 수 있는 분석기(serial, YOLO)는 차례를 기다린 뒤부터 타임아웃을 잰다.
+  기다리는 시간은 요청 데드라인으로만 제한한다.
+- 결과 병합: 파일 타입별 builder가 기본 레코드를 만들고, 보강 분석기의 merge를 등록 순서대로 적용한다.
+  LLM 보강 분석기는 검증된 응답 모델(llm/schemas.py)을 돌려주고, merge는 그 모델을 받는다.
+  (이미지: Vision → YOLO 순서라 YOLO person_count가 Vision 값을 덮어쓴다)
+- 내용에만 의존하는 분석기(content_only)와 이미지 Vision은 같은 submit의 같은 내용(sha256) 파일끼리
+  한 번만 실행한다 — 슬롯이 달라도 공유 (pipeline/duplicates.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.core import cancellation
+from app.core.config import ANALYZER_TIMEOUTS, DUPLICATE_DETECTION_ENABLED, LLM_INPUT_TOKEN_BUDGET
+from app.pipeline import deadline, duplicates, llm_policy
+from app.engines.registry import get_rules_module
+from app.extractors.ocr.clova_client import run_ocr
+from app.extractors.ocr.ocr_router import extract_image
+from app.extractors.pdf_text import build_pdf_result, read_text_layer
+from app.extractors.xlsx import check_table, read_table
+from app.llm import batcher
+from app.llm.context_packer import pack_document, pack_table
+from app.llm.prompts import (
+    DATA_ANALYSIS,
+    IMAGE_VISION,
+    IMAGE_VISION_USER,
+    PDF_ANALYSIS,
+    get_prompt,
+)
+from app.llm.schemas import DataAnalysis, ImageAnalysis, PdfAnalysis
+
+# 텍스트 레이어가 이 길이 미만이면 PDF LLM은 OCR 결과를 기다린다
+_PDF_LAYER_MIN_CHARS = 200
+
+# 분석기/병합 로직이 바뀌면 올린다 — 같은 내용의 분석 결과를 공유하는 키에 포함 (analyzer_version)
+ANALYZER_VERSION = "1"
+
+
+# ── 컨텍스트 / 분석기 정의 ──────────────────────────────
+@dataclass
+class AnalysisContext:
+    """파일 1개에 대한 분석 입력 + 실행 중인 분석기 태스크."""
+
+    data: bytes
+    ext: str
+    file_type: str
+    slot_name: str
+    domain: str
+    period_start: date
+    period_end: date
+    file_id: str = ""
+    # 내용 sha256 — 있으면 content_only 분석기 결과를 같은 submit의 같은 내용 파일과 공유
+    sha256: str = ""
+    _tasks: dict[str, asyncio.Task] = field(default_factory=dict)
+
+    async def get(self, name: str) -> dict:
+        """다른 분석기 결과를 기다린다. 호출 측이 취소돼도 대상 분석기는 계속 실행."""
+        return await asyncio.shield(self._tasks[name])
+
+
+@dataclass(frozen=True)
+class Analyzer:
+    name: str
+    file_type: str
+    run: Callable[[AnalysisContext], Awaitable[dict | BaseModel]]
+    # 실행 전에 완료돼야 하는 분석기 이름
+    requires: tuple[str, ...] = ()
+    # 보강 분석기: (record, output) → record에 반영. 기본 분석기는 None (builder가 처리)
+    merge: Callable[[dict, Any], None] | None = None
+    # 선택 보강(LLM/Vision) — 데드라인 예산이 부족하면 생략 (DEGRADED)
+    optional: bool = False
+    # 슬롯과 무관하게 내용(+도메인/기간)만으로 결과가 정해지는 분석기 — submit 안에서 공유
+    content_only: bool = False
+    # 프로세스에 하나뿐인 모델을 쓰는 분석기 — 한 번에 하나씩 실행, 차례 대기는 타임아웃에 넣지 않는다
+    serial: bool = False
+
+    @property
+    def timeout(self) -> float:
+        return ANALYZER_TIMEOUTS.get(self.name, 30.0)
+
+    @property
+    def stage(self) -> str:
+        return "enrich" if self.optional else "extract"
+
+
+Builder = Callable[[dict[str, dict], AnalysisContext], dict]
+
+_ANALYZERS: dict[str, list[Analyzer]] = {}
+_BUILDERS: dict[str, Builder] = {}
+
+
+def register(analyzer: Analyzer) -> None:
+    _ANALYZERS.setdefault(analyzer.file_type, []).append(analyzer)
+
+
+def register_builder(file_type: str, builder: Builder) -> None:
+    _BUILDERS[file_type] = builder
+
+
+def get_analyzers(file_type: str) -> list[Analyzer]:
+    return _ANALYZERS.get(file_type, [])
+
+
+def analyzer_version(file_type: str) -> str:
+    """파일 타입의 분석 결과 버전 — ANALYZER_VERSION + 등록된 분석기 구성."""
+    return ANALYZER_VERSION + ":" + ",".join(a.name for a in get_analyzers(file_type))
+
+
+# serial 분석기 이름 → 차례 (이벤트 루프 1개에서만 쓴다)
+_SERIAL_GATES: dict[str, asyncio.Semaphore] = {}
+
+
+def _deadline_error(analyzer: Analyzer) -> dict:
+    return {"_error": "DEGRADED" if analyzer.optional else "DEADLINE"}
+
+
+async def _timed(ctx: AnalysisContext, analyzer: Analyzer) -> dict | BaseModel:
+    """분석기 실행에만 타임아웃(데드라인 예산 이내)을 건다."""
+    timeout = deadline.budget(analyzer.stage, analyzer.timeout)
+    # 데드라인 예산이 분석기 자체 타임아웃보다 먼저 끝나는 경우
+    by_deadline = timeout < analyzer.timeout
+    if timeout <= 0:
+        return _deadline_error(analyzer)
+    try:
+        return await asyncio.wait_for(analyzer.run(ctx), timeout=timeout)
+    except asyncio.TimeoutError:
+        return _deadline_error(analyzer) if by_deadline else {"_error": "TIMEOUT"}
+
+
+async def _invoke(ctx: AnalysisContext, analyzer: Analyzer) -> dict | BaseModel:
+    if not analyzer.serial:
+        return await _timed(ctx, analyzer)
+    gate = _SERIAL_GATES.setdefault(analyzer.name, asyncio.Semaphore(1))
+    async with gate:
+        return await _timed(ctx, analyzer)
+
+
+async def _run_one(ctx: AnalysisContext, analyzer: Analyzer) -> dict | BaseModel:
+    for dep in analyzer.requires:
+        await ctx.get(dep)
+    if deadline.stage_expired(analyzer.stage):
+        return _deadline_error(analyzer)
+    key = None
+    if analyzer.content_only and ctx.sha256:
+        key = (analyzer.name, ctx.sha256, ctx.ext, ctx.domain, ctx.period_start, ctx.period_end)
+    try:
+        # serial 분석기의 차례 대기는 남은 데드라인 예산으로만 제한 (데드라인이 없으면 무제한)
+        return await asyncio.wait_for(
+            duplicates.shared(key, lambda: _invoke(ctx, analyzer)),
+            timeout=deadline.budget(analyzer.stage),
+        )
+    except asyncio.CancelledError:
+        cancellation.record_cancelled("analyzer", analyzer.name)
+        raise
+    except asyncio.TimeoutError:
+        return _deadline_error(analyzer)
+    except Exception as exc:
+        return {"_error": type(exc).__name__}
+
+
+async def run_analyzers(ctx: AnalysisContext) -> dict:
+    """파일 타입에 등록된 분석기를 의존성 순서대로(독립적인 것은 동시에) 실행하고 병합한다."""
+    analyzers = get_analyzers(ctx.file_type)
+    ctx._tasks = {a.name: asyncio.create_task(_run_one(ctx, a)) for a in analyzers}
+    try:
+        results = await asyncio.gather(*ctx._tasks.values())
+    finally:
+        for t in ctx._tasks.values():
+            t.cancel()
+    outputs = dict(zip(ctx._tasks.keys(), results))
+
+    record = _BUILDERS[ctx.file_type](outputs, ctx)
+    record.setdefault("extras", {})
+    failed: list[str] = []
+    degraded: list[str] = []
+    for a in analyzers:
+        out = outputs[a.name]
+        if isinstance(out, dict) and "_error" in out:
+            failed.append(f"{a.name}:{out['_error']}")
+            if out["_error"] in ("DEGRADED", "DEADLINE"):
+                degraded.append(a.name)
+                deadline.mark_degraded(a.name)
+            continue
+        if a.merge is not None and out:
+            a.merge(record, out)
+    if failed:
+        record["analyzer_errors"] = failed
+    if degraded:
+        record["degraded"] = degraded
+        record["extras"]["degraded"] = ", ".join(degraded)
+    return record
+
+
+def _slot_keywords(ctx: AnalysisContext) -> list[str]:
+    """LLM 입력 선별용 키워드 — 도메인 rules의 SLOT_KEYWORDS + EXPECTED_HEADERS."""
+    rules_mod = get_rules_module(ctx.domain)
+    return [
+        *getattr(rules_mod, "SLOT_KEYWORDS", {}).get(ctx.slot_name, []),
+        *rules_mod.EXPECTED_HEADERS.get(ctx.slot_name, []),
+    ]
+
+
+def _add_dates(record: dict, dates: list) -> None:
+    for d in dates:
+        if d not in record["dates"]:
+            record["dates"].append(d)
+
+
+# ═══════════════════════════════════════════════════════════
+# PDF — 텍스트 레이어 → (OCR ∥ LLM)
+# ═══════════════════════════════════════════════════════════
+async def _pdf_layer(ctx: AnalysisContext) -> dict:
+    return await asyncio.to_thread(read_text_layer, ctx.data)
+
+
+async def _pdf_ocr(ctx: AnalysisContext) -> dict:
+    layer = await ctx.get("pdf_layer")
+    if not layer.get("needs_ocr"):
+        return {}
+    try:
+        return {"ocr_text": await run_ocr(ctx.data, "pdf")}
+    except Exception:
+        return {"ocr_failed": True}
+
+
+async def _pdf_llm(ctx: AnalysisContext) -> PdfAnalysis | dict:
+    layer = await ctx.get("pdf_layer")
+    if "_error" in layer:
+        return {}
+    pages: list[str] = layer.get("page_texts", [])
+    rule_reasons: list[str] = []
+    if len("\n".join(pages).strip()) < _PDF_LAYER_MIN_CHARS:
+        # 텍스트 레이어가 빈약 → OCR 결과를 사용
+        ocr = await ctx.get("pdf_ocr")
+        ocr_text = ocr.get("ocr_text") or ""
+        if len(ocr_text) > len("\n".join(pages)):
+            pages = [ocr_text]
+        if layer.get("needs_ocr") and (ocr.get("ocr_failed") or "_error" in ocr):
+            rule_reasons.append("OCR_FAILED")
+    # 서명/날짜가 있는 뒤쪽 페이지도 놓치지 않도록 관련 문단을 골라 토큰 예산에 맞춘다
+    text, _ = await asyncio.to_thread(
+        pack_document, pages, _slot_keywords(ctx), LLM_INPUT_TOKEN_BUDGET["pdf_llm"]
+    )
+    system = get_prompt(PDF_ANALYSIS, ctx.domain)
+    if llm_policy.should_skip(
+        "pdf_llm", ctx.domain, ctx.slot_name, rule_reasons,
+        file_id=ctx.file_id, prompt=system + text,
+    ):
+        return {}
+    # 작은 문서는 같은 submit의 다른 문서와 한 요청으로 묶일 수 있다
+    return await batcher.enrich_text("pdf_llm", system, text)
+
+
+def _build_pdf(outputs: dict[str, dict], ctx: AnalysisContext) -> dict:
+    layer = outputs["pdf_layer"]
+    if "_error" in layer:
+        return {
+            "text": "", "dates": [], "date_in_range": True,
+            "signature_detected": False, "ocr_applied": False,
+            "reasons": ["PARSE_FAILED"],
+        }
+    ocr = outputs.get("pdf_ocr", {})
+    ocr_failed = bool(ocr.get("ocr_failed")) or ("_error" in ocr and layer.get("needs_ocr"))
+    return build_pdf_result(layer, ocr.get("ocr_text"), ocr_failed, ctx.period_start, ctx.period_end)
+
+
+def _merge_pdf_llm(record: dict, llm: PdfAnalysis) -> None:
+    extras = record["extras"]
+    _add_dates(record, llm.dates)
+    if not record.get("signature_detected") and llm.has_signature:
+        record["signature_detected"] = True
+        record["reasons"] = [r for r in record["reasons"] if r != "SIGNATURE_MISSING"]
+    # anomalies → reason + extras 반영
+    if llm.anomalies:
+        record.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
+        extras["anomalies"] = "; ".join(llm.anomalies)
+    if llm.summary:
+        extras["summary"] = llm.summary
+    extras.update(llm.extras)
+
+
+# ═══════════════════════════════════════════════════════════
+# IMAGE — OCR ∥ Vision ∥ YOLO
+# ═══════════════════════════════════════════════════════════
+def _image_fmt(ext: str) -> str:
+    return "jpg" if ext in (".jpg", ".jpeg") else "png"
+
+
+async def _image_ocr(ctx: AnalysisContext) -> dict:
+    return await extract_image(ctx.data, _image_fmt(ctx.ext), ctx.period_start, ctx.period_end)
+
+
+async def _image_vision(ctx: AnalysisContext) -> ImageAnalysis | dict:
+    system = get_prompt(IMAGE_VISION, ctx.domain)
+    user = get_prompt(IMAGE_VISION_USER, ctx.domain)
+    # OCR과 병렬 실행이라 룰 사유는 아직 없음 — 슬롯 단위 정책(always)만 적용된다
+    if llm_policy.should_skip(
+        "image_vision", ctx.domain, ctx.slot_name,
+        file_id=ctx.file_id, prompt=system + user, image=True,
+    ):
+        return {}
+    # 정책 판단은 슬롯별, 응답은 내용 + 도메인 프롬프트로 정해진다 — 같은 사진은 한 번만 호출
+    return await duplicates.shared(
+        ("image_vision", ctx.sha256, ctx.domain) if ctx.sha256 else None,
+        lambda: batcher.enrich_image(
+            "image_vision", system, user, ctx.data, _image_fmt(ctx.ext), ctx.slot_name
+        ),
+    )
+
+
+async def _image_yolo(ctx: AnalysisContext) -> dict:
+    from app.extractors.yolo.person_counter import count_persons_async
+    return {"person_count": await count_persons_async(ctx.data)}
+
+
+async def _image_phash(ctx: AnalysisContext) -> dict:
+    if not DUPLICATE_DETECTION_ENABLED:
+        return {}
+    value = await asyncio.to_thread(duplicates.phash, ctx.data)
+    return {"phash": value} if value else {}
+
+
+def _build_image(outputs: dict[str, dict], ctx: AnalysisContext) -> dict:
+    ocr = outputs["image_ocr"]
+    if "_error" in ocr:
+        return {"text": "", "dates": [], "date_in_range": True, "reasons": ["OCR_FAILED"]}
+    return dict(ocr)
+
+
+def _merge_image_vision(record: dict, vision: ImageAnalysis) -> None:
+    extras = record["extras"]
+    _add_dates(record, vision.dates)
+    # violations → reason 반영
+    if vision.violations:
+        record.setdefault("reasons", []).append("VIOLATION_DETECTED")
+        extras["violations"] = "; ".join(vision.violations)
+    # person_count → extras
+    if vision.person_count is not None:
+        extras["person_count"] = str(vision.person_count)
+    # detected_objects (구 응답의 safety_objects 포함) → extras
+    if vision.detected_objects:
+        extras["detected_objects"] = ", ".join(vision.detected_objects)
+    # anomalies → reason 반영
+    if vision.anomalies:
+        record.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
+        extras["anomalies"] = "; ".join(vision.anomalies)
+    if vision.scene_description:
+        extras["scene_description"] = vision.scene_description
+    extras.update(vision.extras)
+
+
+def _merge_image_yolo(record: dict, yolo: dict) -> None:
+    # YOLO person count (LLM 값 덮어쓰기, 실패 시 LLM 폴백)
+    record["extras"]["person_count"] = str(yolo["person_count"])
+
+
+def _merge_image_phash(record: dict, out: dict) -> None:
+    # 중복/유사 사진 판정용 (pipeline/duplicates.annotate)
+    record["phash"] = out["phash"]
+
+
+# ═══════════════════════════════════════════════════════════
+# XLSX — 테이블 파싱 → LLM
+# ═══════════════════════════════════════════════════════════
+async def _xlsx_table(ctx: AnalysisContext) -> dict:
+    rules_mod = get_rules_module(ctx.domain)
+    expected = rules_mod.EXPECTED_HEADERS.get(ctx.slot_name, [])
+    df = await asyncio.to_thread(read_table, ctx.data, ctx.ext)
+    result = check_table(df, expected, ctx.period_start, ctx.period_end)
+    # LLM 입력 선별용 원본 표 (레코드에는 남기지 않음)
+    result["_df"] = df
+    return result
+
+
+async def _xlsx_llm(ctx: AnalysisContext) -> DataAnalysis | dict:
+    table = await ctx.get("xlsx_table")
+    if "_error" in table:
+        return {}
+    system = get_prompt(DATA_ANALYSIS, ctx.domain)
+    if llm_policy.should_skip(
+        "xlsx_llm", ctx.domain, ctx.slot_name, table.get("reasons", []),
+        file_id=ctx.file_id, prompt=system + table["df_preview"],
+    ):
+        return {}
+    # 앞 20행 대신 요약 통계 + 층화 표본 행
+    user, _ = await asyncio.to_thread(
+        pack_table, table["_df"], _slot_keywords(ctx), LLM_INPUT_TOKEN_BUDGET["xlsx_llm"]
+    )
+    return await batcher.enrich_text("xlsx_llm", system, user)
+
+
+def _build_xlsx(outputs: dict[str, dict], ctx: AnalysisContext) -> dict:
+    table = outputs["xlsx_table"]
+    if "_error" in table:
+        return {"df_preview": "", "dates": [], "date_in_range": True, "reasons": ["PARSE_FAILED"]}
+    return {k: v for k, v in table.items() if k != "_df"}
+
+
+def _merge_xlsx_llm(record: dict, llm: DataAnalysis) -> None:
+    extras = record["extras"]
+    _add_dates(record, llm.dates)
+    # missing_fields → reason 반영
+    if llm.missing_fields:
+        record.setdefault("reasons", []).append("LLM_MISSING_FIELDS")
+        extras["missing_fields"] = ", ".join(llm.missing_fields)
+    # anomalies → reason 반영
+    if llm.anomalies:
+        record.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
+        extras["anomalies"] = "; ".join(llm.anomalies)
+    extras.update(llm.extras)
+
+
+# ── 기본 등록 ────────────────────────────────────────────
+register(Analyzer("pdf_layer", "pdf", _pdf_layer, content_only=True))
+register(Analyzer("pdf_ocr", "pdf", _pdf_ocr, requires=("pdf_layer",), content_only=True))
+register(Analyzer("pdf_llm", "pdf", _pdf_llm, requires=("pdf_layer",), merge=_merge_pdf_llm, optional=True))
+register_builder("pdf", _build_pdf)
+
+register(Analyzer("image_ocr", "image", _image_ocr, content_only=True))
+register(Analyzer("image_vision", "image", _image_vision, merge=_merge_image_vision, optional=True))
+register(Analyzer("image_yolo", "image", _image_yolo, merge=_merge_image_yolo, content_only=True, serial=True))
+register(Analyzer("image_phash", "image", _image_phash, merge=_merge_image_phash, content_only=True))
+register_builder("image", _build_image)
+
+register(Analyzer("xlsx_table", "xlsx", _xlsx_table))
+register(Analyzer("xlsx_llm", "xlsx", _xlsx_llm, requires=("xlsx_table",), merge=_merge_xlsx_llm, optional=True))
+register_builder("xlsx", _build_xlsx)
@@ -0,0 +1,89 @@
+# app/pipeline/deadline.py
+
+"""
+Submit 요청 단위 데드라인 — 단계별 예산으로 나눠 모든 await에 전파한다.
+
+- run_submit 시작 시 도메인별 데드라인(SUBMIT_DEADLINE_SEC)으로 Deadline을 만들고 contextvar에 설정.
+  asyncio 태스크는 생성 시 context를 복사하므로 분석기/다운로드/LLM 호출까지 그대로 전달된다.
+- 각 단계는 budget(stage, cap)으로 남은 시간을 받아 asyncio.wait_for 타임아웃으로 쓴다.
+- 선택 보강(Vision, light LLM, 보완요청 다듬기, why 생성)은 예산이 끝나면 생략하고
+  mark_degraded()로 기록 → SubmitResponse.degraded. 룰 기반 판정은 그대로 반환된다.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.core.config import SUBMIT_DEADLINE_SEC, SUBMIT_STAGE_BUDGETS
+
+_DEFAULT_DEADLINE_SEC = 120.0
+
+
+class Deadline:
+    def __init__(self, total_sec: float, stages: dict[str, float] | None = None):
+        self.total_sec = total_sec
+        self.stages = stages if stages is not None else SUBMIT_STAGE_BUDGETS
+        self._start = time.monotonic()
+        # 예산 초과로 생략된 단계/분석기 (등록 순서 유지, 중복 없음)
+        self.degraded: list[str] = []
+
+    @classmethod
+    def for_domain(cls, domain: str) -> "Deadline":
+        return cls(SUBMIT_DEADLINE_SEC.get(domain, _DEFAULT_DEADLINE_SEC))
+
+    def fork(self) -> "Deadline":
+        """같은 시작 시각·예산, 별도 degraded 기록 — 요청과 분리된 공유 작업용 (pipeline/submit._analyse_shared)."""
+        other = Deadline(self.total_sec, self.stages)
+        other._start = self._start
+        return other
+
+    def remaining(self, stage: str | None = None) -> float:
+        """stage 예산 종료 시점까지 남은 시간(초). stage 없으면 전체 데드라인 기준."""
+        frac = self.stages.get(stage, 1.0) if stage else 1.0
+        return max(0.0, self._start + self.total_sec * frac - time.monotonic())
+
+    def expired(self, stage: str | None = None) -> bool:
+        return self.remaining(stage) <= 0.0
+
+    def mark_degraded(self, what: str) -> None:
+        if what not in self.degraded:
+            self.degraded.append(what)
+
+
+_current: ContextVar[Deadline | None] = ContextVar("submit_deadline", default=None)
+
+
+def current() -> Deadline | None:
+    return _current.get()
+
+
+@contextmanager
+def use_deadline(deadline: Deadline) -> Iterator[Deadline]:
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def budget(stage: str, cap: float | None = None) -> float | None:
+    """현재 데드라인 기준 stage 예산과 cap 중 작은 값. 데드라인이 없으면 cap 그대로 (None = 무제한)."""
+    dl = _current.get()
+    if dl is None:
+        return cap
+    left = dl.remaining(stage)
+    return left if cap is None else min(cap, left)
+
+
+def stage_expired(stage: str) -> bool:
+    dl = _current.get()
+    return dl is not None and dl.expired(stage)
+
+
+def mark_degraded(what: str) -> None:
+    dl = _current.get()
+    if dl is not None:
+        dl.mark_degraded(what)
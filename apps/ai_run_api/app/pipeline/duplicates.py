@@ -0,0 +1,433 @@
+# app/pipeline/duplicates.py
+
+"""
+중복/유사 파일 — 같은 submit 안에서는 분석을 한 번만 하고, 패키지를 넘어 재사용된 사진/문서를 표시한다.
+
+- 분석 공유 (use_memo / shared): 같은 submit 안의 같은 내용(sha256) 파일은 내용에만 의존하는 분석기
+  (PDF 텍스트 레이어·OCR, 이미지 OCR·YOLO·pHash — Analyzer.content_only)와 Vision 호출을 한 번만 실행한다.
+  슬롯이 달라도 공유한다. 슬롯 키워드/헤더에 의존하는 PDF·XLSX LLM 보강과 표 헤더 검사는 슬롯별로 실행.
+- 지문: 이미지 pHash (32×32 흑백 DCT 저주파 8×8 → 64bit) / 문서 텍스트 5글자 shingle의 MinHash(64개).
+- 조회: pHash는 다중 색인 해싱 (해밍 거리 ≤ PHASH_MAX_DISTANCE), MinHash는 LSH (16 band × 4 row) 후보를
+  추정 Jaccard(≥ TEXT_DUP_MIN_JACCARD)로 확인. 색인은 db/media_index.py에 저장하고, 프로세스마다
+  메모리 색인을 만들어 다른 워커가 추가한 행만 이어서 읽는다.
+- annotate(): 추출 결과 extras에 표시
+    duplicate_of            같은 submit에서 먼저 끝난 같은 내용 파일 (분석 공유)
+    near_duplicate_of       같은 submit의 유사 파일 (pHash 거리 / 텍스트 유사도)
+    reused_across_packages  다른 패키지에 이미 제출된 같은/유사 파일 수 — 보완요청으로 협력사에 보이므로
+                            다른 패키지의 id는 넣지 않는다 (id는 로그에만, 건수는 메트릭)
+- reused_across(): 색인된 파일 중 지금 다른 패키지와 같은/유사한 것이 있는지 (저장된 결과 재사용 판단용)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import itertools
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Iterator
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from app.core import metrics
+from app.core.config import (
+    DUPLICATE_DETECTION_ENABLED,
+    DUPLICATE_INDEX_RETENTION_DAYS,
+    PHASH_MAX_DISTANCE,
+    TEXT_DUP_MIN_JACCARD,
+)
+from app.db import media_index
+
+_MAX_LISTED = 3
+
+logger = logging.getLogger("ai_run.duplicates")
+
+_SHARED = metrics.counter(
+    "ai_run_duplicate_shared_total", "Content-only analyses within a submit by role (leader|reused)"
+)
+_FLAGGED = metrics.counter(
+    "ai_run_duplicate_files_total", "Files flagged as duplicates by scope (package|cross_package) and kind"
+)
+
+
+# ── submit 단위 분석 공유 ────────────────────────────────
+class Memo:
+    def __init__(self) -> None:
+        self.tasks: dict[Hashable, asyncio.Task] = {}
+        # 이번 submit에서 먼저 끝난 파일 지문: (file_id, sha256, pHash, MinHash)
+        self.seen: list[tuple[str, str, int | None, np.ndarray | None]] = []
+
+    def close(self) -> None:
+        for t in self.tasks.values():
+            t.cancel()
+
+
+_memo: ContextVar[Memo | None] = ContextVar("duplicate_memo", default=None)
+
+
+@contextmanager
+def use_memo(memo: Memo | None = None) -> Iterator[Memo]:
+    """memo를 주면 설정만 하고 닫지 않는다 (만든 쪽이 close). 없으면 새로 만들고 나갈 때 닫는다."""
+    owned = memo is None
+    memo = memo if memo is not None else Memo()
+    token = _memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _memo.reset(token)
+        if owned:
+            memo.close()
+
+
+async def shared(key: Hashable | None, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """같은 submit에서 같은 key는 한 번만 실행하고 결과 사본을 돌려준다. memo가 없거나 key가 None이면 그냥 실행.
+
+    먼저 호출한 쪽이 타임아웃/취소돼도 공유 실행은 계속된다 (submit이 끝나면 정리).
+    """
+    memo = _memo.get()
+    if memo is None or key is None:
+        return await fn()
+    task = memo.tasks.get(key)
+    if task is None:
+        task = memo.tasks[key] = asyncio.create_task(fn())
+        _SHARED.inc(role="leader")
+    else:
+        _SHARED.inc(role="reused")
+    return copy.deepcopy(await asyncio.shield(task))
+
+
+# ── 지문 ────────────────────────────────────────────────
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    m = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+    m[0] /= np.sqrt(2.0)
+    return m
+
+
+_DCT = _dct_matrix(32)
+
+
+def phash(data: bytes) -> str | None:
+    """이미지 → 64bit pHash (16진). 디코딩 실패 시 None."""
+    try:
+        pix = fitz.Pixmap(data)
+        if pix.alpha:
+            pix = fitz.Pixmap(pix, 0)
+        if pix.colorspace is None or pix.colorspace.n != 1:
+            pix = fitz.Pixmap(fitz.csGRAY, pix)
+        small = fitz.Pixmap(pix, 32, 32, None)
+        if small.alpha:
+            small = fitz.Pixmap(small, 0)
+        px = np.frombuffer(small.samples, dtype=np.uint8).reshape(small.height, small.width, small.n)
+    except Exception:
+        return None
+    low = (_DCT @ px[:, :, 0].astype(np.float64) @ _DCT.T)[:8, :8].flatten()
+    bits = low > np.median(low[1:])
+    return f"{int(''.join('1' if b else '0' for b in bits), 2):016x}"
+
+
+_SHINGLE = 5
+_PERMS = 64
+_BANDS = 16
+_ROWS = _PERMS // _BANDS
+_PRIME = (1 << 31) - 1
+_MIN_TEXT_CHARS = 50
+_rng = np.random.default_rng(46)
+_A = _rng.integers(1, _PRIME, _PERMS, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, _PERMS, dtype=np.uint64)
+_WS = re.compile(r"\s+")
+
+
+def minhash(text: str) -> np.ndarray | None:
+    """문서 텍스트 → MinHash 서명 (uint32 × 64). 공백은 무시 (OCR 띄어쓰기 차이). 짧으면 None."""
+    norm = _WS.sub("", text.lower())
+    if len(norm) < _MIN_TEXT_CHARS:
+        return None
+    shingles = {zlib.crc32(norm[i:i + _SHINGLE].encode("utf-8")) % _PRIME for i in range(len(norm) - _SHINGLE + 1)}
+    x = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+    sig = np.full(_PERMS, _PRIME, dtype=np.uint64)
+    for start in range(0, len(x), 4096):
+        block = x[start:start + 4096]
+        sig = np.minimum(sig, ((np.outer(_A, block) + _B[:, None]) % _PRIME).min(axis=1))
+    return sig.astype(np.uint32)
+
+
+def _jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / _PERMS
+
+
+def _hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+# ── 조회 구조 ────────────────────────────────────────────
+class PhashIndex:
+    """64bit pHash 해밍 거리 조회 — 다중 색인 해싱.
+
+    64bit를 16bit 구간 4개로 나눠 구간 값별로 색인한다. 전체 거리가 radius 이하면 비둘기집 원리로
+    적어도 한 구간은 거리 radius // 4 이하이므로, 구간마다 그 거리 안의 값만 찾아보고 후보를
+    해밍 거리로 확인하면 빠짐없이 찾는다 (radius 6: 구간당 17개 조회, 후보는 색인 크기 / 65536 × 68).
+    무작위 값 10만 개·radius 6에서 BK-tree는 거의 모든 노드를 방문한다 — benchmarks/duplicates.py
+    """
+
+    _CHUNKS = 4
+    _WIDTH = 16
+
+    def __init__(self, radius: int) -> None:
+        self.radius = radius
+        mask = (1 << self._WIDTH) - 1
+        self._spans = [(c * self._WIDTH, mask) for c in range(self._CHUNKS)]
+        # 구간 안에서 radius // 4 비트 이하를 바꾸는 XOR 마스크
+        self._probes = [
+            sum(1 << b for b in bits)
+            for n in range(radius // self._CHUNKS + 1)
+            for bits in itertools.combinations(range(self._WIDTH), n)
+        ]
+        self._tables: list[dict[int, list[tuple[int, Hashable]]]] = [{} for _ in self._spans]
+        self.size = 0
+
+    def add(self, value: int, key: Hashable) -> None:
+        self.size += 1
+        for table, (lo, mask) in zip(self._tables, self._spans):
+            table.setdefault((value >> lo) & mask, []).append((value, key))
+
+    def remove(self, value: int, key: Hashable) -> None:
+        entry = (value, key)
+        for table, (lo, mask) in zip(self._tables, self._spans):
+            chunk = (value >> lo) & mask
+            bucket = table.get(chunk)
+            if bucket is None or entry not in bucket:
+                return
+            bucket.remove(entry)
+            if not bucket:
+                del table[chunk]
+        self.size -= 1
+
+    def search(self, value: int) -> list[tuple[int, Hashable, int]]:
+        """거리 radius 이내의 (거리, 키, 저장된 값)."""
+        found: dict[tuple[int, Hashable], int] = {}
+        for table, (lo, mask) in zip(self._tables, self._spans):
+            chunk = (value >> lo) & mask
+            for probe in self._probes:
+                for entry in table.get(chunk ^ probe, ()):
+                    if entry not in found:
+                        found[entry] = (value ^ entry[0]).bit_count()
+        return [(d, key, v) for (v, key), d in found.items() if d <= self.radius]
+
+
+class MinHashLSH:
+    def __init__(self) -> None:
+        self._buckets: list[dict[bytes, list[Hashable]]] = [{} for _ in range(_BANDS)]
+        self.sigs: dict[Hashable, np.ndarray] = {}
+
+    def add(self, key: Hashable, sig: np.ndarray) -> None:
+        self.remove(key)
+        self.sigs[key] = sig
+        for b in range(_BANDS):
+            self._buckets[b].setdefault(sig[b * _ROWS:(b + 1) * _ROWS].tobytes(), []).append(key)
+
+    def remove(self, key: Hashable) -> None:
+        sig = self.sigs.pop(key, None)
+        if sig is None:
+            return
+        for b in range(_BANDS):
+            band = sig[b * _ROWS:(b + 1) * _ROWS].tobytes()
+            bucket = self._buckets[b][band]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[b][band]
+
+    def query(self, sig: np.ndarray, min_jaccard: float) -> list[tuple[float, Hashable]]:
+        candidates: set[Hashable] = set()
+        for b in range(_BANDS):
+            candidates.update(self._buckets[b].get(sig[b * _ROWS:(b + 1) * _ROWS].tobytes(), ()))
+        out = []
+        for key in candidates:
+            j = _jaccard(sig, self.sigs[key])
+            if j >= min_jaccard:
+                out.append((j, key))
+        return sorted(out, reverse=True)
+
+
+class _Index:
+    """패키지 간 색인 (프로세스 단위). 키 = (package_id, file_id).
+
+    같은 키를 다시 넣으면 이전 값을 조회 구조에서 빼고 최신 값만 둔다. 보존 기간이 지난 키는
+    _refresh마다 오래된 것부터 뺀다 (_latest는 DB rowid 순 = 저장 순).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_rowid = 0
+        self._sha: dict[str, set[tuple[str, str]]] = {}
+        # 키 → (sha256, pHash, MinHash 서명, 저장 시각)
+        self._latest: OrderedDict[tuple[str, str], tuple[str, int | None, np.ndarray | None, float]] = OrderedDict()
+        self._phash = PhashIndex(PHASH_MAX_DISTANCE)
+        self._lsh = MinHashLSH()
+
+    @property
+    def _retention_sec(self) -> float:
+        return DUPLICATE_INDEX_RETENTION_DAYS * 86400.0
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        old = self._latest.pop(key, None)
+        if old is None:
+            return
+        sha, ph, sig, _ = old
+        keys = self._sha.get(sha)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._sha[sha]
+        if ph is not None:
+            self._phash.remove(ph, key)
+        if sig is not None:
+            self._lsh.remove(key)
+
+    def _add(
+        self, key: tuple[str, str], sha: str, ph: int | None, sig: np.ndarray | None, created_at: float
+    ) -> None:
+        self._remove(key)
+        self._latest[key] = (sha, ph, sig, created_at)
+        self._sha.setdefault(sha, set()).add(key)
+        if ph is not None:
+            self._phash.add(ph, key)
+        if sig is not None:
+            self._lsh.add(key, sig)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._retention_sec
+        while self._latest:
+            key, (_, _, _, created_at) = next(iter(self._latest.items()))
+            if created_at >= cutoff:
+                break
+            self._remove(key)
+
+    def _refresh(self) -> None:
+        for r in media_index.load_since(self._last_rowid, self._retention_sec):
+            sig = np.frombuffer(r["minhash"], dtype=np.uint32) if r["minhash"] else None
+            ph = int(r["phash"], 16) if r["phash"] else None
+            self._add((r["package_id"], r["file_id"]), r["sha256"], ph, sig, r["created_at"])
+            self._last_rowid = r["rowid"]
+        self._expire(time.time())
+
+    def find(self, package_id: str, sha: str, ph: int | None, sig: np.ndarray | None) -> list[str]:
+        """다른 패키지의 같은/유사 파일 설명 목록 (가까운 순)."""
+        hits: dict[tuple[str, str], tuple[float, str]] = {}
+        for key in self._sha.get(sha, ()):
+            if key[0] != package_id:
+                hits[key] = (-1.0, "exact")
+        if ph is not None:
+            for d, key, value in self._phash.search(ph):
+                if key[0] != package_id and key not in hits:
+                    hits[key] = (float(d), f"phash distance {d}")
+        if sig is not None:
+            for j, key in self._lsh.query(sig, TEXT_DUP_MIN_JACCARD):
+                if key[0] != package_id and key not in hits:
+                    hits[key] = (1.0 - j, f"text similarity {j:.2f}")
+        ranked = sorted(hits.items(), key=lambda kv: kv[1][0])
+        return [f"{pkg}/{fid} ({why})" for (pkg, fid), (_, why) in ranked]
+
+    def lookup_and_add(
+        self, package_id: str, file_id: str, sha: str, ph: int | None, sig: np.ndarray | None
+    ) -> list[str]:
+        with self._lock:
+            self._refresh()
+            found = self.find(package_id, sha, ph, sig)
+        media_index.put(
+            package_id, file_id, sha,
+            f"{ph:016x}" if ph is not None else None,
+            sig.tobytes() if sig is not None else None,
+            self._retention_sec,
+        )
+        return found
+
+    def any_across(self, package_id: str, file_ids: Iterable[str]) -> bool:
+        """file_ids 중 다른 패키지에 같은/유사 파일이 있는 것이 있으면 True. 색인에 없는 파일도 True (확인 불가)."""
+        with self._lock:
+            self._refresh()
+            for fid in file_ids:
+                entry = self._latest.get((package_id, fid))
+                if entry is None:
+                    return True
+                sha, ph, sig, _ = entry
+                if self.find(package_id, sha, ph, sig):
+                    return True
+        return False
+
+
+_INDEX = _Index()
+
+
+# ── 추출 결과 표시 ───────────────────────────────────────
+def _same_package(
+    memo: Memo, sha: str, ph: int | None, sig: np.ndarray | None
+) -> tuple[list[str], list[str]]:
+    exact: list[str] = []
+    near: list[str] = []
+    for fid, other_sha, other_ph, other_sig in memo.seen:
+        if other_sha == sha:
+            exact.append(fid)
+        elif ph is not None and other_ph is not None and _hamming(ph, other_ph) <= PHASH_MAX_DISTANCE:
+            near.append(f"{fid} (phash distance {_hamming(ph, other_ph)})")
+        elif sig is not None and other_sig is not None and _jaccard(sig, other_sig) >= TEXT_DUP_MIN_JACCARD:
+            near.append(f"{fid} (text similarity {_jaccard(sig, other_sig):.2f})")
+    return exact, near
+
+
+async def reused_across(package_id: str, file_ids: Iterable[str]) -> bool:
+    """annotate()로 색인된 파일 중 지금 reused_across_packages로 표시될 파일이 있는지. 중복 검사가 꺼져 있으면 False."""
+    if not DUPLICATE_DETECTION_ENABLED:
+        return False
+    return await asyncio.to_thread(_INDEX.any_across, package_id, list(file_ids))
+
+
+async def annotate(extraction: dict, package_id: str) -> None:
+    """추출이 끝난 파일 1개를 같은 submit의 앞선 파일들과 패키지 간 색인에 비교해 extras에 표시하고 색인에 추가."""
+    sha = extraction.get("sha256")
+    if not DUPLICATE_DETECTION_ENABLED or not sha:
+        return
+    ph = int(extraction["phash"], 16) if extraction.get("phash") else None
+    sig = None
+    if ph is None and extraction.get("text"):
+        sig = await asyncio.to_thread(minhash, extraction["text"])
+
+    extras = extraction.setdefault("extras", {})
+    # 증분 재제출로 재사용된 레코드에는 지난 제출 때의 표시가 남아 있다
+    for k in ("duplicate_of", "near_duplicate_of", "reused_across_packages"):
+        extras.pop(k, None)
+    memo = _memo.get()
+    if memo is not None:
+        exact, near = _same_package(memo, sha, ph, sig)
+        if exact:
+            extras["duplicate_of"] = ", ".join(exact[:_MAX_LISTED])
+            _FLAGGED.inc(scope="package", kind="exact")
+        if near:
+            extras["near_duplicate_of"] = ", ".join(near[:_MAX_LISTED])
+            _FLAGGED.inc(scope="package", kind="near")
+        memo.seen.append((extraction["file_id"], sha, ph, sig))
+
+    try:
+        across = await asyncio.to_thread(
+            _INDEX.lookup_and_add, package_id, extraction["file_id"], sha, ph, sig
+        )
+    except Exception:
+        return
+    if across:
+        extras["reused_across_packages"] = str(len(across))
+        _FLAGGED.inc(scope="cross_package", kind="exact" if "(exact)" in across[0] else "near")
+        logger.info(
+            "file reused across packages package_id=%s file_id=%s matches=%s",
+            package_id, extraction["file_id"], ", ".join(across[:_MAX_LISTED]),
+        )
@@ -0,0 +1,175 @@
+# app/pipeline/incremental.py
+
+"""
+증분 재제출 — NEED_CLARIFY 후 일부 파일만 교체해 패키지 전체를 다시 submit 하는 경우.
+
+- 파일: 다운로드 후 내용(sha256) + 슬롯/타입이 이전 파일과 같으면 → 분석 없이 이전 추출 레코드 재사용
+        (같은 저장 경로에 파일을 덮어쓰는 경우가 있어 경로만으로는 재사용하지 않는다)
+        분석 오류(analyzer_errors — 내용 판별 거절 sniff:* 제외)나 생략(degraded)이 있던 파일은 저장하지 않는다
+- 슬롯: 파일 구성이 같고 모든 파일이 재사용된 슬롯 → 이전 SlotResult / 보완요청 재사용
+- 교차검증: 검증마다 입력 슬롯을 선언하므로(engines/registry.CrossCheck) 입력이 바뀐 검증만 다시 실행
+- 최종 판정(JUDGE)은 항상 다시 수행
+
+상태는 package_id 단위로 db/submit_state.py에 저장되며, 도메인/기간이 바뀌거나 분석기/룰/프롬프트 버전
+(result_cache.pipeline_version)이 바뀌면 재사용하지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+from dataclasses import dataclass, field
+
+from app.core.config import INCREMENTAL_SUBMIT_ENABLED
+from app.db import submit_state
+from app.pipeline import deadline
+from app.schemas.run import Clarification, FileRef, SlotResult, SubmitRequest
+from app.storage.zip_ingest import ENTRY_MARK
+
+
+def uri_path(uri: str) -> str:
+    """SAS 토큰 등 query를 제외한 저장 경로. ZIP 항목 uri는 항목 표시(#zip=...)를 유지."""
+    base, sep, entry = uri.partition(ENTRY_MARK)
+    return base.split("?", 1)[0] + sep + entry
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _period_key(req: SubmitRequest) -> str:
+    return f"{req.period_start.isoformat()}~{req.period_end.isoformat()}"
+
+
+@dataclass
+class PreviousSubmit:
+    # file_id → {uri_path, sha256, slot_name, file_type, record}
+    files: dict[str, dict] = field(default_factory=dict)
+    # slot_name → SlotResult dump / file_id 목록
+    slot_results: dict[str, dict] = field(default_factory=dict)
+    slot_files: dict[str, list[str]] = field(default_factory=dict)
+    # 교차검증 결과 (SlotResult dump)
+    cross_results: list[dict] = field(default_factory=list)
+    # slot_name → Clarification dump
+    clarifications: dict[str, dict] = field(default_factory=dict)
+
+    def _reuse(self, entry: dict, file: FileRef, slot_name: str) -> dict:
+        rec = copy.deepcopy(entry["record"])
+        rec["file_id"] = file.file_id
+        rec["file_name"] = file.file_name or file.storage_uri.rsplit("/", 1)[-1]
+        rec["slot_name"] = slot_name
+        rec["reused"] = True
+        return rec
+
+    def reuse_by_hash(self, sha: str, file: FileRef, slot_name: str, file_type: str) -> dict | None:
+        for entry in self.files.values():
+            if entry.get("sha256") == sha and entry["slot_name"] == slot_name and entry["file_type"] == file_type:
+                return self._reuse(entry, file, slot_name)
+        return None
+
+    def unchanged_slots(self, slot_groups: dict[str, list[dict]]) -> set[str]:
+        """파일 구성이 같고 모든 파일이 재사용된 슬롯."""
+        out: set[str] = set()
+        for sn, exs in slot_groups.items():
+            if sn not in self.slot_results:
+                continue
+            if sorted(e["file_id"] for e in exs) != sorted(self.slot_files.get(sn, [])):
+                continue
+            if all(e.get("reused") for e in exs):
+                out.add(sn)
+        return out
+
+    def slot_result(self, slot_name: str) -> SlotResult:
+        return SlotResult.model_validate(self.slot_results[slot_name])
+
+    def cross_results_by_name(self) -> dict[str, list[SlotResult]]:
+        """교차검증 slot_name → 결과 (한 검증이 같은 slot_name 결과를 여러 개 낼 수 있다)."""
+        out: dict[str, list[SlotResult]] = {}
+        for d in self.cross_results:
+            out.setdefault(d["slot_name"], []).append(SlotResult.model_validate(d))
+        return out
+
+    def clarification_map(self) -> dict[str, Clarification]:
+        return {k: Clarification.model_validate(v) for k, v in self.clarifications.items()}
+
+
+def _version(domain: str) -> str:
+    # result_cache가 이 모듈을 import하므로 지연 import
+    from app.pipeline.result_cache import pipeline_version
+
+    return pipeline_version(domain)
+
+
+def _reusable(ex: dict) -> bool:
+    """다음 제출 때 재사용해도 되는 레코드 — 데드라인 생략/일시적일 수 있는 분석 오류가 없는 것."""
+    if ex.get("degraded"):
+        return False
+    return all(e.startswith("sniff:") for e in ex.get("analyzer_errors", []))
+
+
+async def load_previous(req: SubmitRequest) -> PreviousSubmit | None:
+    if not INCREMENTAL_SUBMIT_ENABLED:
+        return None
+    try:
+        state = await asyncio.to_thread(submit_state.load, req.package_id, req.domain, _period_key(req))
+    except Exception:
+        return None
+    if not state:
+        return None
+    if state.get("version") != _version(req.domain):
+        return None
+    return PreviousSubmit(
+        files=state.get("files", {}),
+        slot_results=state.get("slot_results", {}),
+        slot_files=state.get("slot_files", {}),
+        cross_results=state.get("cross_results", []),
+        clarifications=state.get("clarifications", {}),
+    )
+
+
+async def save_state(
+    req: SubmitRequest,
+    triaged: list[dict],
+    extractions: list[dict],
+    slot_result_map: dict[str, SlotResult],
+    cross_results: list[SlotResult],
+    clarifications: list[Clarification],
+) -> None:
+    if not INCREMENTAL_SUBMIT_ENABLED:
+        return
+    files: dict[str, dict] = {}
+    slot_files: dict[str, list[str]] = {}
+    for t, ex in zip(triaged, extractions):
+        if not _reusable(ex):
+            # 일부 분석이 생략/실패한 파일은 다음 제출 때 다시 분석
+            continue
+        record = {k: v for k, v in ex.items() if k != "reused"}
+        files[ex["file_id"]] = {
+            "uri_path": uri_path(t["file"].storage_uri),
+            "sha256": ex.get("sha256"),
+            "slot_name": ex["slot_name"],
+            "file_type": t["file_type"],
+            "record": record,
+        }
+    for ex in extractions:
+        slot_files.setdefault(ex["slot_name"], []).append(ex["file_id"])
+    dl = deadline.current()
+    degraded = set(dl.degraded) if dl is not None else set()
+    state = {
+        "version": _version(req.domain),
+        "files": files,
+        "slot_results": {sn: sr.model_dump(mode="json") for sn, sr in slot_result_map.items()},
+        "slot_files": slot_files,
+        "cross_results": [sr.model_dump(mode="json") for sr in cross_results],
+        "clarifications": {
+            c.slot_name: c.model_dump(mode="json")
+            for c in clarifications
+            if f"clarify:{c.slot_name}" not in degraded
+        },
+    }
+    try:
+        await asyncio.to_thread(submit_state.save, req.package_id, req.domain, _period_key(req), state)
+    except Exception:
+        # 저장 실패는 응답에 영향 주지 않는다 (다음 제출이 전체 재처리될 뿐)
+        pass
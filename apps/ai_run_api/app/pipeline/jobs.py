@@ -0,0 +1,210 @@
+# app/pipeline/jobs.py
+
+"""
+비동기 Submit Job 모드.
+
+- POST /run/jobs  → job_id 즉시 반환 (SQLite 큐에 적재, 재시작 후에도 유지)
+- GET  /run/jobs/{job_id}?wait=N → 상태/결과 조회 (wait>0이면 완료까지 최대 N초 long-poll)
+- 워커 풀(JOB_WORKER_COUNT개)이 큐를 소비하며 job마다 JOB_DEADLINE_SEC 제한으로 run_submit 실행
+  (입장 대기 포함). submit 내부 단계 예산도 도메인 동기 데드라인이 아니라 JOB_DEADLINE_SEC 기준
+- lease: 실행 중에는 _HEARTBEAT_SEC마다 연장한다. lease를 잃으면(다른 워커가 재claim) 실행을 멈추고,
+  완료/실패는 claim token이 맞을 때만 기록된다 (db/job_queue.py)
+- DELETE /run/jobs/{job_id} → 취소. 실행 중인 워커는 JOB_POLL_INTERVAL_SEC마다 상태를 확인해
+  CANCELLED면 진행 중인 다운로드/OCR/LLM을 중단한다 (다른 프로세스 워커 포함)
+- 멱등성: 정규화한 요청(result_cache.fingerprint — 패키지/도메인/기간/파일/slot_hint)이 같으면
+  대기·실행 중이거나 JOB_REUSE_TTL_SEC 안에 완료된 job을 그대로 반환 (FAILED/CANCELLED 제외)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from app.core.config import (
+    JOB_DEADLINE_SEC,
+    JOB_LONG_POLL_MAX_SEC,
+    JOB_POLL_INTERVAL_SEC,
+    JOB_REUSE_TTL_SEC,
+    JOB_WORKER_COUNT,
+)
+from app.core.cancellation import RequestCancelled, run_cancellable
+from app.db import job_queue
+from app.pipeline import admission, result_cache
+from app.pipeline.deadline import Deadline
+from app.pipeline.submit import run_submit
+from app.schemas.run import JobResponse, SubmitRequest, SubmitResponse
+
+logger = logging.getLogger("ai_run.jobs")
+
+_TERMINAL = ("DONE", "FAILED", "CANCELLED")
+
+# 프로세스가 죽은 경우 lease 만료 후 재실행. 이 횟수를 넘기면 FAILED 처리
+_MAX_ATTEMPTS = 3
+# 실행 중인 워커가 _HEARTBEAT_SEC마다 lease를 _LEASE_SEC만큼 연장한다
+_LEASE_SEC = 120.0
+_HEARTBEAT_SEC = 30.0
+
+_workers: list[asyncio.Task] = []
+_wakeup: asyncio.Event | None = None
+_finished: dict[str, asyncio.Event] = {}
+
+
+# ── 멱등 키 ─────────────────────────────────────────────
+def idempotency_key(req: SubmitRequest) -> str:
+    """정규화한 요청 fingerprint — SAS 토큰, 파일/슬롯 순서, hint 표시용 필드는 무시 (pipeline/result_cache.py)."""
+    return result_cache.fingerprint(req)
+
+
+def _to_response(row: dict) -> JobResponse:
+    result = None
+    if row.get("result_json"):
+        result = SubmitResponse.model_validate_json(row["result_json"])
+    return JobResponse(
+        job_id=row["job_id"],
+        package_id=row["package_id"],
+        status=row["status"],
+        attempts=row["attempts"],
+        result=result,
+        error=row.get("error"),
+    )
+
+
+# ── API용 진입점 ─────────────────────────────────────────
+async def enqueue_submit(req: SubmitRequest) -> JobResponse:
+    row, created = await asyncio.to_thread(
+        job_queue.enqueue, idempotency_key(req), req.package_id, req.model_dump_json(), JOB_REUSE_TTL_SEC
+    )
+    if created and _wakeup is not None:
+        _wakeup.set()
+    return _to_response(row)
+
+
+async def get_job(job_id: str, wait: float = 0.0) -> JobResponse | None:
+    """job 조회. wait>0이면 DONE/FAILED가 될 때까지 최대 wait초 대기 (long-poll)."""
+    deadline = time.monotonic() + min(max(wait, 0.0), JOB_LONG_POLL_MAX_SEC)
+    ev: asyncio.Event | None = None
+    try:
+        while True:
+            row = await asyncio.to_thread(job_queue.get, job_id)
+            if row is None:
+                return None
+            remaining = deadline - time.monotonic()
+            if row["status"] in _TERMINAL or remaining <= 0:
+                return _to_response(row)
+            # 같은 프로세스 워커면 이벤트로 즉시 깨어나고, 다른 프로세스면 주기적으로 재조회
+            ev = _finished.setdefault(job_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(ev.wait(), timeout=min(remaining, JOB_POLL_INTERVAL_SEC))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        # 다른 프로세스 워커가 끝낸 job의 이벤트는 아무도 치우지 않는다
+        if ev is not None and _finished.get(job_id) is ev:
+            del _finished[job_id]
+
+
+async def cancel_job(job_id: str) -> JobResponse | None:
+    row = await asyncio.to_thread(job_queue.cancel, job_id)
+    if row is None:
+        return None
+    ev = _finished.pop(job_id, None)
+    if ev is not None:
+        ev.set()
+    return _to_response(row)
+
+
+# ── 워커 풀 ─────────────────────────────────────────────
+async def _stopped(job_id: str, token: str) -> bool:
+    """취소됐거나 lease를 잃었으면(다른 워커가 재claim) True."""
+    return not await asyncio.to_thread(job_queue.owns, job_id, token)
+
+
+async def _heartbeat(job_id: str, token: str) -> None:
+    while True:
+        await asyncio.sleep(_HEARTBEAT_SEC)
+        try:
+            if not await asyncio.to_thread(job_queue.renew, job_id, token, _LEASE_SEC):
+                return
+        except Exception as exc:
+            logger.warning("job lease renew failed job_id=%s err=%s", job_id, exc)
+
+
+async def _run_job(req: SubmitRequest, dl: Deadline) -> SubmitResponse:
+    # 동기 요청과 같은 용량을 나눠 쓰되 가장 낮은 우선순위로, 거절 없이 기다린다 (대기도 job 데드라인에 포함)
+    async with admission.admit("job", req.files, reject=False):
+        return await run_submit(req, request_deadline=dl)
+
+
+async def _execute(job: dict) -> None:
+    job_id = job["job_id"]
+    token = job["claim_token"]
+    if job["attempts"] > _MAX_ATTEMPTS:
+        await asyncio.to_thread(job_queue.fail, job_id, token, "MAX_ATTEMPTS_EXCEEDED")
+        return
+    heartbeat = asyncio.create_task(_heartbeat(job_id, token))
+    try:
+        req = SubmitRequest.model_validate_json(job["request_json"])
+        dl = Deadline(JOB_DEADLINE_SEC)
+        resp = await asyncio.wait_for(
+            run_cancellable(
+                _run_job(req, dl), lambda: _stopped(job_id, token),
+                reason="job_cancelled", poll_sec=JOB_POLL_INTERVAL_SEC,
+            ),
+            timeout=JOB_DEADLINE_SEC,
+        )
+        if not await asyncio.to_thread(job_queue.complete, job_id, token, resp.model_dump_json()):
+            logger.warning("submit job result dropped (cancelled or lease lost) job_id=%s", job_id)
+    except RequestCancelled:
+        logger.info("submit job cancelled or lease lost job_id=%s", job_id)
+    except asyncio.TimeoutError:
+        logger.warning("submit job deadline exceeded job_id=%s", job_id)
+        await asyncio.to_thread(job_queue.fail, job_id, token, "DEADLINE_EXCEEDED")
+    except Exception as exc:
+        logger.warning("submit job failed job_id=%s err=%s", job_id, exc)
+        await asyncio.to_thread(job_queue.fail, job_id, token, f"{type(exc).__name__}: {exc}")
+    finally:
+        heartbeat.cancel()
+
+
+async def _worker_loop(idx: int) -> None:
+    assert _wakeup is not None
+    while True:
+        try:
+            job = await asyncio.to_thread(job_queue.claim, _LEASE_SEC)
+        except Exception as exc:
+            logger.warning("job claim failed worker=%s err=%s", idx, exc)
+            job = None
+        if job is None:
+            _wakeup.clear()
+            try:
+                await asyncio.wait_for(_wakeup.wait(), timeout=JOB_POLL_INTERVAL_SEC)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        try:
+            await _execute(job)
+        except Exception as exc:
+            # 완료/실패 기록 실패(DB lock 등) — 워커는 계속 돈다. job은 lease 만료 후 다시 실행된다
+            logger.exception("submit job execution failed worker=%s job_id=%s err=%s", idx, job["job_id"], exc)
+        ev = _finished.pop(job["job_id"], None)
+        if ev is not None:
+            ev.set()
+
+
+async def start_workers(count: int = JOB_WORKER_COUNT) -> None:
+    global _wakeup
+    if _workers:
+        return
+    _wakeup = asyncio.Event()
+    for i in range(max(count, 0)):
+        _workers.append(asyncio.create_task(_worker_loop(i), name=f"submit-job-worker-{i}"))
+
+
+async def stop_workers() -> None:
+    """실행 중 job은 취소된다. RUNNING 상태는 lease 만료 후 다른 워커가 다시 가져간다."""
+    for t in _workers:
+        t.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
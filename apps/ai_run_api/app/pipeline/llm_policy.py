@@ -0,0 +1,163 @@
+# app/pipeline/llm_policy.py
+
+"""
+룰 우선 LLM 생략 정책 — 룰 결과만으로 결론이 정해진 경우 LLM 호출을 하지 않는다.
+
+- 정책은 SkipRule 목록으로 선언한다 (호출 종류 × 조건 × 슬롯 패턴).
+  도메인 rules 모듈에 LLM_SKIP_RULES가 있으면 기본값(DEFAULT_SKIP_RULES) 대신 사용.
+- 호출 종류: pdf_llm / xlsx_llm / image_vision (파일 보강), clarify (보완요청 다듬기), judge (최종 why)
+- 조건:
+  * need_fix     — 룰 사유에 NEED_FIX 코드가 있음 (LLM 결과와 무관하게 슬롯은 NEED_FIX)
+  * all_pass     — 모든 슬롯이 PASS (why는 템플릿으로 충분)
+  * only_reasons — 사유가 모두 rule.reasons 안에 있음
+  * always       — 해당 슬롯에서는 항상 생략 (슬롯 패턴과 함께 사용)
+- 생략된 호출은 요청 단위 리포트(SubmitResponse.llm_skip)에 추정 토큰 수와 함께 기록된다.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Iterable, Iterator
+
+from app.core.config import LLM_SKIP_POLICY_ENABLED
+from app.engines.registry import get_rules_module
+from app.llm.tokens import count_tokens
+from app.pipeline.verdicts import NEED_FIX_REASONS
+from app.schemas.run import LLMSkipReport, SkippedLLMCall
+
+
+@dataclass(frozen=True)
+class SkipRule:
+    call: str
+    when: str
+    # fnmatch 패턴 — 비어 있으면 모든 슬롯
+    slots: tuple[str, ...] = ()
+    # only_reasons 조건에서 허용하는 사유 코드
+    reasons: frozenset[str] = frozenset()
+
+    @property
+    def name(self) -> str:
+        return f"{self.call}:{self.when}"
+
+    def applies_to(self, slot_name: str) -> bool:
+        return not self.slots or any(fnmatch(slot_name, p) for p in self.slots)
+
+
+DEFAULT_SKIP_RULES: tuple[SkipRule, ...] = (
+    # 파싱/헤더/OCR 실패로 이미 NEED_FIX → 문서 LLM 보강은 판정을 바꾸지 못한다
+    SkipRule("pdf_llm", "need_fix"),
+    SkipRule("xlsx_llm", "need_fix"),
+    # 파일 자체를 다시 내야 하는 경우 → 템플릿 재제출 안내로 충분
+    SkipRule("clarify", "only_reasons", reasons=frozenset({"PARSE_FAILED", "OCR_FAILED", "EMPTY_TABLE"})),
+    # 전부 PASS → heavy 모델로 why를 쓸 필요 없음
+    SkipRule("judge", "all_pass"),
+)
+
+# 추정 토큰 — 입력은 tiktoken 기준, 출력/이미지는 대략치 (실측 토큰은 /metrics 참고)
+_IMAGE_INPUT_TOKENS = 765
+_EST_OUTPUT_TOKENS: dict[str, int] = {
+    "pdf_llm": 300,
+    "xlsx_llm": 300,
+    "image_vision": 300,
+    "clarify": 200,
+    "judge": 400,
+}
+
+
+def rules_for(domain: str) -> tuple[SkipRule, ...]:
+    try:
+        rules_mod = get_rules_module(domain)
+    except KeyError:
+        return DEFAULT_SKIP_RULES
+    return tuple(getattr(rules_mod, "LLM_SKIP_RULES", DEFAULT_SKIP_RULES))
+
+
+def _allowed_reasons(domain: str, reasons: Iterable[str]) -> list[str]:
+    """도메인 화이트리스트(REASON_CODES)를 통과하는 사유만 — 실제 슬롯 판정과 같은 기준."""
+    try:
+        allowed = set(getattr(get_rules_module(domain), "REASON_CODES", {}).keys())
+    except KeyError:
+        allowed = set()
+    return [r for r in reasons if not allowed or r in allowed]
+
+
+def _matches(rule: SkipRule, reasons: list[str], verdicts: list[str] | None) -> bool:
+    if rule.when == "need_fix":
+        return any(r in NEED_FIX_REASONS for r in reasons)
+    if rule.when == "all_pass":
+        return verdicts is not None and bool(verdicts) and all(v == "PASS" for v in verdicts)
+    if rule.when == "only_reasons":
+        return bool(reasons) and all(r in rule.reasons for r in reasons)
+    return rule.when == "always"
+
+
+# ── 요청 단위 리포트 ─────────────────────────────────────
+class SkipReport:
+    def __init__(self) -> None:
+        self.skipped: list[SkippedLLMCall] = []
+
+    def to_model(self) -> LLMSkipReport:
+        return LLMSkipReport(
+            skipped_calls=len(self.skipped),
+            estimated_tokens_saved=sum(s.estimated_tokens for s in self.skipped),
+            skipped=list(self.skipped),
+        )
+
+
+_current: ContextVar[SkipReport | None] = ContextVar("llm_skip_report", default=None)
+
+
+@contextmanager
+def use_report() -> Iterator[SkipReport]:
+    report = SkipReport()
+    token = _current.set(report)
+    try:
+        yield report
+    finally:
+        _current.reset(token)
+
+
+def add_skipped(calls: Iterable[SkippedLLMCall], file_id: str) -> None:
+    """공유 분석 작업(pipeline/submit._analyse_shared)에서 생략된 호출을 현재 요청 리포트에 이 요청의 file_id로 옮긴다."""
+    report = _current.get()
+    if report is not None:
+        report.skipped.extend(c.model_copy(update={"file_id": file_id}) for c in calls)
+
+
+def should_skip(
+    call: str,
+    domain: str,
+    slot_name: str = "",
+    reasons: Iterable[str] = (),
+    *,
+    verdicts: list[str] | None = None,
+    file_id: str = "",
+    prompt: str = "",
+    image: bool = False,
+) -> bool:
+    """정책상 생략할 호출이면 리포트에 기록하고 True. prompt는 토큰 추정용 (system + user)."""
+    if not LLM_SKIP_POLICY_ENABLED:
+        return False
+    reasons = _allowed_reasons(domain, reasons)
+    for rule in rules_for(domain):
+        if rule.call != call or not rule.applies_to(slot_name):
+            continue
+        if not _matches(rule, reasons, verdicts):
+            continue
+        report = _current.get()
+        if report is not None:
+            tokens = count_tokens(prompt) + _EST_OUTPUT_TOKENS.get(call, 0)
+            if image:
+                tokens += _IMAGE_INPUT_TOKENS
+            report.skipped.append(SkippedLLMCall(
+                call=call,
+                slot_name=slot_name,
+                file_id=file_id,
+                rule=rule.name,
+                estimated_tokens=tokens,
+            ))
+        return True
+    return False
@@ -4,26 +4,47 @@
 Preview 파이프라인 (기획서 §4.1).
 
 1. 입력 검증
-2. 파일명 키워드 매칭 → 슬롯 추정
-   2-1. 룰 매칭 실패 시 LLM(light)으로 파일명 기반 슬롯 추정
-3. 도메인별 필수 슬롯과 비교 → 현황판
-4. package_id 발급(첫 호출) + 누적 저장 + 결과 반환
+2. 추가된 파일의 실제 형식 판별 (앞/끝 몇 KB, pipeline/sniff.py) → file_checks
+3. 파일명 키워드 매칭 → 슬롯 추정
+   3-1. 룰 매칭 실패 시 내용 서명(PDF 첫 페이지 / 표 머리 행 / 이미지 메타데이터)으로 슬롯 추정 (engines/content_matcher.py)
+   3-2. 그래도 확신이 없으면 LLM(light)으로 파일명 기반 슬롯 추정
+4. 도메인별 필수 슬롯과 비교 → 현황판
+5. package_id 발급(첫 호출) + 누적 저장 + 결과 반환
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 
+from app.core import metrics
+from app.core.config import (
+    CONTENT_MATCH_ENABLED,
+    CONTENT_MATCH_MAX_BYTES,
+    CONTENT_MATCH_TIMEOUT_SEC,
+    SNIFF_HEAD_BYTES,
+)
+from app.engines.content_matcher import match_content_to_slot
 from app.engines.registry import get_slots_module
+from app.extractors import signature
 from app.llm.client import ask_llm
+from app.pipeline import sniff
+from app.pipeline.triage import triage_files
 from app.schemas.run import (
+    FileCheck,
     FileRef,
     PreviewRequest,
     PreviewResponse,
     SlotHint,
     SlotStatus,
 )
-from app.storage.tmp_store import get_or_create, remove_hints, update_hints, update_statuses
+from app.storage import zip_ingest
+from app.storage.downloader import download_file, fetch_partial
+from app.storage.package_store import PackageState, get_store
+
+_SLOT_MATCHES = metrics.counter(
+    "ai_run_preview_slot_matches_total", "Preview slot suggestions by stage (filename|content|llm|none)"
+)
 
 
 # ── LLM 슬롯 추정 프롬프트 ──────────────────────────────
@@ -48,7 +69,7 @@ async def _llm_match_slot(filename: str, slot_names: list[str]) -> tuple[str, fl
         "Which slot does this file belong to?"
     )
     try:
-        raw = await ask_llm(_SLOT_MATCH_SYSTEM, user_msg, heavy=False)
+        raw = await ask_llm(_SLOT_MATCH_SYSTEM, user_msg, heavy=False, call="preview_slot")
         text = raw.strip()
         # 마크다운 코드블록 제거
         if "```" in text:
@@ -66,47 +87,103 @@ async def _llm_match_slot(filename: str, slot_names: list[str]) -> tuple[str, fl
     return None
 
 
-async def _suggest_slots(files: list[FileRef], domain: str) -> list[SlotHint]:
+# ── 내용 기반 슬롯 추정 ────────────────────────────────
+async def _content_signature(file: FileRef, check: FileCheck | None) -> str:
+    """파일 형식별 내용 서명. 서명을 읽을 수 없는 파일(손상/미지원/너무 큼)은 ""."""
+    triaged = triage_files([file], {file.file_id: check} if check else None)
+    if not triaged or triaged[0]["rejected"]:
+        return ""
+    ext, file_type = triaged[0]["ext"], triaged[0]["file_type"]
+    # 이미지 메타데이터·CSV 머리 행은 앞부분만으로 충분
+    if file_type == "image" or ext == ".csv":
+        head = (await fetch_partial(file.storage_uri, SNIFF_HEAD_BYTES)).head
+        if file_type == "image":
+            return signature.image_metadata(head)
+        return signature.table_head(head, ext)
+    if check is not None and (check.size_bytes or 0) > CONTENT_MATCH_MAX_BYTES:
+        return ""
+    data = await download_file(file.storage_uri)
+    if file_type == "pdf":
+        return await asyncio.to_thread(signature.pdf_first_page, data)
+    return await asyncio.to_thread(signature.table_head, data, ext)
+
+
+def _candidate_slots(slots_mod, fname: str) -> set[str] | None:
+    """확장자를 제한하는 도메인(compliance accepted_exts)이면 받을 수 있는 슬롯만."""
+    if not any(hasattr(s, "accepted_exts") for s in slots_mod.SLOTS):
+        return None
+    ext = "." + fname.rsplit(".", 1)[-1].lower() if "." in fname else ""
+    return {s.name for s in slots_mod.SLOTS if ext in getattr(s, "accepted_exts", {ext})}
+
+
+async def _content_match_slot(
+    file: FileRef, fname: str, check: FileCheck | None, domain: str
+) -> tuple[str, float] | None:
+    if not CONTENT_MATCH_ENABLED:
+        return None
+    try:
+        text = await asyncio.wait_for(_content_signature(file, check), timeout=CONTENT_MATCH_TIMEOUT_SEC)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return None
+    hit = match_content_to_slot(text, domain, _candidate_slots(get_slots_module(domain), fname))
+    if hit is None:
+        return None
+    slot, score = hit
+    return slot, round(min(0.9, 0.5 + score / 2), 2)
+
+
+# ── 슬롯 추정 (파일명 → 내용 → LLM) ───────────────────
+async def _suggest_slots(
+    files: list[FileRef], domain: str, checks: dict[str, FileCheck] | None = None
+) -> list[SlotHint]:
     slots_mod = get_slots_module(domain)
     all_slot_names = [s.name for s in slots_mod.SLOTS]
     # slot_name -> display_name 매핑
     display_name_map = {s.name: s.display_name for s in slots_mod.SLOTS}
+    checks = checks or {}
     hints: list[SlotHint] = []
 
-    # LLM 폴백이 필요한 파일 모으기
-    unmatched: list[tuple[FileRef, str]] = []
+    def _hint(f: FileRef, slot_name: str, confidence: float, reason: str) -> None:
+        hints.append(
+            SlotHint(
+                file_id=f.file_id,
+                slot_name=slot_name,
+                display_name=display_name_map.get(slot_name, ""),
+                confidence=confidence,
+                match_reason=reason,
+            )
+        )
+        _SLOT_MATCHES.inc(stage=reason.split("_", 1)[0])
 
-    for f in files:
-        fname = f.file_name or f.storage_uri.rsplit("/", 1)[-1]
-        result = slots_mod.match_filename_to_slot(fname)
+    # 파일명 규칙 매칭은 도메인 매처로 한 번에 (engines/filename_matcher.py)
+    unmatched: list[tuple[FileRef, str]] = []
+    fnames = [f.file_name or f.storage_uri.rsplit("/", 1)[-1] for f in files]
+    for f, fname, result in zip(files, fnames, slots_mod.match_filenames(fnames)):
         if result:
-            slot_name, _ = result
-            hints.append(
-                SlotHint(
-                    file_id=f.file_id,
-                    slot_name=slot_name,
-                    display_name=display_name_map.get(slot_name, ""),
-                    confidence=0.99,
-                    match_reason="filename_keyword",
-                )
-            )
+            _hint(f, result[0], 0.99, "filename_keyword")
         else:
             unmatched.append((f, fname))
 
-    # 매칭 안 된 파일 → LLM 폴백
-    for f, fname in unmatched:
+    # 매칭 안 된 파일 → 내용 서명 매칭 (병렬, LLM 호출 없음)
+    content = await asyncio.gather(
+        *(_content_match_slot(f, fname, checks.get(f.file_id), domain) for f, fname in unmatched)
+    )
+    still_unmatched: list[tuple[FileRef, str]] = []
+    for (f, fname), result in zip(unmatched, content):
+        if result:
+            _hint(f, result[0], result[1], "content_keyword")
+        else:
+            still_unmatched.append((f, fname))
+
+    # 내용으로도 확신이 없는 파일 → LLM 폴백
+    for f, fname in still_unmatched:
         llm_result = await _llm_match_slot(fname, all_slot_names)
         if llm_result:
-            slot_name, confidence = llm_result
-            hints.append(
-                SlotHint(
-                    file_id=f.file_id,
-                    slot_name=slot_name,
-                    display_name=display_name_map.get(slot_name, ""),
-                    confidence=confidence,
-                    match_reason="llm_filename",
-                )
-            )
+            _hint(f, llm_result[0], llm_result[1], "llm_filename")
+        else:
+            _SLOT_MATCHES.inc(stage="none")
 
     return hints
 
@@ -132,27 +209,43 @@ def _evaluate_coverage(
     return statuses, missing
 
 
-async def run_preview(req: PreviewRequest) -> PreviewResponse:
-    # 1. package_id 발급/조회 + 누적 저장소
-    state = get_or_create(req.package_id, req.domain)
-
-    # 1-1. 삭제된 파일 힌트 제거 (누적 상태 업데이트)
+def _open_package(req: PreviewRequest) -> PackageState:
+    store = get_store()
+    state = store.get_or_create(req.package_id, req.domain)
+    # 삭제된 파일 힌트 제거 (누적 상태 업데이트) — ZIP이 삭제되면 그 항목 힌트도 함께
     if req.removed_file_ids:
-        remove_hints(state.package_id, req.removed_file_ids)
+        store.remove_hints(state.package_id, zip_ingest.entry_ids_of(req.removed_file_ids, list(state.hints)))
+    return state
+
+
+def _save_package(package_id: str, new_hints: list[SlotHint], domain: str) -> tuple[PackageState, list[str]]:
+    store = get_store()
+    store.update_hints(package_id, new_hints)
+    # 현황판은 저장된 누적 힌트 기준 (다른 워커의 갱신 포함)
+    state = store.get_state(package_id) or PackageState(package_id, domain, {h.file_id: h for h in new_hints})
+    statuses, missing = _evaluate_coverage(state.slot_hints, domain)
+    store.update_statuses(package_id, statuses)
+    state.slot_statuses = statuses
+    return state, missing
 
-    # 2. 새 파일 슬롯 추정 (룰 + LLM 폴백)
-    new_hints = await _suggest_slots(req.added_files, req.domain)
 
-    # 3. 누적 저장
-    update_hints(state.package_id, new_hints)
+async def run_preview(req: PreviewRequest) -> PreviewResponse:
+    # 1. package_id 발급/조회 + 누적 저장소 (sqlite 백엔드는 블로킹 → 스레드)
+    state = await asyncio.to_thread(_open_package, req)
+
+    # 2. 형식 판별 + 3. 새 파일 슬롯 추정 (파일명 → 내용 → LLM) — ZIP은 항목 단위로
+    added = await zip_ingest.expand_files(req.added_files)
+    checks = await sniff.sniff_files(added)
+    new_hints = await _suggest_slots(added, req.domain, checks)
 
-    # 4. 현황판 생성 (누적 기준)
-    statuses, missing = _evaluate_coverage(state.slot_hints, req.domain)
-    update_statuses(state.package_id, statuses)
+    # 4. 누적 저장 + 5. 현황판 생성 (누적 기준)
+    state, missing = await asyncio.to_thread(_save_package, state.package_id, new_hints, req.domain)
+    statuses = state.slot_statuses
 
     return PreviewResponse(
         package_id=state.package_id,
         slot_hint=state.slot_hints,
         required_slot_status=statuses,
         missing_required_slots=missing,
+        file_checks=[checks[f.file_id] for f in added if f.file_id in checks],
     )
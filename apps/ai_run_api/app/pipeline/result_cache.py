@@ -0,0 +1,158 @@
+# app/pipeline/result_cache.py
+
+"""
+같은 submit 요청의 결과 재사용 — 정규화한 요청 fingerprint로 저장된 SubmitResponse를 바로 돌려준다.
+
+- fingerprint: package_id + 도메인 + 기간 + 파일(file_id / 저장 경로(SAS query 제외) / 파일명) + slot_hint.
+  파일/슬롯 순서, SAS 토큰, hint의 표시용 필드(display_name/confidence/match_reason)는 무시한다.
+- 버전: 도메인 엔진(rules/slots/validators/cross_validators), 프롬프트, 응답 스키마, 판정 규칙 소스와
+  분석기 버전·LLM 모델명의 해시. 코드가 바뀌면 저장된 결과는 자동으로 무효가 된다.
+- RESULT_STORE_TTL_SEC 안의 결과만 사용. force=true 요청은 저장된 결과를 무시하고 다시 계산해 덮어쓴다.
+- RESULT_STORE_VERIFY_CONTENT=true면 저장 당시 파일 sha256과 다시 내려받은 내용을 비교한 뒤 사용한다.
+- 데드라인으로 일부가 생략된(DEGRADED) 결과는 저장하지 않는다.
+- 패키지 간 중복 표시(reused_across_packages)는 다른 패키지의 제출에 따라 바뀌고 보완요청/why 문장에도 들어간다.
+  표시가 있는 결과는 저장하지 않고, 저장된 결과는 파일 중 하나라도 지금 다른 패키지와 같은/유사하면
+  쓰지 않는다 (pipeline/duplicates.reused_across).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+from app.core import metrics
+from app.core.config import (
+    OPENAI_MODEL_HEAVY,
+    OPENAI_MODEL_LIGHT,
+    RESULT_STORE_ENABLED,
+    RESULT_STORE_TTL_SEC,
+    RESULT_STORE_VERIFY_CONTENT,
+)
+from app.db import result_store
+from app.pipeline import duplicates
+from app.pipeline.analyzers import ANALYZER_VERSION
+from app.pipeline.incremental import sha256_hex, uri_path
+from app.schemas.run import SubmitRequest, SubmitResponse
+from app.storage import zip_ingest
+from app.storage.downloader import download_file
+
+_APP_DIR = Path(__file__).resolve().parent.parent
+
+# 결과에 영향을 주는 소스 (도메인 엔진 디렉터리는 pipeline_version에서 추가)
+_VERSIONED_SOURCES = (
+    "llm/prompts.py",
+    "llm/schemas.py",
+    "pipeline/verdicts.py",
+    "pipeline/llm_policy.py",
+)
+
+_LOOKUPS = metrics.counter(
+    "ai_run_result_store_lookups_total",
+    "Stored submit result lookups by result (hit|miss|expired|stale_version|content_changed|reused_across|forced)",
+)
+_STORES = metrics.counter("ai_run_result_store_writes_total", "Submit results written to the result store")
+
+
+def fingerprint(req: SubmitRequest) -> str:
+    normalized = {
+        "package_id": req.package_id,
+        "domain": req.domain,
+        "period": [req.period_start.isoformat(), req.period_end.isoformat()],
+        "files": sorted(
+            [f.file_id, uri_path(f.storage_uri), f.file_name] for f in req.files
+        ),
+        "slot_hint": sorted([h.file_id, h.slot_name] for h in req.slot_hint),
+    }
+    return hashlib.sha256(json.dumps(normalized, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def pipeline_version(domain: str) -> str:
+    h = hashlib.sha256()
+    paths = sorted((_APP_DIR / "engines" / domain).glob("*.py"))
+    paths += [_APP_DIR / p for p in _VERSIONED_SOURCES]
+    for p in paths:
+        h.update(p.relative_to(_APP_DIR).as_posix().encode("utf-8"))
+        h.update(p.read_bytes())
+    h.update(f"{ANALYZER_VERSION}|{OPENAI_MODEL_LIGHT}|{OPENAI_MODEL_HEAVY}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+async def _content_changed(req: SubmitRequest, file_hashes: dict[str, str]) -> bool:
+    async def _changed(uri: str, expected: str | None) -> bool:
+        if expected is None:
+            return True
+        try:
+            return sha256_hex(await download_file(uri)) != expected
+        except Exception:
+            return True
+
+    # 결과의 sha256은 ZIP 항목 단위로 저장된다
+    files = await zip_ingest.expand_files(req.files)
+    results = await asyncio.gather(
+        *(_changed(f.storage_uri, file_hashes.get(f.file_id)) for f in files)
+    )
+    return any(results)
+
+
+async def lookup(req: SubmitRequest, force: bool = False) -> SubmitResponse | None:
+    """TTL 안의 같은 버전 결과가 있으면 반환 (cached_at 표시). 없으면 None."""
+    if not RESULT_STORE_ENABLED:
+        return None
+    if force:
+        _LOOKUPS.inc(result="forced")
+        return None
+    try:
+        row = await asyncio.to_thread(result_store.get, fingerprint(req))
+    except Exception:
+        return None
+    if row is None:
+        _LOOKUPS.inc(result="miss")
+        return None
+    if time.time() - row["created_at"] > RESULT_STORE_TTL_SEC:
+        _LOOKUPS.inc(result="expired")
+        return None
+    if row["version"] != pipeline_version(req.domain):
+        _LOOKUPS.inc(result="stale_version")
+        return None
+    file_hashes = json.loads(row["file_hashes_json"])
+    if RESULT_STORE_VERIFY_CONTENT and await _content_changed(req, file_hashes):
+        _LOOKUPS.inc(result="content_changed")
+        return None
+    try:
+        across = await duplicates.reused_across(req.package_id, file_hashes)
+    except Exception:
+        across = True
+    if across:
+        _LOOKUPS.inc(result="reused_across")
+        return None
+    _LOOKUPS.inc(result="hit")
+    response = SubmitResponse.model_validate_json(row["response_json"])
+    response.cached_at = datetime.fromtimestamp(row["created_at"], tz=timezone.utc).isoformat()
+    return response
+
+
+async def store(req: SubmitRequest, response: SubmitResponse, extractions: list[dict]) -> None:
+    if not RESULT_STORE_ENABLED or response.degraded:
+        return
+    if any(e.get("extras", {}).get("reused_across_packages") for e in extractions):
+        return
+    file_hashes = {e["file_id"]: e["sha256"] for e in extractions if e.get("sha256")}
+    try:
+        await asyncio.to_thread(
+            result_store.put,
+            fingerprint(req),
+            req.package_id,
+            pipeline_version(req.domain),
+            response.model_dump_json(),
+            file_hashes,
+            RESULT_STORE_TTL_SEC,
+        )
+    except Exception:
+        return
+    _STORES.inc()
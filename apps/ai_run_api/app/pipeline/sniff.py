@@ -0,0 +1,354 @@
+# app/pipeline/sniff.py
+
+"""
+TRIAGE 전 내용 판별 — 파일 앞(SNIFF_HEAD_BYTES)·끝(_TAIL_BYTES) 몇 KB만 읽어 실제 형식을 가린다.
+
+- 매직 바이트: PDF / ZIP(OOXML: xlsx·docx·pptx) / OLE(xls·hwp·doc) / JPEG / PNG / GIF·BMP·WEBP·TIFF·HEIC / 텍스트(csv)
+- 구조: PDF 헤더·%%EOF와 페이지 수 (선형화 /N → xref 표로 trailer /Root → /Pages /Count, 최대 2번 더 Range 읽기),
+  ZIP 항목 이름(xl/ 여부)·EOCD, JPEG SOF / PNG IHDR의 가로·세로와 끝 마커(EOI / IEND).
+- 판정 (FileCheck.status):
+  OK            확장자와 내용이 같은 형식
+  TYPE_MISMATCH 지원 형식이지만 확장자와 다름 → 내용 기준으로 분석기 선택 (예: 사진을 .pdf로 올린 경우)
+  CORRUPT       비어 있거나 헤더 구조가 깨짐 (PNG IHDR 없음 등) → 다운로드/분석 없이 PARSE_FAILED
+  UNSUPPORTED   지원하지 않는 형식 (docx, hwp, heic 등) → 확장자가 지원 형식이면 PARSE_FAILED
+  UNKNOWN       판별 불가 (읽기 실패 포함) → 기존처럼 확장자 기준
+- 끝 마커(JPEG EOI / PNG IEND / ZIP EOCD / PDF %%EOF)가 끝부분에 없는 것은 거절하지 않고 warnings에만 남긴다.
+  잘린 파일과 뒤에 데이터가 붙은 정상 파일(모션 포토의 MP4, 서명/메타 trailer 등)을 끝 몇 KB로는 구별할 수 없다
+  — 실제로 잘린 파일은 추출 단계에서 PARSE_FAILED가 된다.
+- estimated_cost(): 페이지 수 × 타입 가중치 — submit은 무거운 파일부터 추출을 시작한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import struct
+
+from app.core import metrics
+from app.core.config import (
+    ADMISSION_FILE_WEIGHTS,
+    MAX_PARALLEL_WORKERS,
+    SNIFF_ENABLED,
+    SNIFF_HEAD_BYTES,
+    SNIFF_TIMEOUT_SEC,
+)
+from app.core.errors import FileFetchError
+from app.pipeline import deadline
+from app.schemas.run import FileCheck, FileRef
+from app.storage.downloader import PartialContent, fetch_partial, fetch_range
+
+_TAIL_BYTES = 8 * 1024        # PDF trailer/xref, ZIP EOCD, JPEG EOI, PNG IEND
+_PDF_OBJ_READ = 1024          # PDF 객체 1개를 읽을 때 가져오는 길이
+
+# 내용 형식 → (file_type, 분석기 ext)
+_ROUTES: dict[str, tuple[str, str]] = {
+    "pdf": ("pdf", ".pdf"),
+    "xlsx": ("xlsx", ".xlsx"),
+    "xls": ("xlsx", ".xls"),
+    "csv": ("xlsx", ".csv"),
+    "jpeg": ("image", ".jpg"),
+    "png": ("image", ".png"),
+}
+# 내용 형식과 같은 것으로 보는 확장자
+_EXTS_OF: dict[str, tuple[str, ...]] = {
+    "pdf": (".pdf",),
+    "xlsx": (".xlsx",),
+    "xls": (".xls",),
+    "csv": (".csv",),
+    "jpeg": (".jpg", ".jpeg"),
+    "png": (".png",),
+}
+
+_CHECKS = metrics.counter("ai_run_sniff_files_total", "Files checked by content sniffing by status/detected type")
+
+
+# ── 형식별 판별 ─────────────────────────────────────────
+def _be16(buf: bytes, off: int) -> int:
+    return struct.unpack_from(">H", buf, off)[0]
+
+
+def _jpeg(head: bytes, tail: bytes) -> dict:
+    info: dict = {"detected_type": "jpeg"}
+    i = 2
+    while i + 9 <= len(head) and head[i] == 0xFF:
+        marker = head[i + 1]
+        if marker == 0xFF:          # 채움 바이트
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        # SOF0~SOF15 (DHT C4 / JPG C8 / DAC CC 제외)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            info["height"], info["width"] = _be16(head, i + 5), _be16(head, i + 7)
+            break
+        if marker == 0xDA:          # 스캔 시작 — 이후는 압축 데이터
+            break
+        i += 2 + _be16(head, i + 2)
+    if tail and b"\xff\xd9" not in tail:
+        info["warning"] = "jpeg_no_eoi"
+    return info
+
+
+def _png(head: bytes, tail: bytes) -> dict:
+    info: dict = {"detected_type": "png"}
+    if head[12:16] == b"IHDR" and len(head) >= 24:
+        info["width"], info["height"] = struct.unpack_from(">II", head, 16)
+    else:
+        info["corrupt"] = "png_no_ihdr"
+    if tail and b"IEND" not in tail:
+        info["warning"] = "png_no_iend"
+    return info
+
+
+def _zip_names(buf: bytes) -> list[str]:
+    """로컬 헤더(PK\\3\\4)와 중앙 디렉터리(PK\\1\\2)에 보이는 항목 이름."""
+    names: list[str] = []
+    for m in re.finditer(rb"PK\x03\x04|PK\x01\x02", buf):
+        i = m.start()
+        if m.group() == b"PK\x03\x04":
+            if i + 30 > len(buf):
+                continue
+            n = struct.unpack_from("<H", buf, i + 26)[0]
+            start = i + 30
+        else:
+            if i + 46 > len(buf):
+                continue
+            n = struct.unpack_from("<H", buf, i + 28)[0]
+            start = i + 46
+        if start + n <= len(buf):
+            names.append(buf[start:start + n].decode("utf-8", errors="replace"))
+    return names
+
+
+def _zip(head: bytes, tail: bytes, declared_ext: str) -> dict:
+    names = _zip_names(head) + _zip_names(tail)
+    if any(n.startswith("xl/") for n in names):
+        kind = "xlsx"
+    elif any(n.startswith("word/") for n in names):
+        kind = "docx"
+    elif any(n.startswith("ppt/") for n in names):
+        kind = "pptx"
+    elif "[Content_Types].xml" in names and declared_ext == ".xlsx":
+        # 앞부분에 OOXML 공통 항목만 보이는 경우 — 확장자를 믿는다
+        kind = "xlsx"
+    else:
+        kind = "zip"
+    info: dict = {"detected_type": kind}
+    if tail and b"PK\x05\x06" not in tail:
+        info["warning"] = "zip_no_eocd"
+    return info
+
+
+_OLE_STREAMS = (
+    ("xls", ("Workbook", "Book")),
+    ("hwp", ("HwpSummaryInformation", "FileHeader")),
+    ("doc", ("WordDocument",)),
+)
+
+
+def _ole(head: bytes, declared_ext: str) -> dict:
+    for kind, streams in _OLE_STREAMS:
+        if any(s.encode("utf-16-le") in head for s in streams):
+            return {"detected_type": kind}
+    # 디렉터리 섹터가 앞부분 밖에 있으면 확장자를 믿는다
+    return {"detected_type": "xls" if declared_ext == ".xls" else "ole"}
+
+
+def _is_text(head: bytes) -> bool:
+    if b"\x00" in head:
+        return False
+    for enc in ("utf-8", "cp949"):
+        # 읽기 경계에서 잘린 멀티바이트 문자 허용
+        for cut in range(4):
+            try:
+                head[: len(head) - cut].decode(enc)
+                return True
+            except UnicodeDecodeError:
+                continue
+    return False
+
+
+def _pdf(head: bytes, tail: bytes) -> dict:
+    info: dict = {"detected_type": "pdf"}
+    m = re.search(rb"/Linearized\b.{0,256}?/N\s+(\d+)", head, re.S)
+    if m:
+        info["page_count"] = int(m.group(1))
+    if tail and b"%%EOF" not in tail[-1024:]:
+        info["warning"] = "pdf_no_eof"
+    return info
+
+
+def _classify(head: bytes, tail: bytes, declared_ext: str) -> dict:
+    if head.startswith(b"\xff\xd8\xff"):
+        return _jpeg(head, tail)
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _png(head, tail)
+    if b"%PDF-" in head[:1024]:        # 헤더 앞 잡음 허용 (PDF 명세)
+        return _pdf(head, tail)
+    if head.startswith(b"PK\x03\x04"):
+        return _zip(head, tail, declared_ext)
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return _ole(head, declared_ext)
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return {"detected_type": "gif"}
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return {"detected_type": "webp"}
+    if head.startswith((b"II*\x00", b"MM\x00*")):
+        return {"detected_type": "tiff"}
+    if head[4:8] == b"ftyp" and head[8:12] in (b"heic", b"heix", b"mif1", b"heif"):
+        return {"detected_type": "heic"}
+    if head.startswith(b"HWP Document File"):
+        return {"detected_type": "hwp"}
+    if head.startswith(b"BM") and declared_ext == ".bmp":
+        return {"detected_type": "bmp"}
+    if _is_text(head):
+        lowered = head[:512].lstrip().lower()
+        if lowered.startswith((b"<!doctype html", b"<html", b"<?xml")):
+            return {"detected_type": "html" if b"html" in lowered else "xml"}
+        return {"detected_type": "csv" if declared_ext == ".csv" else "text"}
+    return {"detected_type": "unknown"}
+
+
+# ── PDF 페이지 수 (xref) ────────────────────────────────
+def _xref_offsets(tail: bytes) -> dict[int, int]:
+    """끝부분에 들어온 고전 xref 표 → {객체 번호: 파일 오프셋}. xref stream(PDF 1.5+)은 빈 dict."""
+    offsets: dict[int, int] = {}
+    tables = list(re.finditer(rb"(?<!start)xref\b", tail))
+    if not tables:
+        return offsets
+    pos = tables[-1].end()
+    section = re.compile(rb"\s*(\d+)\s+(\d+)\s*?\r?\n")
+    entry = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+    while True:
+        m = section.match(tail, pos)
+        if not m:
+            break
+        first, count = int(m.group(1)), int(m.group(2))
+        pos = m.end()
+        for k in range(count):
+            e = entry.match(tail, pos)
+            if not e:
+                return offsets
+            if e.group(3) == b"n":
+                offsets[first + k] = int(e.group(1))
+            pos = e.end()
+            while pos < len(tail) and tail[pos:pos + 1] in b" \r\n":
+                pos += 1
+    return offsets
+
+
+async def _pdf_page_count(uri: str, part: PartialContent) -> int | None:
+    tail = part.tail
+    root = re.findall(rb"/Root\s+(\d+)\s+\d+\s+R", tail)
+    offsets = _xref_offsets(tail)
+    if root and offsets and part.ranged:
+        async def _obj(num: int) -> bytes | None:
+            off = offsets.get(num)
+            if off is None:
+                return None
+            if off + _PDF_OBJ_READ <= len(part.head):
+                return part.head[off:off + _PDF_OBJ_READ]
+            tail_start = (part.size or 0) - len(tail)
+            if part.size and off >= tail_start:
+                return tail[off - tail_start:off - tail_start + _PDF_OBJ_READ]
+            return await fetch_range(uri, off, _PDF_OBJ_READ)
+
+        catalog = await _obj(int(root[-1]))
+        m = catalog and re.search(rb"/Pages\s+(\d+)\s+\d+\s+R", catalog)
+        if m:
+            pages = await _obj(int(m.group(1)))
+            c = pages and re.search(rb"/Count\s+(\d+)", pages)
+            if c:
+                return int(c.group(1))
+    # 앞/끝부분에 보이는 페이지 트리 노드 중 가장 큰 /Count (루트 노드)
+    counts = [
+        int(c) for c in re.findall(rb"/Type\s*/Pages\b[^>]{0,256}?/Count\s+(\d+)", part.head + b"\n" + tail)
+    ]
+    return max(counts) if counts else None
+
+
+# ── 판정 ────────────────────────────────────────────────
+def _judge(check: FileCheck, info: dict) -> None:
+    detected = info["detected_type"]
+    check.detected_type = detected
+    for k in ("page_count", "width", "height"):
+        if info.get(k) is not None:
+            setattr(check, k, info[k])
+    if info.get("warning"):
+        check.warnings.append(info["warning"])
+    if info.get("corrupt"):
+        check.status, check.detail = "CORRUPT", info["corrupt"]
+    elif detected == "unknown":
+        check.status = "UNKNOWN"
+    elif detected not in _ROUTES:
+        check.status, check.detail = "UNSUPPORTED", detected
+    elif check.declared_ext in _EXTS_OF[detected]:
+        check.status = "OK"
+    else:
+        check.status, check.detail = "TYPE_MISMATCH", f"{check.declared_ext or '(none)'} -> {detected}"
+
+
+async def sniff_file(file: FileRef, declared_ext: str) -> FileCheck:
+    check = FileCheck(file_id=file.file_id, declared_ext=declared_ext)
+    try:
+        part = await asyncio.wait_for(
+            fetch_partial(file.storage_uri, SNIFF_HEAD_BYTES, _TAIL_BYTES),
+            timeout=deadline.budget("extract", SNIFF_TIMEOUT_SEC),
+        )
+    except (FileFetchError, asyncio.TimeoutError) as exc:
+        # 읽기 실패는 다운로드 단계가 다시 시도하고 처리한다
+        check.detail = "fetch_failed" if isinstance(exc, FileFetchError) else "timeout"
+        _CHECKS.inc(status=check.status, type="unknown")
+        return check
+    check.size_bytes = part.size
+    if not part.head:
+        check.status, check.detail, check.detected_type = "CORRUPT", "empty", "empty"
+    else:
+        info = _classify(part.head, part.tail, declared_ext)
+        if info["detected_type"] == "pdf" and "page_count" not in info and not info.get("corrupt"):
+            try:
+                info["page_count"] = await _pdf_page_count(file.storage_uri, part)
+            except FileFetchError:
+                pass
+        _judge(check, info)
+    _CHECKS.inc(status=check.status, type=check.detected_type)
+    return check
+
+
+async def sniff_files(files: list[FileRef]) -> dict[str, FileCheck]:
+    """file_id → FileCheck. SNIFF_ENABLED=false면 빈 dict (확장자 기준 triage)."""
+    if not SNIFF_ENABLED or not files:
+        return {}
+    from app.pipeline.triage import get_ext
+
+    sem = asyncio.Semaphore(MAX_PARALLEL_WORKERS)
+
+    async def _one(f: FileRef) -> FileCheck:
+        async with sem:
+            return await sniff_file(f, get_ext(f.storage_uri))
+
+    checks = await asyncio.gather(*(_one(f) for f in files))
+    return {c.file_id: c for c in checks}
+
+
+def route(check: FileCheck | None) -> tuple[str, str] | None:
+    """내용 기준 (file_type, ext). OK / TYPE_MISMATCH가 아니면 None."""
+    if check is None or check.status not in ("OK", "TYPE_MISMATCH"):
+        return None
+    file_type, ext = _ROUTES[check.detected_type]
+    return file_type, check.declared_ext if check.status == "OK" else ext
+
+
+def rejection(check: FileCheck | None) -> str | None:
+    """다운로드 전에 PARSE_FAILED로 처리할 사유 (CORRUPT / UNSUPPORTED)."""
+    if check is None or check.status not in ("CORRUPT", "UNSUPPORTED"):
+        return None
+    return f"{check.status.lower()}:{check.detail}"
+
+
+def estimated_cost(file_type: str, check: FileCheck | None) -> tuple[float, int]:
+    """(타입 가중치 × 페이지 수, 크기) — 클수록 오래 걸리는 파일."""
+    weight = ADMISSION_FILE_WEIGHTS.get(file_type, 1.0)
+    pages = (check.page_count if check else None) or 1
+    return weight * pages, (check.size_bytes if check else None) or 0
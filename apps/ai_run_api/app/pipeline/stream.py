@@ -0,0 +1,67 @@
+# app/pipeline/stream.py
+
+"""
+Submit 진행 스트림 — run_submit 단계 이벤트를 SSE / NDJSON 으로 직렬화.
+
+이벤트 순서:
+  triage → extraction(파일별) / slot_result(슬롯별, 완료 즉시) → cross_validation
+  → clarifications → final(SubmitResponse)
+실패 시 error 이벤트 1건 후 종료.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator, Callable, Literal
+
+from app.core.cancellation import run_cancellable
+from app.pipeline.submit import run_submit
+from app.schemas.run import SubmitRequest
+
+StreamFormat = Literal["sse", "ndjson"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "sse": "text/event-stream",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _format(fmt: StreamFormat, event: str, payload: dict) -> str:
+    if fmt == "ndjson":
+        return json.dumps({"event": event, "data": payload}, ensure_ascii=False) + "\n"
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def stream_submit(
+    req: SubmitRequest,
+    fmt: StreamFormat = "sse",
+    on_close: Callable[[], None] | None = None,
+    force: bool = False,
+) -> AsyncIterator[str]:
+    queue: asyncio.Queue[tuple[str, dict] | None] = asyncio.Queue()
+
+    async def _sink(event: str, payload: dict) -> None:
+        await queue.put((event, payload))
+
+    async def _run() -> None:
+        try:
+            # 스트림이 닫혀 이 태스크가 취소되면 scope도 disconnect로 취소된다
+            await run_cancellable(run_submit(req, on_event=_sink, force=force), reason="disconnect")
+        except Exception as exc:
+            await queue.put(("error", {
+                "status_code": getattr(exc, "status_code", 500),
+                "detail": str(getattr(exc, "detail", exc)),
+            }))
+        finally:
+            await queue.put(None)
+
+    task = asyncio.create_task(_run())
+    try:
+        while (item := await queue.get()) is not None:
+            yield _format(fmt, *item)
+    finally:
+        # 클라이언트가 스트림을 닫으면 남은 작업도 중단
+        task.cancel()
+        if on_close is not None:
+            on_close()
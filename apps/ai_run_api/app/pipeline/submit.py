@@ -3,7 +3,7 @@
 """
 Submit 파이프라인 — 6단계 (기획서 §4.2).
 
-(1) TRIAGE — 파일 분류 + 열 수 있는지 체크
+(1) TRIAGE — 파일 분류 + 열 수 있는지 체크 (앞/끝 몇 KB로 실제 형식 판별)
 (2) SLOT APPLY — slot_hint 적용
 (3) EXTRACT — 파싱/OCR
 (4) VALIDATE — 룰 검증 → slot_results (verdict + reasons)
@@ -15,63 +15,200 @@ Submit 파이프라인 — 6단계 (기획서 §4.2).
 from __future__ import annotations
 
 import asyncio
-import json
-import re as _re
+import copy
+from collections import defaultdict
 from datetime import date
+from typing import Awaitable, Callable
 
-from app.engines.registry import get_rules_module, get_slots_module
-from app.extractors.ocr.ocr_router import extract_image
-from app.extractors.pdf_text import extract_pdf
-from app.extractors.xlsx import extract_xlsx
-from app.llm.client import ask_llm, ask_llm_vision
+from pydantic import ValidationError
+
+from app.core import cancellation
+from app.core.singleflight import SingleFlight
+from app.engines import frame_memo
+from app.engines.registry import get_cross_checks, get_rules_module, get_slots_module
+from app.llm.batcher import attach_batcher, new_batcher, use_batcher
+from app.llm.client import ask_llm, parse_structured
 from app.llm.prompts import (
     CLARIFICATION_TEMPLATE,
-    DATA_ANALYSIS,
-    IMAGE_VISION,
-    IMAGE_VISION_USER,
     JUDGE_FINAL,
-    PDF_ANALYSIS,
     get_prompt,
 )
+from app.llm.schemas import JudgeResult, response_format
+from app.pipeline import deadline, duplicates, llm_policy, result_cache, sniff, validation
+from app.pipeline.analyzers import AnalysisContext, analyzer_version, get_analyzers, run_analyzers
+from app.pipeline.deadline import Deadline, use_deadline
+from app.pipeline.incremental import PreviousSubmit, load_previous, save_state, sha256_hex, uri_path
 from app.pipeline.triage import triage_files
+from app.pipeline.verdicts import slot_verdict
 from app.schemas.run import (
     Clarification,
     FileRef,
+    ReuseInfo,
     SlotHint,
+    SkippedLLMCall,
     SlotResult,
     SubmitRequest,
     SubmitResponse,
 )
+from app.storage import zip_ingest
 from app.storage.downloader import download_file
 
 
-def _safe_json(raw: str) -> dict:
-    """LLM 응답에서 JSON을 안전하게 파싱. 마크다운 코드블록 제거."""
-    text = raw.strip()
-    # ```json ... ``` 또는 ``` ... ``` 제거
-    m = _re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-    if m:
-        text = m.group(1).strip()
-    return json.loads(text)
+# ── (3) EXTRACT + LLM 보강 ────────────────────────────────
+# 진행 중인 같은 다운로드/분석은 요청·슬롯을 가리지 않고 한 번만 실행 (core/singleflight.py)
+# 다운로드: 저장 경로(SAS query 제외). 분석: 내용 sha256 + 분석 입력(타입/슬롯/도메인/기간) + 분석기 버전
+_downloads = SingleFlight("download")
+_analyses = SingleFlight("extract")
 
 
-# 도메인별 슬롯 검증 디스패치
-_DOMAIN_VALIDATORS: dict[str, object] = {}
+async def _download(uri: str) -> bytes:
+    return await _downloads.do(uri_path(uri), lambda: download_file(uri))
 
 
-def _get_slot_validator(domain: str):
-    """도메인별 validators 모듈을 lazy-load."""
-    if domain not in _DOMAIN_VALIDATORS:
-        try:
-            import importlib
-            mod = importlib.import_module(f"app.engines.{domain}.validators")
-            _DOMAIN_VALIDATORS[domain] = mod
-        except ModuleNotFoundError:
-            _DOMAIN_VALIDATORS[domain] = None
-    return _DOMAIN_VALIDATORS[domain]
+class _FlightScope:
+    """한 요청이 시작한 공유 분석 작업(_analyses)들이 함께 쓰는 LLM 배처와 분석기 공유 메모.
+
+    작업에는 합류한 다른 요청도 기다리므로 시작한 요청의 배처/메모(요청이 끝나면 닫힌다)를 쓰지 않는다.
+    같은 요청에서 시작된 작업끼리는 계속 묶어 보내고, 마지막 작업이 끝날 때 닫는다.
+    """
+
+    def __init__(self) -> None:
+        self.batcher = new_batcher()
+        self.memo = duplicates.Memo()
+        self.flights = 0
+
+    async def close(self) -> None:
+        self.memo.close()
+        if self.batcher is not None:
+            await self.batcher.close()
+
+
+# 시작한 요청의 Deadline(요청마다 하나) → 그 요청이 시작한 작업들의 scope
+_flight_scopes: dict[Deadline, _FlightScope] = {}
+
+
+async def _run_flight(
+    parent: Deadline, fn: Callable[[], Awaitable[dict]]
+) -> tuple[dict, list[SkippedLLMCall], Deadline]:
+    """공유 분석 작업 본체 — 작업 전용 데드라인(시작한 요청과 같은 예산)/LLM 생략 리포트/배처/메모로 실행.
+
+    Returns (결과, 생략된 LLM 호출, 시작한 요청의 Deadline)
+    """
+    scope = _flight_scopes.get(parent)
+    if scope is None:
+        scope = _flight_scopes[parent] = _FlightScope()
+    scope.flights += 1
+    try:
+        with use_deadline(parent.fork()), llm_policy.use_report() as report:
+            with duplicates.use_memo(scope.memo), attach_batcher(scope.batcher):
+                result = await fn()
+        return result, report.skipped, parent
+    finally:
+        scope.flights -= 1
+        if scope.flights == 0:
+            if _flight_scopes.get(parent) is scope:
+                del _flight_scopes[parent]
+            await scope.close()
+
+
+async def _analyse_shared(
+    file: FileRef,
+    ext: str,
+    file_type: str,
+    slot_name: str,
+    domain: str,
+    period_start: date,
+    period_end: date,
+    data: bytes,
+    sha: str,
+) -> dict:
+    """_extract_and_analyse의 single-flight 버전. 합쳐진 호출은 결과 사본에 자기 file_id/file_name을 넣는다.
+
+    작업은 요청 단위 상태와 분리해 실행하고(_run_flight), 보강 생략/LLM 생략 기록은 결과를 받은 요청마다 남긴다.
+    다른 요청이 시작한 작업의 결과가 예산 부족으로 보강을 생략했는데 이 요청의 예산이 남아 있으면
+    공유 결과를 쓰지 않고 한 번 다시 실행한다.
+    """
+    key = (sha, ext, file_type, slot_name, domain, period_start, period_end, analyzer_version(file_type))
+    own = deadline.current() or Deadline.for_domain(domain)
+
+    def run() -> Awaitable[tuple[dict, list[SkippedLLMCall], Deadline]]:
+        return _run_flight(
+            own,
+            lambda: _extract_and_analyse(
+                file, ext, file_type, slot_name, domain, period_start, period_end, data, sha
+            ),
+        )
+
+    shared, skipped, started_by = await _analyses.do(key, run)
+    if shared.get("degraded") and started_by is not own and not own.expired("extract"):
+        shared, skipped, started_by = await _analyses.do(key, run)
+    result = copy.deepcopy(shared)
+    result["file_id"] = file.file_id
+    result["file_name"] = file.file_name or file.storage_uri.rsplit("/", 1)[-1]
+    for name in result.get("degraded", []):
+        own.mark_degraded(name)
+    llm_policy.add_skipped(skipped, file.file_id)
+    return result
+
+
+async def _extract_file(
+    file: FileRef,
+    ext: str,
+    file_type: str,
+    slot_name: str,
+    domain: str,
+    period_start: date,
+    period_end: date,
+    previous: PreviousSubmit | None = None,
+    rejected: str | None = None,
+) -> dict:
+    """파일 1개 — 다운로드 → 내용이 같은 이전 제출 레코드 재사용, 아니면 분석. Returns extraction dict."""
+    if rejected is not None:
+        # TRIAGE 내용 판별에서 손상/미지원 확인 → 내려받지 않고 분석 불가 처리
+        return {
+            "file_id": file.file_id,
+            "file_name": file.file_name or file.storage_uri.rsplit("/", 1)[-1],
+            "slot_name": slot_name,
+            "dates": [],
+            "date_in_range": True,
+            "reasons": ["PARSE_FAILED"],
+            "analyzer_errors": [f"sniff:{rejected}"],
+            "extras": {"sniff": rejected},
+        }
+    try:
+        data = await asyncio.wait_for(
+            _download(file.storage_uri), timeout=deadline.budget("extract")
+        )
+    except asyncio.CancelledError:
+        cancellation.record_cancelled("download")
+        raise
+    except asyncio.TimeoutError:
+        # 요청 데드라인 내 다운로드 실패 → 분석 불가로 처리 (다음 제출 때 다시 시도)
+        deadline.mark_degraded("download")
+        return {
+            "file_id": file.file_id,
+            "file_name": file.file_name or file.storage_uri.rsplit("/", 1)[-1],
+            "slot_name": slot_name,
+            "dates": [],
+            "date_in_range": True,
+            "reasons": ["PARSE_FAILED"],
+            "analyzer_errors": ["download:DEADLINE"],
+            "degraded": ["download"],
+            "extras": {"degraded": "download"},
+        }
+    sha = sha256_hex(data)
+    if previous is not None:
+        reused = previous.reuse_by_hash(sha, file, slot_name, file_type)
+        if reused is not None:
+            return reused
+
+    result = await _analyse_shared(
+        file, ext, file_type, slot_name, domain, period_start, period_end, data, sha
+    )
+    result["sha256"] = sha
+    return result
 
 
-# ── (3) EXTRACT + LLM 보강 ────────────────────────────────
 async def _extract_and_analyse(
     file: FileRef,
     ext: str,
@@ -80,109 +217,28 @@ async def _extract_and_analyse(
     domain: str,
     period_start: date,
     period_end: date,
+    data: bytes,
+    sha: str = "",
 ) -> dict:
-    """파일 1개를 다운로드 → 추출 → LLM 보강. Returns raw extraction dict."""
-    data = await download_file(file.storage_uri)
+    """다운로드된 파일 1개 → 분석기 fan-out(추출/OCR/LLM/YOLO). Returns raw extraction dict."""
     fname = file.file_name or file.storage_uri.rsplit("/", 1)[-1]
 
     result: dict = {"file_id": file.file_id, "file_name": fname, "slot_name": slot_name}
 
-    if file_type == "pdf":
-        extracted = await extract_pdf(data, period_start, period_end)
-        # LLM 보강 (GPT-4o-mini)
-        extras: dict[str, str] = {}
-        try:
-            raw = await ask_llm(get_prompt(PDF_ANALYSIS, domain), extracted["text"][:4000], heavy=False)
-            llm = _safe_json(raw)
-            for d in llm.get("dates", []):
-                if d not in extracted["dates"]:
-                    extracted["dates"].append(d)
-            if not extracted["signature_detected"] and llm.get("has_signature"):
-                extracted["signature_detected"] = True
-                extracted["reasons"] = [r for r in extracted["reasons"] if r != "SIGNATURE_MISSING"]
-            # anomalies → reason + extras 반영
-            anomalies = llm.get("anomalies", [])
-            if anomalies:
-                extracted.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
-                extras["anomalies"] = "; ".join(str(a) for a in anomalies)
-            if llm.get("summary"):
-                extras["summary"] = str(llm["summary"])
-            extras.update({k: str(v) for k, v in llm.get("extras", {}).items()})
-        except Exception:
-            pass
-        result.update(extracted)
-        result["extras"] = extras
-
-    elif file_type == "image":
-        fmt = "jpg" if ext in (".jpg", ".jpeg") else "png"
-        extracted = await extract_image(data, fmt, period_start, period_end)
-        # GPT-4o Vision 보강
-        extras = {}
-        try:
-            raw = await ask_llm_vision(get_prompt(IMAGE_VISION, domain), get_prompt(IMAGE_VISION_USER, domain), data, fmt)
-            vision = _safe_json(raw)
-            for d in vision.get("dates", []):
-                if d not in extracted["dates"]:
-                    extracted["dates"].append(d)
-            # violations → reason 반영
-            violations = vision.get("violations", [])
-            if violations:
-                extracted.setdefault("reasons", []).append("VIOLATION_DETECTED")
-                extras["violations"] = "; ".join(str(v) for v in violations)
-            # person_count → extras
-            if vision.get("person_count") is not None:
-                extras["person_count"] = str(vision["person_count"])
-            # detected_objects → extras
-            objects = vision.get("detected_objects", []) or vision.get("safety_objects", [])
-            if objects:
-                extras["detected_objects"] = ", ".join(str(o) for o in objects)
-            # anomalies → reason 반영
-            anomalies = vision.get("anomalies", [])
-            if anomalies:
-                extracted.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
-                extras["anomalies"] = "; ".join(str(a) for a in anomalies)
-            if vision.get("scene_description"):
-                extras["scene_description"] = vision["scene_description"]
-            extras.update({k: str(v) for k, v in vision.get("extras", {}).items()})
-        except Exception:
-            pass
-        # ── YOLO person count (LLM 값 덮어쓰기, 실패 시 LLM 폴백) ──
-        try:
-            from app.extractors.yolo.person_counter import count_persons
-            yolo_count = count_persons(data)
-            extras["person_count"] = str(yolo_count)
-        except Exception:
-            pass
-        result.update(extracted)
-        result["extras"] = extras
-
-    elif file_type == "xlsx":
-        rules_mod = get_rules_module(domain)
-        expected = rules_mod.EXPECTED_HEADERS.get(slot_name, [])
-        extracted = await extract_xlsx(data, ext, expected, period_start, period_end)
-        # LLM 보강 (GPT-4o-mini)
-        extras = {}
-        try:
-            raw = await ask_llm(get_prompt(DATA_ANALYSIS, domain), extracted["df_preview"], heavy=False)
-            llm = _safe_json(raw)
-            for d in llm.get("dates", []):
-                if d not in extracted["dates"]:
-                    extracted["dates"].append(d)
-            # missing_fields → reason 반영
-            missing = llm.get("missing_fields", [])
-            if missing:
-                extracted.setdefault("reasons", []).append("LLM_MISSING_FIELDS")
-                extras["missing_fields"] = ", ".join(str(f) for f in missing)
-            # anomalies → reason 반영
-            anomalies = llm.get("anomalies", [])
-            if anomalies:
-                extracted.setdefault("reasons", []).append("LLM_ANOMALY_DETECTED")
-                extras["anomalies"] = "; ".join(str(a) for a in anomalies)
-            extras.update({k: str(v) for k, v in llm.get("extras", {}).items()})
-        except Exception:
-            pass
-        result.update(extracted)
-        result["extras"] = extras
+    # OCR / LLM / YOLO 등 분석기를 입력 의존성에 따라 병렬 실행 후 병합
+    if get_analyzers(file_type):
+        ctx = AnalysisContext(
+            data=data,
+            ext=ext,
+            file_type=file_type,
+            slot_name=slot_name,
+            domain=domain,
+            period_start=period_start,
+            period_end=period_end,
+            file_id=file.file_id,
+            sha256=sha,
+        )
+        result.update(await run_analyzers(ctx))
 
     # ── 도메인 화이트리스트 필터링 (해당 도메인에 정의된 reason만 유지) ──
     rules_mod = get_rules_module(domain)
@@ -190,18 +246,8 @@ async def _extract_and_analyse(
     if allowed_reasons and "reasons" in result:
         result["reasons"] = [r for r in result["reasons"] if r in allowed_reasons]
 
-    # ── 슬롯별 세부 검증 (도메인 validators) ──
-    validator = _get_slot_validator(domain)
-    if validator is not None:
-        try:
-            extra_reasons = validator.validate_slot(slot_name, file_type, result) or []
-            if extra_reasons:
-                result.setdefault("reasons", [])
-                for r in extra_reasons:
-                    if r not in result["reasons"]:
-                        result["reasons"].append(r)
-        except Exception:
-            pass       
+    # ── 슬롯별 세부 검증 (도메인 validators, 작업 스레드) ──
+    await validation.validate_file(domain, slot_name, file_type, result)
     return result
 
 
@@ -222,27 +268,8 @@ def _validate_slot(extractions: list[dict], slot_name: str, domain: str) -> Slot
     # reason 중복 제거
     reasons = list(dict.fromkeys(all_reasons))
 
-    # verdict 결정 — 기획서 §1 기준
-    # A. NEED_FIX: 파일 자체 문제 → 분석 불가, 재제출 필요
-    _NEED_FIX_REASONS = {
-        "MISSING_SLOT", "PARSE_FAILED", "HEADER_MISMATCH",
-        "EMPTY_TABLE", "OCR_FAILED",
-    }
-    # B. NEED_CLARIFY: 내용 문제 → 분석은 됐으나 이슈 발견, 소명 필요
-    _NEED_CLARIFY_REASONS = {
-        "VIOLATION_DETECTED", "LOW_EDUCATION_RATE", "SIGNATURE_MISSING",
-        "E2_SPIKE_DETECTED", "E3_BILL_MISMATCH", "LLM_ANOMALY_DETECTED",
-    }
-
-    if any(r in _NEED_FIX_REASONS for r in reasons):
-        verdict = "NEED_FIX"
-    elif any(r in _NEED_CLARIFY_REASONS for r in reasons):
-        verdict = "NEED_CLARIFY"
-    elif reasons:
-        # 기타 reason은 내용 문제로 간주
-        verdict = "NEED_CLARIFY"
-    else:
-        verdict = "PASS"
+    # verdict 결정 — 기획서 §1 기준 (pipeline/verdicts.py)
+    verdict = slot_verdict(reasons)
 
     # display_name 조회
     slots_mod = get_slots_module(domain)
@@ -261,14 +288,24 @@ def _validate_slot(extractions: list[dict], slot_name: str, domain: str) -> Slot
 
 
 # ── (5) CLARIFY ───────────────────────────────────────
+class _PolicySkip(Exception):
+    """룰 우선 정책으로 LLM 호출 생략 → 기본 템플릿 사용."""
+
+
 async def _generate_clarifications(
     slot_results: list[SlotResult],
+    reuse: dict[str, Clarification] | None = None,
+    domain: str = "",
 ) -> list[Clarification]:
-    """PASS가 아닌 슬롯에 대해 보완요청 문장을 생성."""
+    """PASS가 아닌 슬롯에 대해 보완요청 문장을 생성. reuse에 있는 슬롯은 이전 문장 재사용.
+    룰 우선 정책(llm_policy)에 걸리는 슬롯은 LLM 다듬기 없이 템플릿 문장을 쓴다."""
     clarifications: list[Clarification] = []
     for sr in slot_results:
         if sr.verdict == "PASS":
             continue
+        if reuse and sr.slot_name in reuse:
+            clarifications.append(reuse[sr.slot_name])
+            continue
 
         # 템플릿 기반 + LLM 다듬기
         reason_text = ", ".join(sr.reasons) if sr.reasons else "확인 필요"
@@ -288,6 +325,8 @@ async def _generate_clarifications(
             detail_lines.append(f"- 감지된 객체: {sr.extras['detected_objects']}")
         if sr.extras.get("detail"):
             detail_lines.append(f"- 상세: {sr.extras['detail']}")
+        if sr.extras.get("reused_across_packages"):
+            detail_lines.append(f"- 이전에 제출된 다른 파일과 동일/유사: {sr.extras['reused_across_packages']}건")
         detail_block = "\n".join(detail_lines) if detail_lines else ""
 
         # REASON_CODES 한국어 매핑 전달
@@ -299,6 +338,9 @@ async def _generate_clarifications(
         rc_text = "\n".join(f"  {k}: {v}" for k, v in _rc.items() if k in sr.reasons)
 
         try:
+            # 보완요청 예산이 끝났으면 LLM 다듬기 생략 → 기본 템플릿
+            if deadline.stage_expired("clarify"):
+                raise asyncio.TimeoutError
             user_msg = (
                 f"슬롯: {sr.slot_name}\n"
                 f"사유 코드: {reason_text}\n"
@@ -308,8 +350,18 @@ async def _generate_clarifications(
             if detail_block:
                 user_msg += f"구체적 발견 내용:\n{detail_block}\n"
             user_msg += "위 내용을 바탕으로 한국어로 협력사에게 보낼 보완요청 문장을 작성해주세요. 구체적으로 어떤 항목이 문제인지, 무엇을 수정해야 하는지 명시해주세요."
-            message = await ask_llm(CLARIFICATION_TEMPLATE, user_msg, heavy=False)
-        except Exception:
+            if llm_policy.should_skip(
+                "clarify", domain or sr.slot_name.split(".")[0], sr.slot_name, sr.reasons,
+                prompt=CLARIFICATION_TEMPLATE + user_msg,
+            ):
+                raise _PolicySkip
+            message = await asyncio.wait_for(
+                ask_llm(CLARIFICATION_TEMPLATE, user_msg, heavy=False, call="clarify"),
+                timeout=deadline.budget("clarify"),
+            )
+        except Exception as exc:
+            if isinstance(exc, asyncio.TimeoutError):
+                deadline.mark_degraded(f"clarify:{sr.slot_name}")
             # LLM 실패 시 기본 템플릿
             message = f"{file_text} 파일의 {sr.slot_name} 항목에서 문제가 발견되었습니다({reason_text}). 확인 후 재제출해 주세요."
 
@@ -382,13 +434,27 @@ async def _final_aggregate(
     judge_input = "\n".join(summary_lines)
 
     try:
-        raw = await ask_llm(get_prompt(JUDGE_FINAL, domain), judge_input, heavy=True)
-        llm_result = _safe_json(raw)
-        why = llm_result.get("why", "")
-        
+        if deadline.stage_expired("judge"):
+            raise asyncio.TimeoutError
+        if llm_policy.should_skip(
+            "judge", domain, verdicts=verdicts, prompt=get_prompt(JUDGE_FINAL, domain) + judge_input,
+        ):
+            raise _PolicySkip
+        raw = await asyncio.wait_for(
+            ask_llm(
+                get_prompt(JUDGE_FINAL, domain), judge_input, heavy=True, call="judge",
+                response_format=response_format(JudgeResult),
+            ),
+            timeout=deadline.budget("judge"),
+        )
+        llm_result = parse_structured(raw, JudgeResult, call="judge")
+        why = llm_result.why
+
         # LLM은 오직 상세 사유(why) 작성과 추가 정보(extras) 추출에만 집중 (판정 변경 불가)
-        extras = {k: str(v) for k, v in llm_result.get("extras", {}).items()}
-    except Exception:
+        extras = llm_result.extras
+    except Exception as exc:
+        if isinstance(exc, asyncio.TimeoutError):
+            deadline.mark_degraded("judge")
         if risk_level == "HIGH":
             why = "필수 항목이 부족하거나 확인이 어려운 파일이 있습니다."
         elif risk_level == "MEDIUM":
@@ -407,37 +473,190 @@ async def _final_aggregate(
     )
 
 
+# ── (4.5) CROSS VALIDATE ──────────────────────────────
+# ESG cross_validators가 FAIL/WARN을 반환할 수 있으므로 스키마 매핑
+_CV_VERDICT_MAP = {"FAIL": "NEED_FIX", "WARN": "NEED_CLARIFY"}
+
+
+
+async def _cross_validate(
+    domain: str,
+    slot_groups: dict[str, list[dict]],
+    previous: PreviousSubmit | None = None,
+    affected: set[str] | None = None,
+) -> tuple[list[SlotResult], set[str]]:
+    """도메인 교차 검증 — 검증별로 동시에 실행 (pipeline/validation.py).
+    이전 결과가 있으면 입력 슬롯이 하나도 바뀌지 않은 검증은 이전 결과를 그대로 쓴다.
+
+    Returns (cross slot results, 재사용된 교차검증 slot_name 집합)
+    """
+    slots_mod = get_slots_module(domain)
+    # display_name 조회용 매핑
+    display_name_map = {s.name: s.display_name for s in slots_mod.SLOTS}
+    checks = get_cross_checks(domain)
+
+    prev_map: dict[str, list[SlotResult]] = {}
+    if previous is not None and affected is not None:
+        prev_map = previous.cross_results_by_name()
+    reused = {c.name for c in checks if c.name in prev_map and not set(c.inputs) & affected}
+    to_run = [c for c in checks if c.name not in reused]
+    fresh = dict(zip((c.name for c in to_run), await validation.run_cross_checks(domain, to_run, dict(slot_groups))))
+
+    out: list[SlotResult] = []
+    for check in checks:
+        if check.name in reused:
+            out.extend(prev_map[check.name])
+            continue
+        try:
+            built = [
+                SlotResult(
+                    slot_name=cr["slot_name"],
+                    display_name=display_name_map.get(cr["slot_name"], ""),
+                    verdict=_CV_VERDICT_MAP.get(cr.get("verdict", "NEED_FIX"), cr.get("verdict", "NEED_FIX")),
+                    reasons=cr.get("reasons", []),
+                    file_ids=[],
+                    file_names=[],
+                    extras=cr.get("extras", {}),
+                )
+                for cr in fresh[check.name]
+            ]
+        except ValidationError as exc:
+            # 결과 스키마에 맞지 않는 교차검증 결과는 (기존과 같이) 반영하지 않고 예외로 집계한다
+            validation.record_error(domain, "cross", check.name, exc)
+            continue
+        out.extend(built)
+    return out, reused
+
+
 # ── MAIN ENTRY ────────────────────────────────────────
-async def run_submit(req: SubmitRequest) -> SubmitResponse:
-    # (1) TRIAGE
-    triaged = triage_files(req.files)
+# 단계별 진행 이벤트 콜백 (event 이름, payload) — /run/submit/stream 에서 사용
+EventSink = Callable[[str, dict], Awaitable[None]]
+
+
+async def _emit(on_event: EventSink | None, event: str, payload: dict) -> None:
+    if on_event is not None:
+        await on_event(event, payload)
+
+
+async def run_submit(
+    req: SubmitRequest,
+    on_event: EventSink | None = None,
+    *,
+    force: bool = False,
+    request_deadline: Deadline | None = None,
+) -> SubmitResponse:
+    """force=True면 저장된 같은 요청의 결과(pipeline/result_cache.py)를 쓰지 않고 다시 계산한다.
+    request_deadline: 요청 데드라인 (기본: 도메인별 SUBMIT_DEADLINE_SEC — 비동기 job은 JOB_DEADLINE_SEC)."""
+    cached = await result_cache.lookup(req, force=force)
+    if cached is not None:
+        await _emit(on_event, "final", cached.model_dump(mode="json"))
+        return cached
+    # 요청 데드라인(기본: 도메인별) — 하위 태스크(다운로드/분석기/LLM)까지 contextvar로 전파
+    # 룰 우선 LLM 생략 리포트, 작은 문서 LLM 일괄 요청, 같은 내용 파일의 분석 공유,
+    # 검증 표 파싱 메모도 요청 단위로 묶는다
+    request_deadline = request_deadline or Deadline.for_domain(req.domain)
+    with use_deadline(request_deadline) as dl, llm_policy.use_report() as skip_report:
+        with duplicates.use_memo(), frame_memo.use_frame_memo():
+            async with use_batcher():
+                return await _run_submit(req, on_event, dl, skip_report)
+
+
+async def _run_submit(
+    req: SubmitRequest,
+    on_event: EventSink | None,
+    dl: Deadline,
+    skip_report: llm_policy.SkipReport,
+) -> SubmitResponse:
+    # (1) TRIAGE — ZIP 패키지는 중앙 디렉터리만 읽어 항목별 FileRef로 펼친다 (내용은 EXTRACT에서 필요할 때)
+    # 앞/끝 몇 KB로 실제 형식을 판별해 확장자가 틀린 파일은 내용 기준으로, 손상 파일은 다운로드 없이 처리
+    files = await zip_ingest.expand_files(req.files)
+    checks = await sniff.sniff_files(files)
+    triaged = triage_files(files, checks)
+    await _emit(on_event, "triage", {
+        "files": [
+            {
+                "file_id": t["file"].file_id,
+                "file_type": t["file_type"],
+                "ext": t["ext"],
+                "check": t["check"].model_dump(mode="json") if t["check"] else None,
+            }
+            for t in triaged
+        ],
+        "skipped_file_ids": [
+            f.file_id for f in files if f.file_id not in {t["file"].file_id for t in triaged}
+        ],
+    })
 
     # (2) SLOT APPLY — hint_map 구성
     hint_map: dict[str, str] = {h.file_id: h.slot_name for h in req.slot_hint}
+    slot_of = [hint_map.get(t["file"].file_id, "unknown") for t in triaged]
+
+    # 슬롯 순서/슬롯 내 파일 순서는 triage 순서를 따른다 (완료 순서와 무관하게 결정적)
+    slot_order = list(dict.fromkeys(slot_of))
+    pending: dict[str, int] = defaultdict(int)
+    for sn in slot_of:
+        pending[sn] += 1
+
+    # 같은 package_id의 이전 제출 결과 (증분 재제출)
+    previous = await load_previous(req)
+    unchanged: set[str] = set()
 
-    # (3) EXTRACT — 병렬 실행
-    tasks = [
-        _extract_and_analyse(
+    # (3) EXTRACT — 병렬 실행, 완료되는 대로 이벤트 발행
+    async def _indexed(i: int, t: dict) -> tuple[int, dict]:
+        return i, await _extract_file(
             file=t["file"],
             ext=t["ext"],
             file_type=t["file_type"],
-            slot_name=hint_map.get(t["file"].file_id, "unknown"),
+            slot_name=slot_of[i],
             domain=req.domain,
             period_start=req.period_start,
             period_end=req.period_end,
+            previous=previous,
+            rejected=t["rejected"],
         )
-        for t in triaged
-    ]
-    extractions = list(await asyncio.gather(*tasks))
-
-    # (4) VALIDATE — 슬롯별 그룹핑 후 검증
-    from collections import defaultdict
-
-    slot_groups: dict[str, list[dict]] = defaultdict(list)
-    for ex in extractions:
-        slot_groups[ex["slot_name"]].append(ex)
 
-    slot_results = [_validate_slot(exs, sn, req.domain) for sn, exs in slot_groups.items()]
+    extractions: list[dict | None] = [None] * len(triaged)
+    slot_result_map: dict[str, SlotResult] = {}
+    # 무거운 파일(페이지 수 × 타입 가중치)부터 시작 — 결과 순서는 triage 순서 그대로
+    start_order = sorted(
+        range(len(triaged)),
+        key=lambda i: sniff.estimated_cost(triaged[i]["file_type"], triaged[i]["check"]),
+        reverse=True,
+    )
+    started = {i: asyncio.create_task(_indexed(i, triaged[i])) for i in start_order}
+    tasks = [started[i] for i in range(len(triaged))]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            i, ex = await fut
+            extractions[i] = ex
+            # 같은 submit의 앞선 파일 / 다른 패키지와 중복·유사 여부 → extras
+            await duplicates.annotate(ex, req.package_id)
+            await _emit(on_event, "extraction", {
+                "file_id": ex["file_id"],
+                "file_name": ex.get("file_name", ""),
+                "slot_name": ex["slot_name"],
+                "reasons": ex.get("reasons", []),
+                "reused": bool(ex.get("reused")),
+            })
+            # (4) VALIDATE — 슬롯의 마지막 파일이 끝나면 바로 슬롯 판정
+            sn = slot_of[i]
+            pending[sn] -= 1
+            if pending[sn] == 0:
+                exs = [e for j, e in enumerate(extractions) if slot_of[j] == sn]
+                if previous is not None and previous.unchanged_slots({sn: exs}):
+                    unchanged.add(sn)
+                    slot_result_map[sn] = previous.slot_result(sn)
+                else:
+                    slot_result_map[sn] = _validate_slot(exs, sn, req.domain)
+                await _emit(on_event, "slot_result", slot_result_map[sn].model_dump(mode="json"))
+    finally:
+        for t in tasks:
+            t.cancel()
+
+    slot_groups: dict[str, list[dict]] = {
+        sn: [e for j, e in enumerate(extractions) if slot_of[j] == sn] for sn in slot_order
+    }
+    slot_results = [slot_result_map[sn] for sn in slot_order]
 
     # 누락 슬롯 확인
     slots_mod = get_slots_module(req.domain)
@@ -446,39 +665,49 @@ async def run_submit(req: SubmitRequest) -> SubmitResponse:
     missing = [s for s in required if s not in provided]
 
     # (4.5) 도메인별 교차 검증 (슬롯 간 1:1 비교)
-    # display_name 조회용 매핑
-    display_name_map = {s.name: s.display_name for s in slots_mod.SLOTS}
-    try:
-        import importlib
-        cross_mod = importlib.import_module(f"app.engines.{req.domain}.cross_validators")
-        cross_results = cross_mod.cross_validate_slot(dict(slot_groups))
-        # ESG cross_validators가 FAIL/WARN을 반환할 수 있으므로 스키마 매핑
-        _CV_VERDICT_MAP = {"FAIL": "NEED_FIX", "WARN": "NEED_CLARIFY"}
-        for cr in cross_results:
-            raw_v = cr.get("verdict", "NEED_FIX")
-            mapped_v = _CV_VERDICT_MAP.get(raw_v, raw_v)
-            slot_results.append(SlotResult(
-                slot_name=cr["slot_name"],
-                display_name=display_name_map.get(cr["slot_name"], ""),
-                verdict=mapped_v,
-                reasons=cr.get("reasons", []),
-                file_ids=[],
-                file_names=[],
-                extras=cr.get("extras", {}),
-            ))
-    except (ModuleNotFoundError, AttributeError):
-        pass
-    except Exception:
-        pass
-
-    # (5) CLARIFY
-    clarifications = await _generate_clarifications(slot_results)
+    # 이전 제출 대비 바뀐 슬롯 (새로 생기거나 사라진 슬롯 포함)
+    affected: set[str] | None = None
+    if previous is not None:
+        affected = (set(slot_order) - unchanged) | (set(previous.slot_results) - set(slot_order))
+    cross_slot_results, reused_cross = await _cross_validate(
+        req.domain, slot_groups, previous, affected
+    )
+    slot_results.extend(cross_slot_results)
+    await _emit(on_event, "cross_validation", {
+        "slot_results": [sr.model_dump(mode="json") for sr in cross_slot_results],
+    })
+
+    # (5) CLARIFY — 바뀌지 않은 슬롯/교차검증은 이전 보완요청 재사용
+    reuse_clar: dict[str, Clarification] = {}
+    if previous is not None:
+        prev_clar = previous.clarification_map()
+        reuse_clar = {
+            sn: c for sn, c in prev_clar.items() if sn in unchanged or sn in reused_cross
+        }
+    clarifications = await _generate_clarifications(slot_results, reuse=reuse_clar, domain=req.domain)
+    await _emit(on_event, "clarifications", {
+        "clarifications": [c.model_dump(mode="json") for c in clarifications],
+    })
 
     # (6) FINAL AGGREGATE
-    return await _final_aggregate(
+    response = await _final_aggregate(
         package_id=req.package_id,
         domain=req.domain,
         slot_results=slot_results,
         missing_slots=missing,
         clarifications=clarifications,
     )
+    if previous is not None:
+        response.reuse = ReuseInfo(
+            reused_file_ids=[e["file_id"] for e in extractions if e.get("reused")],
+            reprocessed_file_ids=[e["file_id"] for e in extractions if not e.get("reused")],
+            reused_slots=[sn for sn in slot_order if sn in unchanged],
+            rerun_slots=[sn for sn in slot_order if sn not in unchanged],
+            reused_cross_checks=sorted(reused_cross),
+        )
+    response.degraded = list(dl.degraded)
+    response.llm_skip = skip_report.to_model()
+    await save_state(req, triaged, extractions, slot_result_map, cross_slot_results, clarifications)
+    await result_cache.store(req, response, extractions)
+    await _emit(on_event, "final", response.model_dump(mode="json"))
+    return response
@@ -2,13 +2,17 @@
 Submit Phase 1 — TRIAGE (기획서 §4.2 단계 1).
 
 파일 확장자/종류 분류 + 열 수 있는지 최소 체크.
+내용 판별 결과(pipeline/sniff.py)가 있으면 확장자 대신 실제 형식으로 분류하고,
+손상/미지원 파일은 rejected 사유를 달아 추출 단계가 다운로드 없이 PARSE_FAILED로 처리하게 한다.
 """
 
 from __future__ import annotations
 
 from pathlib import PurePosixPath
 
-from app.schemas.run import FileRef
+from app.pipeline import sniff
+from app.schemas.run import FileCheck, FileRef
+from app.storage.zip_ingest import split_entry_uri
 
 
 SUPPORTED_EXTENSIONS = {
@@ -21,6 +25,10 @@ ALL_SUPPORTED = {ext for exts in SUPPORTED_EXTENSIONS.values() for ext in exts}
 
 
 def get_ext(uri: str) -> str:
+    # ZIP 항목 uri(<zip uri>#zip=<항목>)는 항목 이름의 확장자
+    entry = split_entry_uri(uri)
+    if entry is not None:
+        return PurePosixPath(entry[1]).suffix.lower()
     return PurePosixPath(uri.split("?")[0]).suffix.lower()
 
 
@@ -32,15 +40,22 @@ def get_file_type(ext: str) -> str | None:
     return None
 
 
-def triage_files(files: list[FileRef]) -> list[dict]:
-    """각 파일을 분류하고, 지원하지 않는 확장자는 건너뛴다.
+def triage_files(files: list[FileRef], checks: dict[str, FileCheck] | None = None) -> list[dict]:
+    """각 파일을 분류하고, 지원하지 않는 파일은 건너뛴다.
 
-    Returns list of dicts: {file: FileRef, ext: str, file_type: str}
+    Returns list of dicts: {file: FileRef, ext: str, file_type: str, check: FileCheck | None, rejected: str | None}
     """
+    checks = checks or {}
     results: list[dict] = []
     for f in files:
+        check = checks.get(f.file_id)
         ext = get_ext(f.storage_uri)
         ftype = get_file_type(ext)
+        routed = sniff.route(check)
+        if routed:
+            ftype, ext = routed
         if ftype:
-            results.append({"file": f, "ext": ext, "file_type": ftype})
+            results.append(
+                {"file": f, "ext": ext, "file_type": ftype, "check": check, "rejected": sniff.rejection(check)}
+            )
     return results
@@ -0,0 +1,110 @@
+# app/pipeline/validation.py
+
+"""
+도메인 검증 실행 — Submit (3) 파일별 validate_slot, (4.5) 교차검증.
+
+- 검증은 pandas 표 처리/키워드 색인 등 CPU 작업이라 이벤트 루프를 막지 않도록 작업 스레드(asyncio.to_thread)에서
+  실행한다. contextvar가 복사되므로 submit 단위 표 메모(engines/frame_memo.py)는 스레드에서도 공유된다.
+- 교차검증은 도메인 cross_validators의 CROSS_CHECKS(engines/registry.py)를 검증별로 동시에 실행한다.
+  결과 순서는 선언 순서 그대로.
+- 검증마다 실행 시간(ai_run_validator_seconds)과 예외(ai_run_validator_errors_total)를 남기고,
+  VALIDATOR_SLOW_LOG_SEC 이상 걸린 검증은 로그로 남긴다. 예외는 해당 검증만 비운다:
+    파일 검증   → 레코드 analyzer_errors에 "validator:<예외 타입>"
+    교차검증    → 그 검증의 결과만 생략 (결과가 SlotResult 스키마에 맞지 않을 때도 같다 — submit._cross_validate)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import time
+from typing import Any, Callable, TypeVar
+
+from app.core import metrics
+from app.core.config import VALIDATOR_SLOW_LOG_SEC
+from app.engines.registry import CrossCheck
+
+logger = logging.getLogger("ai_run.validation")
+
+T = TypeVar("T")
+
+_SECONDS = metrics.histogram(
+    "ai_run_validator_seconds", "Validator wall time by domain, kind (slot|cross) and validator",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+)
+_ERRORS = metrics.counter(
+    "ai_run_validator_errors_total", "Validator exceptions by domain, kind, validator and error type"
+)
+
+# 도메인별 슬롯 검증 디스패치
+_DOMAIN_VALIDATORS: dict[str, object] = {}
+
+
+def get_slot_validator(domain: str):
+    """도메인별 validators 모듈을 lazy-load (없으면 None)."""
+    if domain not in _DOMAIN_VALIDATORS:
+        name = f"app.engines.{domain}.validators"
+        try:
+            _DOMAIN_VALIDATORS[domain] = importlib.import_module(name)
+        except ModuleNotFoundError as e:
+            # 모듈 안의 import 실패(의존성 누락)는 숨기지 않는다
+            if e.name != name:
+                raise
+            _DOMAIN_VALIDATORS[domain] = None
+    return _DOMAIN_VALIDATORS[domain]
+
+
+def record_error(domain: str, kind: str, name: str, exc: BaseException) -> None:
+    _ERRORS.inc(domain=domain, kind=kind, validator=name, error=type(exc).__name__)
+    logger.warning(
+        "validator failed domain=%s kind=%s validator=%s", domain, kind, name,
+        exc_info=(type(exc), exc, exc.__traceback__),
+    )
+
+
+async def _timed(domain: str, kind: str, name: str, fn: Callable[..., T], *args: Any) -> T:
+    t0 = time.perf_counter()
+    try:
+        return await asyncio.to_thread(fn, *args)
+    except Exception as exc:
+        record_error(domain, kind, name, exc)
+        raise
+    finally:
+        elapsed = time.perf_counter() - t0
+        _SECONDS.observe(elapsed, domain=domain, kind=kind, validator=name)
+        if elapsed >= VALIDATOR_SLOW_LOG_SEC:
+            logger.warning(
+                "slow validator domain=%s kind=%s validator=%s elapsed=%.3fs", domain, kind, name, elapsed
+            )
+
+
+async def validate_file(domain: str, slot_name: str, file_type: str, record: dict) -> None:
+    """파일 1개 슬롯 검증 — 사유 코드를 record["reasons"]에 덧붙인다 (validator가 extras를 채우기도 한다)."""
+    validator = get_slot_validator(domain)
+    if validator is None:
+        return
+    try:
+        extra_reasons = await _timed(domain, "slot", slot_name, validator.validate_slot, slot_name, file_type, record)
+    except Exception as exc:
+        record.setdefault("analyzer_errors", []).append(f"validator:{type(exc).__name__}")
+        return
+    if extra_reasons:
+        reasons = record.setdefault("reasons", [])
+        for r in extra_reasons:
+            if r not in reasons:
+                reasons.append(r)
+
+
+async def run_cross_checks(
+    domain: str, checks: list[CrossCheck], slot_groups: dict[str, list[dict]]
+) -> list[list[dict[str, Any]]]:
+    """교차검증 동시 실행 → 검증별 결과 (checks 순서). 실패한 검증은 []."""
+
+    async def _one(check: CrossCheck) -> list[dict[str, Any]]:
+        try:
+            return await _timed(domain, "cross", check.name, check.run, slot_groups)
+        except Exception:
+            return []
+
+    return list(await asyncio.gather(*(_one(c) for c in checks)))
@@ -0,0 +1,32 @@
+# app/pipeline/verdicts.py
+
+"""
+사유 코드 → 슬롯 verdict 규칙 (기획서 §1). 슬롯 판정과 LLM 생략 정책이 같은 기준을 쓴다.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+# A. NEED_FIX: 파일 자체 문제 → 분석 불가, 재제출 필요
+NEED_FIX_REASONS = frozenset({
+    "MISSING_SLOT", "PARSE_FAILED", "HEADER_MISMATCH",
+    "EMPTY_TABLE", "OCR_FAILED",
+})
+# B. NEED_CLARIFY: 내용 문제 → 분석은 됐으나 이슈 발견, 소명 필요
+NEED_CLARIFY_REASONS = frozenset({
+    "VIOLATION_DETECTED", "LOW_EDUCATION_RATE", "SIGNATURE_MISSING",
+    "E2_SPIKE_DETECTED", "E3_BILL_MISMATCH", "LLM_ANOMALY_DETECTED",
+})
+
+
+def slot_verdict(reasons: Iterable[str]) -> str:
+    reasons = list(reasons)
+    if any(r in NEED_FIX_REASONS for r in reasons):
+        return "NEED_FIX"
+    if any(r in NEED_CLARIFY_REASONS for r in reasons):
+        return "NEED_CLARIFY"
+    if reasons:
+        # 기타 reason은 내용 문제로 간주
+        return "NEED_CLARIFY"
+    return "PASS"
@@ -11,6 +11,8 @@ Domain = Literal["safety", "compliance", "esg"]
 Verdict = Literal["PASS", "NEED_FIX", "NEED_CLARIFY"]
 RiskLevel = Literal["HIGH", "MEDIUM", "LOW"]
 SlotStatusEnum = Literal["SUBMITTED", "MISSING"]
+JobStatus = Literal["QUEUED", "RUNNING", "DONE", "FAILED", "CANCELLED"]
+SniffStatus = Literal["OK", "TYPE_MISMATCH", "CORRUPT", "UNSUPPORTED", "UNKNOWN"]
 
 
 # ── Shared ──────────────────────────────────────────────
@@ -34,6 +36,21 @@ class SlotStatus(BaseModel):
     status: SlotStatusEnum
 
 
+class FileCheck(BaseModel):
+    """파일 앞/끝 몇 KB로 판별한 실제 형식 (pipeline/sniff.py)."""
+    file_id: str
+    declared_ext: str = ""
+    detected_type: str = "unknown"
+    status: SniffStatus = "UNKNOWN"
+    detail: str = ""
+    # 판정에는 쓰지 않는 참고 사항 (예: 끝 마커가 끝부분에 없음 — 잘렸거나 뒤에 데이터가 붙은 파일)
+    warnings: list[str] = []
+    size_bytes: int | None = None
+    page_count: int | None = None
+    width: int | None = None
+    height: int | None = None
+
+
 # ── Preview ─────────────────────────────────────────────
 class PreviewRequest(BaseModel):
     domain: Domain
@@ -49,6 +66,8 @@ class PreviewResponse(BaseModel):
     slot_hint: list[SlotHint]
     required_slot_status: list[SlotStatus]
     missing_required_slots: list[str]
+    # 이번 호출에 추가된 파일의 형식 판별 결과
+    file_checks: list[FileCheck] = []
 
 
 # ── Submit ──────────────────────────────────────────────
@@ -77,6 +96,30 @@ class Clarification(BaseModel):
     file_ids: list[str] = []
 
 
+class ReuseInfo(BaseModel):
+    """증분 재제출 시 이전 결과를 재사용한 부분."""
+    reused_file_ids: list[str] = []
+    reprocessed_file_ids: list[str] = []
+    reused_slots: list[str] = []
+    rerun_slots: list[str] = []
+    reused_cross_checks: list[str] = []
+
+
+class SkippedLLMCall(BaseModel):
+    call: str
+    slot_name: str = ""
+    file_id: str = ""
+    rule: str
+    estimated_tokens: int = 0
+
+
+class LLMSkipReport(BaseModel):
+    """룰 우선 정책으로 생략한 LLM 호출 (요청 단위)."""
+    skipped_calls: int = 0
+    estimated_tokens_saved: int = 0
+    skipped: list[SkippedLLMCall] = []
+
+
 class SubmitResponse(BaseModel):
     package_id: str
     risk_level: RiskLevel
@@ -85,3 +128,20 @@ class SubmitResponse(BaseModel):
     slot_results: list[SlotResult]
     clarifications: list[Clarification] = []
     extras: dict[str, str] = Field(default_factory=dict)
+    # 같은 package_id의 이전 제출이 있을 때만 채워진다
+    reuse: ReuseInfo | None = None
+    # 데드라인 예산 초과로 생략된 단계/분석기 (DEGRADED). 비어 있으면 전체 수행
+    degraded: list[str] = []
+    llm_skip: LLMSkipReport = Field(default_factory=LLMSkipReport)
+    # 같은 요청의 저장된 결과를 돌려준 경우 저장 시각 (UTC ISO 8601)
+    cached_at: str | None = None
+
+
+# ── Submit Job (비동기) ─────────────────────────────────
+class JobResponse(BaseModel):
+    job_id: str
+    package_id: str
+    status: JobStatus
+    attempts: int = 0
+    result: SubmitResponse | None = None
+    error: str | None = None
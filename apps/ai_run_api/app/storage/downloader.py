@@ -1,7 +1,11 @@
-"""파일 다운로드 — SAS URL 또는 로컬 경로 지원."""
+"""파일 다운로드 — SAS URL 또는 로컬 경로 지원. ZIP 항목 uri(storage/zip_ingest.py)는 해당 항목만 압축 해제.
+
+fetch_partial / fetch_range: 내용 판별(pipeline/sniff.py)용 부분 읽기 — 앞/끝 몇 KB만 Range 요청으로 가져온다.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -21,15 +25,26 @@ def _is_local_path(uri: str) -> bool:
     return False
 
 
+def local_path(uri: str) -> str | None:
+    """로컬 경로면 file:// 스킴을 뗀 경로, 아니면 None."""
+    if not _is_local_path(uri):
+        return None
+    if uri.startswith("file:///"):
+        return uri[8:]
+    if uri.startswith("file://"):
+        return uri[7:]
+    return uri
+
+
 async def download_file(uri: str) -> bytes:
     """storage_uri에서 파일 바이트를 가져온다. 로컬 경로와 HTTP URL 모두 지원."""
-    if _is_local_path(uri):
-        # file:// 스킴 제거
-        path = uri
-        if path.startswith("file:///"):
-            path = path[8:]
-        elif path.startswith("file://"):
-            path = path[7:]
+    from app.storage import zip_ingest
+
+    if zip_ingest.split_entry_uri(uri) is not None:
+        return await zip_ingest.read_entry(uri)
+
+    path = local_path(uri)
+    if path is not None:
         try:
             return Path(path).read_bytes()
         except (FileNotFoundError, OSError) as exc:
@@ -42,3 +57,91 @@ async def download_file(uri: str) -> bytes:
             return resp.content
     except httpx.HTTPError as exc:
         raise FileFetchError(uri, detail=str(exc))
+
+
+# ── 부분 읽기 ────────────────────────────────────────────
+@dataclass
+class PartialContent:
+    head: bytes
+    tail: bytes           # 끝부분 (가져오지 못했으면 b"", 파일이 head 안에 다 들어오면 head의 끝)
+    size: int | None      # 전체 크기 (모르면 None)
+    ranged: bool = False  # fetch_range로 중간 부분을 더 읽을 수 있는지
+
+
+def _tail_of(head: bytes, size: int | None, tail_bytes: int) -> bytes:
+    if tail_bytes and size is not None and size <= len(head):
+        return head[-tail_bytes:]
+    return b""
+
+
+async def fetch_partial(uri: str, head_bytes: int, tail_bytes: int = 0) -> PartialContent:
+    """앞 head_bytes(+ 끝 tail_bytes)만 가져온다. Range를 지원하지 않는 서버는 앞부분만 읽고 연결을 끊는다."""
+    from app.storage import zip_ingest
+
+    if zip_ingest.split_entry_uri(uri) is not None:
+        head, size = await zip_ingest.read_entry_head(uri, head_bytes)
+        return PartialContent(head, _tail_of(head, size, tail_bytes), size)
+
+    path = local_path(uri)
+    if path is not None:
+        try:
+            with open(path, "rb") as fh:
+                head = fh.read(head_bytes)
+                size = Path(path).stat().st_size
+                tail = _tail_of(head, size, tail_bytes)
+                if tail_bytes and not tail:
+                    fh.seek(max(len(head), size - tail_bytes))
+                    tail = fh.read()
+        except OSError as exc:
+            raise FileFetchError(uri, detail=str(exc))
+        return PartialContent(head, tail, size, ranged=True)
+
+    try:
+        async with httpx.AsyncClient(timeout=FILE_FETCH_TIMEOUT) as client:
+            async with client.stream("GET", uri, headers={"Range": f"bytes=0-{head_bytes - 1}"}) as resp:
+                resp.raise_for_status()
+                ranged = resp.status_code == 206
+                if ranged:
+                    head = await resp.aread()
+                    total = resp.headers.get("content-range", "").rsplit("/", 1)[-1]
+                    size = int(total) if total.isdigit() else None
+                else:
+                    buf = bytearray()
+                    async for chunk in resp.aiter_bytes():
+                        buf += chunk
+                        if len(buf) >= head_bytes:
+                            break
+                    head = bytes(buf[:head_bytes])
+                    length = resp.headers.get("content-length", "")
+                    size = int(length) if length.isdigit() else None
+            tail = _tail_of(head, size, tail_bytes)
+            if tail_bytes and not tail and ranged and size is not None:
+                start = max(len(head), size - tail_bytes)
+                resp = await client.get(uri, headers={"Range": f"bytes={start}-{size - 1}"})
+                resp.raise_for_status()
+                if resp.status_code == 206:
+                    tail = resp.content
+    except httpx.HTTPError as exc:
+        raise FileFetchError(uri, detail=str(exc))
+    return PartialContent(head, tail, size, ranged=ranged)
+
+
+async def fetch_range(uri: str, start: int, length: int) -> bytes:
+    """[start, start+length) 구간. fetch_partial이 ranged=True를 돌려준 uri에만 쓴다."""
+    path = local_path(uri)
+    if path is not None:
+        try:
+            with open(path, "rb") as fh:
+                fh.seek(start)
+                return fh.read(length)
+        except OSError as exc:
+            raise FileFetchError(uri, detail=str(exc))
+    try:
+        async with httpx.AsyncClient(timeout=FILE_FETCH_TIMEOUT) as client:
+            resp = await client.get(uri, headers={"Range": f"bytes={start}-{start + length - 1}"})
+            resp.raise_for_status()
+    except httpx.HTTPError as exc:
+        raise FileFetchError(uri, detail=str(exc))
+    if resp.status_code != 206:
+        raise FileFetchError(uri, detail="range request not honoured")
+    return resp.content
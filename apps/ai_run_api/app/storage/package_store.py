@@ -0,0 +1,254 @@
+"""패키지 상태 저장소 — preview 누적용 (기획서 §2.3).
+
+package_id 기준으로 slot_hint / required_slot_status를 누적 저장한다.
+PACKAGE_STORE_BACKEND로 백엔드를 고른다.
+
+- memory: 프로세스 내 LRU + TTL. PACKAGE_STORE_MAX_PACKAGES를 넘으면 가장 오래 안 쓴 패키지부터,
+  PACKAGE_STORE_TTL_SEC 동안 갱신이 없으면 만료. uvicorn 워커가 1개일 때만 사용.
+- sqlite: db/package_state.py (WAL) — 여러 워커 프로세스가 같은 패키지 상태를 본다.
+
+힌트는 file_id로 색인한다 (같은 file_id는 덮어쓰기, 처음 추가된 순서 유지).
+동기 API이며 sqlite 백엔드는 블로킹이므로 async 코드에서는 asyncio.to_thread로 호출한다.
+메트릭: ai_run_package_store_packages / ai_run_package_store_bytes (살아 있는 패키지 수, 상태 크기 추정),
+ai_run_package_store_evictions_total{reason=ttl|lru}.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from app.core import metrics
+from app.core.config import PACKAGE_STORE_BACKEND, PACKAGE_STORE_MAX_PACKAGES, PACKAGE_STORE_TTL_SEC
+from app.db import package_state
+from app.schemas.run import SlotHint, SlotStatus
+
+_PACKAGES = metrics.gauge("ai_run_package_store_packages", "Live preview packages in the package state store")
+_BYTES = metrics.gauge("ai_run_package_store_bytes", "Approximate serialized size of stored preview package state")
+_EVICTIONS = metrics.counter(
+    "ai_run_package_store_evictions_total", "Preview packages dropped from the package state store by reason"
+)
+
+
+@dataclass
+class PackageState:
+    package_id: str
+    domain: str
+    # file_id → SlotHint (삽입 순서 = 처음 추가된 순서)
+    hints: dict[str, SlotHint] = field(default_factory=dict)
+    slot_statuses: list[SlotStatus] = field(default_factory=list)
+
+    @property
+    def slot_hints(self) -> list[SlotHint]:
+        return list(self.hints.values())
+
+
+def generate_package_id() -> str:
+    return f"PKG_{uuid.uuid4().hex[:12].upper()}"
+
+
+class PackageStateStore(ABC):
+    backend: str
+
+    @abstractmethod
+    def get_state(self, package_id: str) -> PackageState | None:
+        """만료되지 않은 패키지 상태 (복사본). 없으면 None."""
+
+    @abstractmethod
+    def get_or_create(self, package_id: str | None, domain: str) -> PackageState:
+        """package_id가 없거나 모르는 id면 새로 만든다 (id가 주어지면 그 id로)."""
+
+    @abstractmethod
+    def update_hints(self, package_id: str, new_hints: list[SlotHint]) -> None:
+        """file_id가 겹치면 최신 힌트로 덮어쓴다."""
+
+    @abstractmethod
+    def remove_hints(self, package_id: str, file_ids: list[str]) -> None:
+        """삭제된 파일 ID 목록을 받아 저장소에서 제거한다."""
+
+    @abstractmethod
+    def update_statuses(self, package_id: str, statuses: list[SlotStatus]) -> None: ...
+
+
+# ── memory (LRU + TTL) ──────────────────────────────────
+@dataclass
+class _Entry:
+    state: PackageState
+    touched: float
+    size: int = 0
+
+
+def _state_size(state: PackageState) -> int:
+    return sum(len(h.model_dump_json()) for h in state.hints.values()) + sum(
+        len(s.model_dump_json()) for s in state.slot_statuses
+    )
+
+
+def _copy(state: PackageState) -> PackageState:
+    return PackageState(state.package_id, state.domain, dict(state.hints), list(state.slot_statuses))
+
+
+class MemoryPackageStore(PackageStateStore):
+    backend = "memory"
+
+    def __init__(self, max_packages: int, ttl_sec: float):
+        self.max_packages = max_packages
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _drop(self, package_id: str, reason: str) -> None:
+        entry = self._entries.pop(package_id)
+        self._bytes -= entry.size
+        _EVICTIONS.inc(backend=self.backend, reason=reason)
+
+    def _evict(self, now: float) -> None:
+        # LRU 순서라 앞쪽이 가장 오래 안 쓴 패키지 — 만료가 아닌 항목을 만나면 멈춘다
+        while self._entries:
+            pid, entry = next(iter(self._entries.items()))
+            if now - entry.touched > self.ttl_sec:
+                self._drop(pid, "ttl")
+            elif len(self._entries) > self.max_packages:
+                self._drop(pid, "lru")
+            else:
+                break
+        self._publish()
+
+    def _publish(self) -> None:
+        _PACKAGES.set(len(self._entries), backend=self.backend)
+        _BYTES.set(self._bytes, backend=self.backend)
+
+    def _live(self, package_id: str, now: float) -> _Entry | None:
+        entry = self._entries.get(package_id)
+        if entry is None:
+            return None
+        if now - entry.touched > self.ttl_sec:
+            self._drop(package_id, "ttl")
+            self._publish()
+            return None
+        return entry
+
+    def _touch(self, package_id: str, entry: _Entry, now: float) -> None:
+        entry.touched = now
+        self._entries.move_to_end(package_id)
+        size = _state_size(entry.state)
+        self._bytes += size - entry.size
+        entry.size = size
+        self._publish()
+
+    def get_state(self, package_id: str) -> PackageState | None:
+        with self._lock:
+            entry = self._live(package_id, time.time())
+            return _copy(entry.state) if entry is not None else None
+
+    def get_or_create(self, package_id: str | None, domain: str) -> PackageState:
+        now = time.time()
+        with self._lock:
+            entry = self._live(package_id, now) if package_id else None
+            if entry is None:
+                pid = package_id or generate_package_id()
+                entry = self._entries[pid] = _Entry(PackageState(package_id=pid, domain=domain), now)
+                self._evict(now)
+            else:
+                self._touch(entry.state.package_id, entry, now)
+            return _copy(entry.state)
+
+    def update_hints(self, package_id: str, new_hints: list[SlotHint]) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._live(package_id, now)
+            if entry is None:
+                return
+            for h in new_hints:
+                entry.state.hints[h.file_id] = h
+            self._touch(package_id, entry, now)
+
+    def remove_hints(self, package_id: str, file_ids: list[str]) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._live(package_id, now)
+            if entry is None:
+                return
+            for fid in file_ids:
+                entry.state.hints.pop(fid, None)
+            self._touch(package_id, entry, now)
+
+    def update_statuses(self, package_id: str, statuses: list[SlotStatus]) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._live(package_id, now)
+            if entry is None:
+                return
+            entry.state.slot_statuses = list(statuses)
+            self._touch(package_id, entry, now)
+
+
+# ── sqlite (워커 간 공유) ───────────────────────────────
+class SqlitePackageStore(PackageStateStore):
+    backend = "sqlite"
+
+    def __init__(self, ttl_sec: float):
+        self.ttl_sec = ttl_sec
+
+    def _publish(self) -> None:
+        s = package_state.stats()
+        _PACKAGES.set(s["packages"], backend=self.backend)
+        _BYTES.set(s["bytes"], backend=self.backend)
+
+    def get_state(self, package_id: str) -> PackageState | None:
+        row = package_state.load(package_id, self.ttl_sec)
+        if row is None:
+            return None
+        hints = [SlotHint.model_validate(h) for h in row["hints"]]
+        return PackageState(
+            package_id=row["package_id"],
+            domain=row["domain"],
+            hints={h.file_id: h for h in hints},
+            slot_statuses=[SlotStatus.model_validate(s) for s in row["statuses"]],
+        )
+
+    def get_or_create(self, package_id: str | None, domain: str) -> PackageState:
+        if package_id:
+            state = self.get_state(package_id)
+            if state is not None:
+                return state
+        pid = package_id or generate_package_id()
+        expired = package_state.create(pid, domain, self.ttl_sec)
+        if expired:
+            _EVICTIONS.inc(expired, backend=self.backend, reason="ttl")
+        self._publish()
+        return PackageState(package_id=pid, domain=domain)
+
+    def update_hints(self, package_id: str, new_hints: list[SlotHint]) -> None:
+        if new_hints:
+            package_state.upsert_hints(package_id, [(h.file_id, h.model_dump_json()) for h in new_hints])
+
+    def remove_hints(self, package_id: str, file_ids: list[str]) -> None:
+        if file_ids:
+            package_state.delete_hints(package_id, file_ids)
+
+    def update_statuses(self, package_id: str, statuses: list[SlotStatus]) -> None:
+        package_state.save_statuses(
+            package_id, json.dumps([s.model_dump(mode="json") for s in statuses], ensure_ascii=False)
+        )
+
+
+_BACKENDS = {
+    "memory": lambda: MemoryPackageStore(PACKAGE_STORE_MAX_PACKAGES, PACKAGE_STORE_TTL_SEC),
+    "sqlite": lambda: SqlitePackageStore(PACKAGE_STORE_TTL_SEC),
+}
+
+_store: PackageStateStore | None = None
+
+
+def get_store() -> PackageStateStore:
+    global _store
+    if _store is None:
+        _store = _BACKENDS[PACKAGE_STORE_BACKEND]()
+    return _store
@@ -0,0 +1,419 @@
+"""ZIP 패키지 수집 — 아카이브 storage_uri 하나를 항목별 가상 FileRef로 펼친다.
+
+- 아카이브 전체를 받지 않는다. HTTP는 Range 요청으로 끝부분(EOCD)과 중앙 디렉터리만 읽고,
+  로컬 파일은 seek로 읽는다. Range를 지원하지 않는 저장소만 전체를 임시 파일로 받는다 (ZIP_MAX_ARCHIVE_BYTES).
+- expand_files(): .zip FileRef → 항목별 FileRef
+  (file_id = "<zip file_id>/<항목 경로>", storage_uri = "<zip uri>#zip=<항목 경로(quote)>", file_name = 항목 파일명).
+  preview는 항목 파일명으로 바로 슬롯을 추정하고, submit은 같은 규칙으로 펼치므로 slot_hint의 file_id가 그대로 맞는다.
+- 항목 내용은 다운로더(download_file)가 항목 uri를 받을 때 — 즉 추출 단계에서 필요할 때만 압축 해제한다.
+- zip bomb 방지: 항목 수(ZIP_MAX_ENTRIES), 선언된 전체/항목 크기(ZIP_MAX_TOTAL_BYTES / ZIP_MAX_ENTRY_BYTES)를
+  목록 단계에서, 실제 압축 해제 크기와 압축률(ZIP_MAX_RATIO)을 읽는 동안 검사한다. 넘으면 ArchiveRejectedError(422).
+- 항목 이름: UTF-8 플래그가 없으면 cp437로 풀린 이름을 UTF-8 → CP949 순서로 다시 해석한다 (Windows/macOS 압축기).
+  디렉터리, 암호화 항목, __MACOSX/ 및 숨김 파일은 건너뛴다. 중첩 ZIP은 펼치지 않는다.
+- 중앙 디렉터리를 읽은 아카이브는 최근 ZIP_OPEN_ARCHIVES개까지 열어 두고 항목 읽기에 재사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import BinaryIO
+from urllib.parse import quote, unquote
+
+import httpx
+
+from app.core import cancellation, metrics
+from app.core.config import (
+    FILE_FETCH_TIMEOUT,
+    ZIP_MAX_ARCHIVE_BYTES,
+    ZIP_MAX_ENTRIES,
+    ZIP_MAX_ENTRY_BYTES,
+    ZIP_MAX_RATIO,
+    ZIP_MAX_TOTAL_BYTES,
+    ZIP_OPEN_ARCHIVES,
+    ZIP_RANGE_BLOCK_BYTES,
+)
+from app.core.errors import ArchiveRejectedError, FileFetchError
+from app.core.singleflight import SingleFlight
+from app.schemas.run import FileRef
+from app.storage.downloader import local_path
+
+ENTRY_MARK = "#zip="
+ENTRY_SEP = "/"
+
+# 압축률 검사는 이 크기를 넘은 항목부터 (작은 텍스트 파일은 원래 압축률이 높다)
+_RATIO_MIN_BYTES = 1024 * 1024
+_READ_CHUNK = 1024 * 1024
+
+_BYTES_READ = metrics.counter(
+    "ai_run_zip_bytes_read_total", "Bytes fetched from remote ZIP archives by source (range|full)"
+)
+_ENTRIES = metrics.counter("ai_run_zip_entries_total", "ZIP entries listed / extracted / skipped")
+_REJECTED = metrics.counter("ai_run_zip_rejected_total", "ZIP archives or entries rejected by reason")
+
+
+# ── uri 규칙 ────────────────────────────────────────────
+def is_archive(uri: str) -> bool:
+    return ENTRY_MARK not in uri and PurePosixPath(uri.split("?", 1)[0]).suffix.lower() == ".zip"
+
+
+def entry_uri(archive_uri: str, name: str) -> str:
+    return archive_uri + ENTRY_MARK + quote(name, safe="")
+
+
+def split_entry_uri(uri: str) -> tuple[str, str] | None:
+    """항목 uri → (아카이브 uri, 항목 이름). 항목 uri가 아니면 None."""
+    if ENTRY_MARK not in uri:
+        return None
+    archive, name = uri.rsplit(ENTRY_MARK, 1)
+    return archive, unquote(name)
+
+
+# ── 원본 읽기 (Range / 전체 / 로컬) ──────────────────────
+class _RangeFile(io.RawIOBase):
+    """HTTP Range 요청으로 읽는 seek 가능한 파일. 작은 읽기는 ZIP_RANGE_BLOCK_BYTES 단위로 묶는다."""
+
+    def __init__(self, client: httpx.Client, uri: str, size: int, tail_start: int, tail: bytes):
+        self._client = client
+        self._uri = uri
+        self._size = size
+        self._pos = 0
+        self._block_start = tail_start
+        self._block = tail
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        cancellation.check("zip_range")
+        try:
+            resp = self._client.get(self._uri, headers={"Range": f"bytes={start}-{end - 1}"})
+            resp.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise FileFetchError(self._uri, detail=str(exc))
+        if resp.status_code != 206:
+            raise FileFetchError(self._uri, detail="range request not honoured")
+        if len(resp.content) != end - start:
+            # 짧은 206 — 그대로 쓰면 readinto가 버퍼 뒷부분을 채우지 못한 채 n을 돌려준다
+            raise FileFetchError(
+                self._uri, detail=f"short range response: {len(resp.content)} of {end - start} bytes"
+            )
+        _BYTES_READ.inc(len(resp.content), source="range")
+        return resp.content
+
+    def readinto(self, b) -> int:
+        """_fetch가 요청한 길이만큼 받았는지 확인하므로 항상 n바이트를 채운다."""
+        n = min(len(b), self._size - self._pos)
+        if n <= 0:
+            return 0
+        start, end = self._pos, self._pos + n
+        block_end = self._block_start + len(self._block)
+        if not (self._block_start <= start and end <= block_end):
+            if n >= ZIP_RANGE_BLOCK_BYTES:
+                data = self._fetch(start, end)
+                b[:n] = data
+                self._pos = end
+                return n
+            self._block_start = start
+            self._block = self._fetch(start, min(self._size, start + ZIP_RANGE_BLOCK_BYTES))
+        off = start - self._block_start
+        b[:n] = self._block[off:off + n]
+        self._pos = end
+        return n
+
+    def close(self) -> None:
+        self._client.close()
+        super().close()
+
+
+def _open_source(uri: str) -> BinaryIO:
+    path = local_path(uri)
+    if path is not None:
+        try:
+            return open(path, "rb")
+        except OSError as exc:
+            raise FileFetchError(uri, detail=str(exc))
+
+    client = httpx.Client(timeout=FILE_FETCH_TIMEOUT, follow_redirects=True)
+    try:
+        # 끝부분(EOCD + 주석 최대 64KB)부터 — 중앙 디렉터리가 작으면 이 한 번으로 목록을 읽는다
+        tail_len = max(ZIP_RANGE_BLOCK_BYTES, 65536 + 22)
+        with client.stream("GET", uri, headers={"Range": f"bytes=-{tail_len}"}) as resp:
+            resp.raise_for_status()
+            if resp.status_code == 206:
+                tail = resp.read()
+                total = int(resp.headers.get("content-range", "").rsplit("/", 1)[-1])
+                _BYTES_READ.inc(len(tail), source="range")
+                return _RangeFile(client, uri, total, total - len(tail), tail)
+            # Range 미지원 → 전체를 임시 파일로 (상한 초과 시 중단)
+            spool = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+            size = 0
+            for chunk in resp.iter_bytes():
+                size += len(chunk)
+                if size > ZIP_MAX_ARCHIVE_BYTES:
+                    spool.close()
+                    _REJECTED.inc(reason="archive_too_large")
+                    raise ArchiveRejectedError(uri, "archive_too_large")
+                spool.write(chunk)
+            _BYTES_READ.inc(size, source="full")
+        client.close()
+        spool.seek(0)
+        return spool
+    except httpx.HTTPError as exc:
+        client.close()
+        raise FileFetchError(uri, detail=str(exc))
+    except BaseException:
+        client.close()
+        raise
+
+
+# ── 아카이브 ────────────────────────────────────────────
+@dataclass(frozen=True)
+class ZipEntry:
+    name: str          # 복구한 항목 경로 (표시/ file_id용)
+    raw_name: str      # zipfile 항목 이름 (읽기용)
+    file_size: int
+    compress_size: int
+
+    @property
+    def file_name(self) -> str:
+        return self.name.rsplit("/", 1)[-1]
+
+
+def _repair_name(info: zipfile.ZipInfo) -> str:
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            raw = name.encode("cp437")
+        except UnicodeEncodeError:
+            raw = None
+        if raw is not None:
+            for enc in ("utf-8", "cp949"):
+                try:
+                    name = raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+    return name.replace("\\", "/")
+
+
+def _skip(info: zipfile.ZipInfo, name: str) -> bool:
+    if info.is_dir() or info.flag_bits & 0x1:  # 디렉터리 / 암호화
+        return True
+    parts = name.split("/")
+    return parts[0] == "__MACOSX" or any(p.startswith(".") for p in parts)
+
+
+class ZipArchive:
+    def __init__(self, uri: str):
+        self.uri = uri
+        self._fp = _open_source(uri)
+        try:
+            self._zf = zipfile.ZipFile(self._fp)
+        except (zipfile.BadZipFile, ValueError) as exc:
+            self._fp.close()
+            _REJECTED.inc(reason="bad_zip")
+            raise ArchiveRejectedError(uri, f"bad_zip: {exc}")
+        self._lock = threading.Lock()
+        self._readers = 0
+        self._evicted = False
+        try:
+            self.entries = self._list()
+        except BaseException:
+            self.close()
+            raise
+        self._infos = {e.raw_name: self._zf.getinfo(e.raw_name) for e in self.entries}
+
+    def _reject(self, reason: str) -> ArchiveRejectedError:
+        _REJECTED.inc(reason=reason)
+        return ArchiveRejectedError(self.uri, reason)
+
+    def _list(self) -> list[ZipEntry]:
+        infos = self._zf.infolist()
+        if len(infos) > ZIP_MAX_ENTRIES:
+            raise self._reject("too_many_entries")
+        entries: list[ZipEntry] = []
+        total = 0
+        for info in infos:
+            name = _repair_name(info)
+            if _skip(info, name):
+                _ENTRIES.inc(state="skipped")
+                continue
+            total += info.file_size
+            if total > ZIP_MAX_TOTAL_BYTES:
+                raise self._reject("total_too_large")
+            entries.append(ZipEntry(name, info.filename, info.file_size, info.compress_size))
+        _ENTRIES.inc(len(entries), state="listed")
+        return entries
+
+    def read(self, raw_name: str) -> bytes:
+        """항목 1개 압축 해제. 선언 크기를 믿지 않고 읽는 동안 크기/압축률을 검사한다.
+
+        호출 측이 acquire()로 참조를 잡고 있어야 한다 (_archive(hold=True)).
+        """
+        info = self._infos.get(raw_name)
+        if info is None:
+            raise FileFetchError(entry_uri(self.uri, raw_name), detail="no such entry")
+        if info.file_size > ZIP_MAX_ENTRY_BYTES:
+            raise self._reject("entry_too_large")
+        limit = min(ZIP_MAX_ENTRY_BYTES, info.file_size)
+        ratio_cap = max(_RATIO_MIN_BYTES, ZIP_MAX_RATIO * max(info.compress_size, 1))
+        out = bytearray()
+        try:
+            with self._zf.open(info) as fh:
+                while True:
+                    chunk = fh.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    out += chunk
+                    if len(out) > limit:
+                        raise self._reject("entry_size_mismatch")
+                    if len(out) > ratio_cap:
+                        raise self._reject("compression_ratio")
+                    cancellation.check("zip_entry")
+        except zipfile.BadZipFile as exc:
+            raise self._reject(f"bad_entry: {exc}")
+        _ENTRIES.inc(state="extracted")
+        return bytes(out)
+
+    def read_head(self, raw_name: str, n: int) -> tuple[bytes, int]:
+        """항목 앞 n바이트만 압축 해제 (내용 판별용). Returns (앞부분, 선언된 항목 크기). read()와 같이 참조 필요."""
+        info = self._infos.get(raw_name)
+        if info is None:
+            raise FileFetchError(entry_uri(self.uri, raw_name), detail="no such entry")
+        try:
+            with self._zf.open(info) as fh:
+                return fh.read(n), info.file_size
+        except zipfile.BadZipFile as exc:
+            raise self._reject(f"bad_entry: {exc}")
+
+    @property
+    def evicted(self) -> bool:
+        return self._evicted
+
+    def acquire(self) -> None:
+        """읽기 참조 — 잡고 있는 동안 캐시에서 빠져도 닫지 않는다."""
+        with self._lock:
+            self._readers += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._readers -= 1
+            close = self._evicted and self._readers == 0
+        if close:
+            self.close()
+
+    def evict(self) -> None:
+        """캐시에서 빠짐 — 읽는 중인 항목이 끝나면 닫는다."""
+        with self._lock:
+            self._evicted = True
+            close = self._readers == 0
+        if close:
+            self.close()
+
+    def close(self) -> None:
+        try:
+            self._zf.close()
+        except Exception:
+            pass
+        self._fp.close()
+
+
+_archives: OrderedDict[str, ZipArchive] = OrderedDict()
+_opens = SingleFlight("zip_open")
+
+
+async def _archive(uri: str, *, hold: bool = False) -> ZipArchive:
+    """열린 아카이브 (최근 ZIP_OPEN_ARCHIVES개 LRU).
+
+    hold=True면 조회와 같은 단계에서(사이에 await 없이) 읽기 참조를 잡는다 — 호출 측이 release().
+    조회와 읽기 사이에 다른 요청이 캐시를 밀어내도 읽는 중인 아카이브는 닫히지 않는다.
+    """
+    while True:
+        archive = _archives.get(uri)
+        if archive is not None:
+            _archives.move_to_end(uri)
+            break
+        opened = await _opens.do(uri, lambda: asyncio.to_thread(ZipArchive, uri))
+        # 기다리는 동안 다른 요청이 넣었으면 그것을, 이미 밀려나 닫혔으면 다시 연다
+        if uri not in _archives and not opened.evicted:
+            _archives[uri] = archive = opened
+            break
+    if hold:
+        archive.acquire()
+    while len(_archives) > ZIP_OPEN_ARCHIVES:
+        _, old = _archives.popitem(last=False)
+        old.evict()
+    return archive
+
+
+async def list_entries(uri: str) -> list[ZipEntry]:
+    return (await _archive(uri)).entries
+
+
+async def read_entry(uri: str) -> bytes:
+    """항목 uri(<zip uri>#zip=<항목>) → 압축 해제한 바이트."""
+    parts = split_entry_uri(uri)
+    if parts is None:
+        raise FileFetchError(uri, detail="not a zip entry uri")
+    archive_uri, raw_name = parts
+    archive = await _archive(archive_uri, hold=True)
+    try:
+        return await asyncio.to_thread(archive.read, raw_name)
+    finally:
+        archive.release()
+
+
+async def read_entry_head(uri: str, n: int) -> tuple[bytes, int]:
+    parts = split_entry_uri(uri)
+    if parts is None:
+        raise FileFetchError(uri, detail="not a zip entry uri")
+    archive_uri, raw_name = parts
+    archive = await _archive(archive_uri, hold=True)
+    try:
+        return await asyncio.to_thread(archive.read_head, raw_name, n)
+    finally:
+        archive.release()
+
+
+async def expand_files(files: list[FileRef]) -> list[FileRef]:
+    """.zip FileRef를 항목별 FileRef로 바꾼다 (순서 유지). ZIP이 없으면 그대로."""
+    if not any(is_archive(f.storage_uri) for f in files):
+        return files
+    out: list[FileRef] = []
+    for f in files:
+        if not is_archive(f.storage_uri):
+            out.append(f)
+            continue
+        for e in await list_entries(f.storage_uri):
+            out.append(
+                FileRef(
+                    file_id=f"{f.file_id}{ENTRY_SEP}{e.name}",
+                    storage_uri=entry_uri(f.storage_uri, e.raw_name),
+                    file_name=e.file_name,
+                )
+            )
+    return out
+
+
+def entry_ids_of(file_ids: list[str], known_ids: list[str]) -> list[str]:
+    """삭제할 file_id 목록 → ZIP file_id면 그 항목 file_id까지 포함."""
+    prefixes = tuple(fid + ENTRY_SEP for fid in file_ids)
+    return list(file_ids) + [k for k in known_ids if k.startswith(prefixes)]
@@ -0,0 +1,158 @@
+"""중복/유사 파일 색인 조회 벤치마크 + 선형 탐색과의 결과 비교.
+
+    cd apps/ai_run_api && python -m benchmarks.duplicates [--n 100000] [--queries 500] [--bk-queries 100] [--seed 0]
+
+- pHash: 무작위 64bit n개 + 그중 일부를 몇 비트 바꾼 유사 사진을 색인에 넣고, 색인된 값에서
+  0~PHASH_MAX_DISTANCE+2 비트를 바꾼 질의로 다중 색인 해싱(PhashIndex) / BK-tree / numpy 선형 스캔을 비교한다.
+  (BK-tree는 비교용 — 질의가 느려 --bk-queries개만)
+- MinHash: 무작위 서명 n개 + 일부 행을 바꾼 유사 문서를 LSH에 넣고 LSH 조회와 선형 Jaccard 스캔을 비교한다.
+  (LSH는 근사 — 임계값 바로 위 문서를 놓치는 비율(recall)을 함께 출력)
+PhashIndex 결과가 선형 스캔과 하나라도 다르면 종료 코드 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+from app.core.config import PHASH_MAX_DISTANCE, TEXT_DUP_MIN_JACCARD
+from app.pipeline.duplicates import _PERMS, MinHashLSH, PhashIndex, _hamming
+
+
+class _BKTree:
+    """비교용 해밍 거리 BK-tree. 노드: [값, 키 목록, {거리: 자식}]."""
+
+    def __init__(self) -> None:
+        self._root: list | None = None
+
+    def add(self, value: int, key: int) -> None:
+        if self._root is None:
+            self._root = [value, [key], {}]
+            return
+        node = self._root
+        while True:
+            d = _hamming(value, node[0])
+            if d == 0:
+                node[1].append(key)
+                return
+            if d not in node[2]:
+                node[2][d] = [value, [key], {}]
+                return
+            node = node[2][d]
+
+    def search(self, value: int, radius: int) -> list[int]:
+        out: list[int] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            d = _hamming(value, node[0])
+            if d <= radius:
+                out.extend(node[1])
+            stack.extend(c for cd, c in node[2].items() if d - radius <= cd <= d + radius)
+        return out
+
+
+def _flip(value: int, bits: int, rng: random.Random) -> int:
+    for b in rng.sample(range(64), bits):
+        value ^= 1 << b
+    return value
+
+
+def _percentile(xs: list[float], p: float) -> float:
+    return sorted(xs)[min(len(xs) - 1, int(len(xs) * p))]
+
+
+def _phash(n: int, queries: int, bk_queries: int, rng: random.Random) -> bool:
+    values = [rng.getrandbits(64) for _ in range(n)]
+    # 같은 현장 사진 재촬영/재압축 — 색인의 1%는 기존 값의 유사본
+    for _ in range(n // 100):
+        values.append(_flip(rng.choice(values), rng.randint(1, PHASH_MAX_DISTANCE), rng))
+    t0 = time.perf_counter()
+    index = PhashIndex(PHASH_MAX_DISTANCE)
+    for i, v in enumerate(values):
+        index.add(v, i)
+    build = time.perf_counter() - t0
+    tree = _BKTree()
+    for i, v in enumerate(values):
+        tree.add(v, i)
+
+    arr = np.array(values, dtype=np.uint64)
+    qs = [_flip(rng.choice(values), rng.randint(0, PHASH_MAX_DISTANCE + 2), rng) for _ in range(queries)]
+    mih_times: list[float] = []
+    bk_times: list[float] = []
+    scan_times: list[float] = []
+    mismatches = 0
+    for n_q, q in enumerate(qs):
+        t0 = time.perf_counter()
+        got = sorted(k for _, k, _ in index.search(q))
+        mih_times.append(time.perf_counter() - t0)
+        if n_q < bk_queries:
+            t0 = time.perf_counter()
+            tree.search(q, PHASH_MAX_DISTANCE)
+            bk_times.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        dist = np.unpackbits((arr ^ np.uint64(q)).view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+        want = sorted(int(i) for i in np.nonzero(dist <= PHASH_MAX_DISTANCE)[0])
+        scan_times.append(time.perf_counter() - t0)
+        mismatches += got != want
+    print(
+        f"pHash   n={len(values):>7} build {build:6.2f}s  "
+        f"index mean {np.mean(mih_times) * 1e6:7.1f}us p99 {_percentile(mih_times, 0.99) * 1e6:7.1f}us  "
+        f"bk-tree mean {np.mean(bk_times) * 1e6 if bk_times else 0:8.1f}us  "
+        f"scan mean {np.mean(scan_times) * 1e6:7.1f}us  mismatch {mismatches}"
+    )
+    return mismatches == 0
+
+
+def _minhash(n: int, queries: int, rng: random.Random) -> None:
+    nrng = np.random.default_rng(rng.getrandbits(32))
+    sigs = nrng.integers(0, 2**31 - 1, size=(n, _PERMS), dtype=np.uint32)
+    t0 = time.perf_counter()
+    lsh = MinHashLSH()
+    for i in range(n):
+        lsh.add(i, sigs[i])
+    build = time.perf_counter() - t0
+
+    lsh_times: list[float] = []
+    scan_times: list[float] = []
+    expected = found = 0
+    for _ in range(queries):
+        q = sigs[rng.randrange(n)].copy()
+        # Jaccard 0.7~1.0 사이 유사본: 서명 행 일부를 바꾼다
+        changed = rng.randint(0, int(_PERMS * 0.3))
+        q[nrng.choice(_PERMS, changed, replace=False)] = nrng.integers(0, 2**31 - 1, changed, dtype=np.uint32)
+        t0 = time.perf_counter()
+        got = {k for _, k in lsh.query(q, TEXT_DUP_MIN_JACCARD)}
+        lsh_times.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        sims = (sigs == q).sum(axis=1) / _PERMS
+        want = {int(i) for i in np.nonzero(sims >= TEXT_DUP_MIN_JACCARD)[0]}
+        scan_times.append(time.perf_counter() - t0)
+        expected += len(want)
+        found += len(got & want)
+    print(
+        f"MinHash n={n:>7} build {build:6.2f}s  "
+        f"lsh   mean {np.mean(lsh_times) * 1e6:7.1f}us p99 {_percentile(lsh_times, 0.99) * 1e6:7.1f}us  "
+        f"scan mean {np.mean(scan_times) * 1e6:7.1f}us  recall {found / max(expected, 1):.3f}"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--bk-queries", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+    ok = _phash(args.n, args.queries, args.bk_queries, rng)
+    _minhash(args.n, args.queries, rng)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""ESG 교차검증 표 처리 벤치마크 — 행 단위(iterrows) 파싱 vs 열 단위 파싱 + submit 메모.
+
+    cd apps/ai_run_api && python -m benchmarks.esg_cross [--rows 20] [--repeat 200] [--seed 0]
+
+- 실제로 도는 크기: 추출 레코드의 df_preview는 표 앞 20행뿐이다 (extractors/xlsx.py check_table).
+  기본값 --rows 20이 submit에서 validators가 읽는 표 크기다. 이 크기에서는 열 단위 파싱이
+  iterrows보다 빠르지 않다 — 이득은 같은 표를 다시 읽을 때의 메모뿐이다.
+- esg_cross_checks()는 submit에 연결돼 있지 않다 (ESG는 CROSS_CHECKS 미등록, engines/registry.py).
+  여기서는 교차검증 함수를 직접 부른다. --rows 10000은 df_preview가 전체 표가 될 경우의 가정이다.
+- 유해물질 목록 / 폐기 목록 CSV(df_preview) rows행을 만들고 (빈 셀 일부 포함)
+  이전 구현(파싱 후 iterrows + 행마다 str())과 현재 _inventory_chemicals / _parse_disposal_list를 비교한다.
+- memo: use_frame_memo() 안에서 같은 표를 다시 읽고 변환하는 비용 (validators + 교차검증이 같은 표를 쓰는 경우).
+- 이전 구현은 빈 셀을 "nan" 문자열로 읽었다 — 비교할 때는 빈 셀을 ""로 맞추고, 이름/일자가 빈 행은 뺀다.
+결과가 하나라도 다르면 종료 코드 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import time
+from typing import Any
+
+import pandas as pd
+
+from app.engines.esg.cross_validators import _inventory_chemicals, _parse_disposal_list
+from app.engines.frame_memo import read_frame, use_frame_memo
+
+# extractors/xlsx.py check_table의 df_preview 행 수
+_PREVIEW_ROWS = 20
+
+_NAMES = ["황산", "염산", "톨루엔", "아세톤", "메탄올", "벤젠", "크실렌", "질산", "불산", "암모니아"]
+
+
+def _legacy_inventory(df_preview: str) -> list[dict[str, Any]]:
+    df = pd.read_csv(io.StringIO(df_preview))
+    out: list[dict[str, Any]] = []
+    for _, row in df.iterrows():
+        name = str(row.get("물질명", "")).strip()
+        if not name:
+            continue
+        msds_req = str(row.get("MSDS_필수", "Y")).strip().upper()
+        cas = str(row.get("CAS", "")).strip()
+        out.append({"name": name, "msds_required": msds_req == "Y", "cas": cas})
+    return out
+
+
+def _legacy_disposal(df_preview: str) -> list[dict[str, Any]]:
+    df = pd.read_csv(io.StringIO(df_preview))
+    out: list[dict[str, Any]] = []
+    for _, row in df.iterrows():
+        name = str(row.get("물질명", "")).strip()
+        d = str(row.get("처리일자", "")).strip()
+        if not name or not d:
+            continue
+        out.append({"name": name, "date_raw": d, "qty_raw": str(row.get("수량", "")).strip(), "cas": ""})
+    return out
+
+
+def _blank_nan(items: list[dict[str, Any]], keys: tuple[str, ...]) -> list[dict[str, Any]]:
+    items = [{k: ("" if v == "nan" else v) for k, v in it.items()} for it in items]
+    return [it for it in items if all(it[k] for k in keys)]
+
+
+def _tables(rows: int, rng: random.Random) -> tuple[str, str]:
+    def maybe(v: Any, p: float = 0.02) -> Any:
+        return None if rng.random() < p else v
+
+    inv = pd.DataFrame({
+        "물질명": [maybe(f"{rng.choice(_NAMES)} {i}") for i in range(rows)],
+        "MSDS_필수": [maybe(rng.choice("YN")) for _ in range(rows)],
+        "CAS": [maybe(f"{rng.randint(50, 99999)}-{rng.randint(10, 99)}-{rng.randint(0, 9)}", 0.3) for _ in range(rows)],
+    })
+    disp = pd.DataFrame({
+        "물질명": [maybe(rng.choice(_NAMES)) for _ in range(rows)],
+        "처리일자": [maybe(f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}") for _ in range(rows)],
+        "수량": [maybe(rng.randint(1, 500)) for _ in range(rows)],
+    })
+    return inv.to_csv(index=False), disp.to_csv(index=False)
+
+
+def _best(fn, repeat: int) -> tuple[float, Any]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=_PREVIEW_ROWS)
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    inv, disp = _tables(args.rows, random.Random(args.seed))
+
+    ok = True
+    cases = [
+        ("inventory", inv, _legacy_inventory, _inventory_chemicals, ("name",)),
+        ("disposal", disp, _legacy_disposal, _parse_disposal_list, ("name", "date_raw")),
+    ]
+    for label, csv, legacy, current, keys in cases:
+        t_old, want = _best(lambda: legacy(csv), args.repeat)
+        t_new, got = _best(lambda: current(read_frame(csv)), args.repeat)
+        with use_frame_memo():
+            current(read_frame(csv))
+            t_memo, again = _best(lambda: current(read_frame(csv)), args.repeat)
+        same = got == again == _blank_nan(want, keys)
+        ok &= same
+        print(
+            f"{label:<9} rows={args.rows:>6} iterrows {t_old * 1e3:8.1f}ms  "
+            f"columns {t_new * 1e3:7.1f}ms ({t_old / t_new:5.1f}x)  "
+            f"memo {t_memo * 1e3:6.2f}ms  items {len(got)}  {'ok' if same else 'MISMATCH'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""파일명 → 슬롯 매처 벤치마크 + 기존 점수 방식과의 결과 비교.
+
+    cd apps/ai_run_api && python -m benchmarks.filename_matcher [--n 5000] [--seed 0]
+
+도메인별로 슬롯 키워드/정규식 조각과 잡음 토큰을 섞어 파일명 n개를 만들고,
+- 기존 방식(슬롯마다 키워드 any/sum 스캔, 정규식 슬롯별 search — 아래 _legacy_*)과
+  컴파일된 매처(match_filename_to_slot / match_filenames)의 결과가 모두 같은지 확인하고
+- 기존 방식 / 컴파일 단건 / 컴파일 일괄 처리 시간을 비교한다.
+결과가 하나라도 다르면 종료 코드 1. 같은 결과 비교는 tests/test_filename_matcher.py에서도 실행된다 (parity_cases).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, Iterable
+
+from app.engines.compliance import slots as compliance_slots
+from app.engines.esg import slots as esg_slots
+from app.engines.safety import slots as safety_slots
+
+
+# ── 기존 방식 (컴파일 매처 도입 전 구현) ─────────────────
+def _has_any(text: str, keywords: Iterable[str]) -> bool:
+    return any(k in text for k in keywords)
+
+
+def _count_any(text: str, keywords: Iterable[str]) -> int:
+    return sum(1 for k in keywords if k in text)
+
+
+def _legacy_esg(filename: str) -> tuple[str, float] | None:
+    esg_slots._refresh_slots()
+    f = esg_slots._norm(filename)
+    if not f:
+        return None
+    best_slot: str | None = None
+    best_score = 0
+    for s in esg_slots.SLOTS:
+        has1 = _has_any(f, s.must_any_1)
+        has2 = _has_any(f, s.must_any_2)
+        has_regex = bool(s.regex and s.regex.search(f))
+        if not (has1 or has2 or has_regex):
+            continue
+        score = 0
+        if has1:
+            score += 2 + _count_any(f, s.must_any_1)
+        if has2:
+            score += 2 + _count_any(f, s.must_any_2)
+        if has1 and has2:
+            score += esg_slots._PAIR_BONUS
+        score += _count_any(f, s.boost)
+        if has_regex:
+            score += 2
+        if s.name == "esg.ethics.code":
+            if _has_any(f, esg_slots.K_LOG) or _has_any(f, esg_slots.K_PLEDGE) or _has_any(f, esg_slots.K_POSTER):
+                score -= 4
+        if score > best_score:
+            best_score = score
+            best_slot = s.name
+    if not best_slot or best_score < esg_slots._MIN_SCORE:
+        return None
+    conf = 0.78 if best_score <= 6 else 0.85 if best_score <= 10 else 0.92
+    return best_slot, conf
+
+
+def _legacy_safety(filename: str) -> tuple[str, float] | None:
+    for slot in safety_slots.SLOTS:
+        for pat in slot.patterns:
+            if pat.search(filename):
+                return slot.name, 0.88 if slot.required else 0.85
+    return None
+
+
+def _legacy_compliance(filename: str) -> tuple[str, float] | None:
+    _, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    clean_name = filename.replace("_", " ").replace("-", " ")
+    clean_name = re.sub(r"\s+", " ", clean_name).strip()
+    for slot in compliance_slots.SLOTS:
+        if ext not in slot.accepted_exts:
+            continue
+        for pat in slot.patterns:
+            if pat.search(clean_name):
+                return slot.name, 1.0
+    return None
+
+
+# ── 파일명 생성 ─────────────────────────────────────────
+_NOISE = ["2025", "최종", "final", "v2", "스캔", "copy", "본사", "1분기", "hq", "a1b2c3d4e5f6_", "(1)", "복사본"]
+_EXTS = [".pdf", ".xlsx", ".csv", ".jpg", ".png", ".zip", ".hwp"]
+
+
+def _esg_tokens() -> list[str]:
+    out: list[str] = []
+    for s in esg_slots._SLOTS_ALL or esg_slots.SLOTS:
+        out += list(s.must_any_1) + list(s.must_any_2) + list(s.boost)
+    return sorted(set(out))
+
+
+def _regex_tokens(slots) -> list[str]:
+    # 정규식에서 리터럴 조각을 뽑아 파일명 재료로 쓴다
+    out: list[str] = []
+    for s in slots:
+        for p in s.patterns:
+            out += [t for t in re.split(r"[^0-9A-Za-z가-힣]+", p.pattern.replace("(?i)", "")) if len(t) > 1]
+    return sorted(set(out))
+
+
+def _filenames(tokens: list[str], n: int, rng: random.Random) -> list[str]:
+    names = []
+    for _ in range(n):
+        parts = rng.sample(tokens, k=rng.randint(1, 3)) + rng.sample(_NOISE, k=rng.randint(0, 2))
+        rng.shuffle(parts)
+        sep = rng.choice(["_", " ", "-", ""])
+        names.append(sep.join(parts) + rng.choice(_EXTS))
+    return names
+
+
+def _time(fn: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def parity_cases(n: int, seed: int = 0) -> list[tuple[str, object, list[str], list[tuple[str, float] | None]]]:
+    """도메인별 (도메인, slots 모듈, 파일명, 기존 방식 결과)."""
+    rng = random.Random(seed)
+    cases = [
+        ("esg", esg_slots, _legacy_esg, _esg_tokens()),
+        ("safety", safety_slots, _legacy_safety, _regex_tokens(safety_slots.SLOTS)),
+        ("compliance", compliance_slots, _legacy_compliance, _regex_tokens(compliance_slots.SLOTS)),
+    ]
+    out = []
+    for domain, mod, legacy, tokens in cases:
+        names = _filenames(tokens, n, rng)
+        out.append((domain, mod, names, [legacy(name) for name in names]))
+    return out
+
+
+def mismatches(mod, names: list[str], expected: list) -> list[tuple]:
+    """(파일명, 기존, 단건, 일괄) — 셋이 모두 같지 않은 것만."""
+    single = [mod.match_filename_to_slot(n) for n in names]
+    batch = mod.match_filenames(names)
+    return [(n, e, s, b) for n, e, s, b in zip(names, expected, single, batch) if not (e == s == b)]
+
+
+_LEGACY = {"esg": _legacy_esg, "safety": _legacy_safety, "compliance": _legacy_compliance}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    failed = False
+    print(f"{'domain':<11} {'files':>6} {'matched':>8} {'mismatch':>9} {'legacy ms':>10} {'single ms':>10} {'batch ms':>9}")
+    for domain, mod, names, expected in parity_cases(args.n, args.seed):
+        legacy = _LEGACY[domain]
+        diff = mismatches(mod, names, expected)
+        for n, e, s, b in diff[:5]:
+            print(f"  MISMATCH {domain}: {n!r} legacy={e} single={s} batch={b}")
+        failed |= bool(diff)
+        t_legacy = _time(lambda: [legacy(n) for n in names])
+        t_single = _time(lambda: [mod.match_filename_to_slot(n) for n in names])
+        t_batch = _time(lambda: mod.match_filenames(names))
+        matched = sum(1 for e in expected if e)
+        print(
+            f"{domain:<11} {len(names):>6} {matched:>8} {len(diff):>9} "
+            f"{t_legacy * 1000:>10.1f} {t_single * 1000:>10.1f} {t_batch * 1000:>9.1f}"
+        )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
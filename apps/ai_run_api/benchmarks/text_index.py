@@ -0,0 +1,143 @@
+"""문서 키워드 조회 벤치마크 — 키워드마다 전체 스캔 vs 2-gram 위치 색인 vs 정규화 텍스트 + str.find.
+
+    cd apps/ai_run_api && python -m benchmarks.text_index [--chars 30000 500000] [--keywords 60] [--passes 3]
+
+- 한글/영문/숫자가 섞인 문서(chars 글자, 20페이지)와 키워드 목록(절반은 문서에 있음)을 만들고,
+  validators 여러 개(passes)가 같은 키워드 목록을 조회하는 경우의 총 시간(색인 생성 포함)과 색인 메모리를 잰다.
+    scan   조회마다 정규화 후 `kw in text` (색인 없음)
+    bigram 2-gram → 위치 목록 dict 색인 (이전 TextIndex 구현, 비교용으로 여기에만 남김)
+    index  현재 engines/text_index.TextIndex (정규화 한 번 + str.find + 조회 결과 메모)
+- bigram과 index의 등장 페이지가 모두 같은지 확인한다. 다르면 종료 코드 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import random
+import sys
+import time
+import tracemalloc
+
+from app.engines.text_index import TextIndex, normalize
+
+_WORDS = [
+    "계약", "하도급", "대금", "지급", "선급금", "지연이자", "위험성", "평가", "안전", "교육", "보호구", "점검",
+    "협력사", "서명", "날인", "기간", "조건", "해지", "손해배상", "비밀유지", "MSDS", "CAS", "ISO", "45001",
+]
+
+
+class _BigramIndex:
+    """이전 구현 — 정규화 텍스트의 2-gram → 위치 목록, 가장 드문 2-gram 위치만 확인."""
+
+    def __init__(self, norm: str, page_starts: list[int]):
+        self.text = norm
+        self._page_starts = page_starts
+        self._grams: dict[str, list[int]] = {}
+        for i in range(len(norm) - 1):
+            self._grams.setdefault(norm[i:i + 2], []).append(i)
+        self._hits: dict[str, list[int]] = {}
+
+    def pages(self, keyword: str) -> list[int]:
+        kw = normalize(keyword)
+        hit = self._hits.get(kw)
+        if hit is None:
+            t, best_j, best = self.text, 0, None
+            for j in range(len(kw) - 1):
+                pos = self._grams.get(kw[j:j + 2])
+                if pos is None:
+                    best = []
+                    break
+                if best is None or len(pos) < len(best):
+                    best_j, best = j, pos
+            found = [p - best_j for p in best or [] if p >= best_j and t.startswith(kw, p - best_j)]
+            hit = self._hits[kw] = sorted({bisect.bisect_right(self._page_starts, p) for p in found})
+        return hit
+
+
+def _document(chars: int, rng: random.Random) -> tuple[str, list[int]]:
+    parts: list[str] = []
+    n = 0
+    while n < chars:
+        w = rng.choice(_WORDS) if rng.random() < 0.3 else "".join(
+            rng.choice("가나다라마바사아자차카타파하의을를이가에서") for _ in range(rng.randint(1, 5))
+        )
+        sep = rng.choice([" ", " ", "\n", ", "])
+        parts.append(w + sep)
+        n += len(w) + len(sep)
+    text = "".join(parts)[:chars]
+    step = max(len(text) // 20, 1)
+    return text, list(range(0, len(text), step))
+
+
+def _keywords(k: int, rng: random.Random) -> list[str]:
+    present = [f"{a} {b}" if rng.random() < 0.3 else a for a, b in zip(rng.sample(_WORDS * 4, k // 2), _WORDS * 4)]
+    absent = [f"없는키워드{i}" for i in range(k - len(present))]
+    return present + absent
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def _memory(build) -> float:
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size / 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--chars", type=int, nargs="+", default=[30_000, 500_000])
+    ap.add_argument("--keywords", type=int, default=60)
+    ap.add_argument("--passes", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    failed = False
+    print(f"{'chars':>8} {'scan ms':>9} {'bigram ms':>10} {'index ms':>9} {'bigram MB':>10} {'index MB':>9}  pages")
+    for chars in args.chars:
+        text, starts = _document(chars, rng)
+        kws = _keywords(args.keywords, rng)
+
+        def scan() -> None:
+            for _ in range(args.passes):
+                for k in kws:
+                    _ = normalize(k) in normalize(text)
+
+        def bigram() -> _BigramIndex:
+            norm = TextIndex(text, starts)
+            idx = _BigramIndex(norm.text, norm._page_starts)
+            for _ in range(args.passes):
+                for k in kws:
+                    idx.pages(k)
+            return idx
+
+        def index() -> TextIndex:
+            idx = TextIndex(text, starts)
+            for _ in range(args.passes):
+                for k in kws:
+                    idx.pages(k)
+            return idx
+
+        t_scan, t_bigram, t_index = _timed(scan), _timed(bigram), _timed(index)
+        ref, cur = bigram(), index()
+        diff = [k for k in kws if ref.pages(k) != cur.pages(k)]
+        for k in diff[:5]:
+            print(f"  MISMATCH {k!r} bigram={ref.pages(k)} index={cur.pages(k)}")
+        failed |= bool(diff)
+        print(
+            f"{chars:>8} {t_scan * 1000:>9.1f} {t_bigram * 1000:>10.1f} {t_index * 1000:>9.1f} "
+            f"{_memory(bigram):>10.1f} {_memory(index):>9.1f}  {'ok' if not diff else 'MISMATCH'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""파일명 → 슬롯 매처 — 컴파일 매처(단건/일괄)가 기존 점수 방식과 같은 슬롯/신뢰도를 내는지.
+
+    cd apps/ai_run_api && python -m pytest tests
+"""
+
+import pytest
+
+from benchmarks.filename_matcher import mismatches, parity_cases
+
+_CASES = parity_cases(n=2000, seed=0)
+
+
+@pytest.mark.parametrize("domain, mod, names, expected", _CASES, ids=[c[0] for c in _CASES])
+def test_matches_legacy(domain, mod, names, expected):
+    assert any(expected), f"{domain}: 생성한 파일명이 하나도 매칭되지 않음"
+    assert mismatches(mod, names, expected)[:5] == []
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_legacy_other_seeds(seed):
+    for domain, mod, names, expected in parity_cases(n=500, seed=seed):
+        assert mismatches(mod, names, expected)[:5] == [], domain
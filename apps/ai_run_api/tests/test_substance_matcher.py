@@ -0,0 +1,41 @@
+"""유해물질 목록 물질명 → 표기 변형 / MSDS 커버리지."""
+
+import pytest
+
+from app.engines.esg.substance_matcher import SubstanceMatcher, name_variants
+
+
+@pytest.mark.parametrize(
+    "name, expected, excluded",
+    [
+        ("질소 (액체)", {"질소"}, {"액체"}),
+        ("수산화나트륨 (NaOH, 고체)", {"수산화나트륨", "naoh"}, {"고체", "고체)", "수산화나트륨(naoh"}),
+        ("2,4-D", {"2,4-d"}, {"4d", "4-d", "2"}),
+        ("황산 (Sulfuric acid)", {"황산", "sulfuricacid"}, set()),
+        ("황산/H2SO4", {"황산", "h2so4"}, set()),
+        ("메탄올 (CAS 67-56-1)", {"메탄올"}, {"cas"}),
+        ("과산화수소(H2O2, 35%)", {"과산화수소", "h2o2"}, {"35"}),
+        ("n-헥산", {"n-헥산", "n헥산"}, set()),
+    ],
+)
+def test_name_variants(name, expected, excluded):
+    variants = set(name_variants(name))
+    assert expected <= variants
+    assert not variants & excluded
+
+
+def test_state_words_do_not_cover_other_substances():
+    names = ["톨루엔", "질소 (액체)", "수산화나트륨 (NaOH, 고체)", "2,4-D", "메탄올 (CAS 67-56-1)"]
+    msds = "물질안전보건자료 — 톨루엔 (Toluene). 성상: 액체, 고체 아님. 4-D 표기 없음."
+    cov = SubstanceMatcher(names).coverage([msds])
+    assert cov.covered() == {0}
+    assert cov.missing() == names[1:]
+
+
+def test_alias_and_cas_still_match():
+    names = ["수산화나트륨 (NaOH, 고체)", "메탄올"]
+    cov = SubstanceMatcher(names, cas=[None, "67-56-1"]).coverage(
+        ["MSDS: NaOH 50% solution", "CAS No. 67-56-1", "CAS 167-56-12"]
+    )
+    assert cov.documents_of(0) == [0]
+    assert cov.documents_of(1) == [1]